@@ -6,6 +6,7 @@ from typing import List, Dict, Optional, Tuple
 import logging
 
 from .models import BenchmarkComparison, PortfolioSnapshot
+from ..data.models import price_array
 from ..data.service import get_data_service
 
 logger = logging.getLogger(__name__)
@@ -188,16 +189,12 @@ class BenchmarkAnalyzer:
             if len(historical_prices) < 2:
                 return []
             
-            # Calculate returns
-            prices = [float(price.price) for price in historical_prices]
-            returns = []
+            # Calculate returns, skipping steps from a non-positive price
+            prices = price_array(historical_prices)
+            previous, current = prices[:-1], prices[1:]
+            valid = previous > 0
             
-            for i in range(1, len(prices)):
-                if prices[i-1] > 0:
-                    daily_return = (prices[i] - prices[i-1]) / prices[i-1]
-                    returns.append(daily_return)
-            
-            return returns
+            return ((current[valid] - previous[valid]) / previous[valid]).tolist()
             
         except Exception as e:
             logger.error(f"Failed to get benchmark returns for {benchmark_symbol}: {e}")
@@ -0,0 +1,72 @@
+"""PDF rendering for analytics reports.
+
+This module is imported lazily by the ``analytics report`` command and is run
+inside a worker process, so WeasyPrint is only loaded when a PDF is requested.
+"""
+
+import html
+from typing import Any, Dict
+
+
+def _render_section(title: str, values: Dict[str, Any]) -> str:
+    """Render a flat mapping as an HTML table section."""
+    rows = "".join(
+        f"<tr><th>{html.escape(str(key))}</th><td>{html.escape(str(value))}</td></tr>"
+        for key, value in values.items()
+    )
+    return f"<h2>{html.escape(title)}</h2><table>{rows}</table>"
+
+
+def render_report_html(report_data: Dict[str, Any]) -> str:
+    """Build the HTML document for an analytics report.
+
+    Args:
+        report_data: Report dictionary produced by the ``analytics report`` command
+
+    Returns:
+        HTML document string
+    """
+    sections = [_render_section("Portfolio Summary", report_data.get('portfolio_summary', {}))]
+
+    for period, metrics in report_data.get('performance_metrics', {}).items():
+        sections.append(_render_section(f"Performance ({period})", metrics))
+
+    for name in ('risk_metrics', 'allocation_metrics'):
+        flat = {
+            key: value for key, value in report_data.get(name, {}).items()
+            if not isinstance(value, (dict, list))
+        }
+        sections.append(_render_section(name.replace('_', ' ').title(), flat))
+
+    for comparison in report_data.get('benchmark_comparisons', []):
+        sections.append(
+            _render_section(f"Benchmark: {comparison.get('benchmark_name')}", comparison)
+        )
+
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        "<title>Portfolio Analytics Report</title>"
+        "<style>body{font-family:Arial,sans-serif;margin:24px}"
+        "table{border-collapse:collapse;margin-bottom:16px}"
+        "th,td{border:1px solid #ddd;padding:4px 8px;text-align:left}</style>"
+        "</head><body><h1>Portfolio Analytics Report</h1>"
+        f"<p>Generated at {html.escape(str(report_data.get('generated_at', '')))}</p>"
+        + "".join(sections)
+        + "</body></html>"
+    )
+
+
+def render_pdf(report_data: Dict[str, Any], output_file: str) -> str:
+    """Render an analytics report to a PDF file.
+
+    Args:
+        report_data: Report dictionary produced by the ``analytics report`` command
+        output_file: Destination PDF path
+
+    Returns:
+        Path to the written PDF
+    """
+    import weasyprint
+
+    weasyprint.HTML(string=render_report_html(report_data)).write_pdf(output_file)
+    return output_file
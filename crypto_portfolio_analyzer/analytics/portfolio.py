@@ -4,7 +4,7 @@ import asyncio
 import numpy as np
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple
 import logging
 
 from .models import (
@@ -28,11 +28,14 @@ class PortfolioAnalyzer:
         self.data_service = data_service
         self._price_cache = {}
     
-    async def create_portfolio_snapshot(self, holdings_data: List[Dict]) -> PortfolioSnapshot:
+    async def create_portfolio_snapshot(self, holdings_data: List[Dict],
+                                      cash_balance: Optional[Any] = None) -> PortfolioSnapshot:
         """Create current portfolio snapshot with live prices.
         
         Args:
             holdings_data: List of holdings with symbol, quantity, average_cost
+            cash_balance: Portfolio cash balance; falls back to a ``cash_balance``
+                key on the first holding when omitted
             
         Returns:
             PortfolioSnapshot with current market values
@@ -71,12 +74,15 @@ class PortfolioAnalyzer:
             total_value += holding.market_value
             total_cost += holding.cost_basis
         
+        if cash_balance is None:
+            cash_balance = holdings_data[0].get('cash_balance', 0) if holdings_data else 0
+        
         return PortfolioSnapshot(
             timestamp=datetime.now(timezone.utc),
             holdings=holdings,
             total_value=total_value,
             total_cost=total_cost,
-            cash_balance=Decimal(str(holdings_data[0].get('cash_balance', 0))) if holdings_data else Decimal("0")
+            cash_balance=Decimal(str(cash_balance))
         )
     
     async def calculate_performance_metrics(self, 
@@ -8,6 +8,7 @@ from scipy import stats
 import logging
 
 from .models import RiskMetrics, PortfolioSnapshot, PortfolioHolding
+from ..data.models import price_array
 from ..data.service import get_data_service
 
 logger = logging.getLogger(__name__)
@@ -170,7 +171,7 @@ class RiskAnalyzer:
                     )
                 
                 if len(historical_prices) > 1:
-                    prices = [float(price.price) for price in historical_prices]
+                    prices = price_array(historical_prices)
                     returns = np.diff(np.log(prices))  # Log returns
                     returns_data[symbol] = returns
                     
@@ -339,7 +340,7 @@ class RiskAnalyzer:
                     )
                 
                 if len(historical_prices) > 1:
-                    prices = [float(price.price) for price in historical_prices]
+                    prices = price_array(historical_prices)
                     returns = np.diff(np.log(prices))
                     volatility = float(np.std(returns) * np.sqrt(252))  # Annualized
                     volatilities[symbol] = volatility
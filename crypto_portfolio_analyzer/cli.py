@@ -6,7 +6,6 @@ for hierarchical commands, context inheritance, plugin discovery, and a hidden
 debug REPL command for development.
 """
 
-import asyncio
 import logging
 import sys
 from pathlib import Path
@@ -34,7 +33,7 @@ logger = logging.getLogger(__name__)
 
 
 # ContextAware classes moved to core.cli_base to avoid circular imports
-from .core.cli_base import ContextAwareGroup, ContextAwareCommand
+from .core.cli_base import ContextAwareGroup, ContextAwareCommand, run_async
 
 
 def setup_logging(debug: bool = False, verbose: bool = False) -> None:
@@ -161,7 +160,7 @@ def main(ctx: click.Context, debug: bool, verbose: bool, config: Optional[str],
     
     # Initialize application
     try:
-        asyncio.run(initialize_app(ctx))
+        run_async(initialize_app(ctx))
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
         sys.exit(1)
@@ -1,9 +1,12 @@
 """CLI commands for portfolio analytics and reporting."""
 
 import asyncio
+import functools
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import List, Dict, Mapping, Optional
 import click
 from rich.console import Console
 from rich.table import Table
@@ -12,23 +15,26 @@ from rich.panel import Panel
 from rich import box
 from decimal import Decimal
 
+# The analytics package pulls in pandas and scipy.stats; each command imports
+# the analyzers it uses so that CLI startup and --help don't pay for them.
+from ..core.cli_base import run_async
 from ..core.context import get_current_context
-from ..analytics.portfolio import PortfolioAnalyzer
-from ..analytics.risk import RiskAnalyzer
-from ..analytics.allocation import AllocationAnalyzer
-from ..analytics.benchmarks import BenchmarkAnalyzer
-from ..analytics.models import PerformancePeriod, PortfolioHolding
+from ..core.sample_portfolio import SAMPLE_PORTFOLIO
+from ..core.serialization import loads_json
 
 console = Console()
 
+# Bound ``str.format`` methods for the per-row cell formatting in the display
+# helpers below; cheaper than re-evaluating an f-string for every row.
+_PCT = "{:.2f}%".format
+_USD = "${:,.2f}".format
+
 
 def async_command(f):
     """Decorator to make Click commands async-compatible."""
-    import functools
-    
     @functools.wraps(f)
     def wrapper(*args, **kwargs):
-        return asyncio.run(f(*args, **kwargs))
+        return run_async(f(*args, **kwargs))
     return wrapper
 
 
@@ -65,6 +71,11 @@ async def performance(ctx, portfolio_file: Optional[str], output_format: str):
         if not portfolio_data:
             console.print("[red]No portfolio data provided. Use --portfolio-file or configure default portfolio.[/red]")
             return
+        holdings = portfolio_data['holdings']
+        cash = portfolio_data.get('cash_balance', 0)
+        
+        from ..analytics.models import PerformancePeriod
+        from ..analytics.portfolio import PortfolioAnalyzer
         
         analyzer = PortfolioAnalyzer()
         
@@ -76,7 +87,7 @@ async def performance(ctx, portfolio_file: Optional[str], output_format: str):
             task = progress.add_task("Analyzing portfolio performance...", total=None)
             
             # Create current snapshot
-            current_snapshot = await analyzer.create_portfolio_snapshot(portfolio_data['holdings'])
+            current_snapshot = await analyzer.create_portfolio_snapshot(holdings, cash)
             
             # Calculate performance for different periods
             periods = [PerformancePeriod.DAY_1, PerformancePeriod.DAYS_7, 
@@ -132,6 +143,8 @@ async def risk(ctx, portfolio_file: Optional[str], output_format: str):
             console.print("[red]No portfolio data provided.[/red]")
             return
         
+        from ..analytics.risk import RiskAnalyzer
+        
         risk_analyzer = RiskAnalyzer()
         
         with Progress(
@@ -188,12 +201,17 @@ async def allocation(ctx, portfolio_file: Optional[str], target_file: Optional[s
         if not portfolio_data:
             console.print("[red]No portfolio data provided.[/red]")
             return
+        holdings = portfolio_data['holdings']
+        cash = portfolio_data.get('cash_balance', 0)
         
         # Load target allocations if provided
         target_allocations = None
         if target_file:
             target_allocations = _load_target_allocations(target_file)
         
+        from ..analytics.allocation import AllocationAnalyzer
+        from ..analytics.portfolio import PortfolioAnalyzer
+        
         portfolio_analyzer = PortfolioAnalyzer()
         allocation_analyzer = AllocationAnalyzer()
         
@@ -205,7 +223,7 @@ async def allocation(ctx, portfolio_file: Optional[str], target_file: Optional[s
             task = progress.add_task("Analyzing asset allocation...", total=None)
             
             # Create current snapshot
-            current_snapshot = await portfolio_analyzer.create_portfolio_snapshot(portfolio_data['holdings'])
+            current_snapshot = await portfolio_analyzer.create_portfolio_snapshot(holdings, cash)
             
             # Analyze allocation
             allocation_metrics = allocation_analyzer.analyze_allocation(
@@ -257,6 +275,8 @@ async def benchmark(ctx, portfolio_file: Optional[str], benchmark: str, period:
             console.print("[red]No portfolio data provided.[/red]")
             return
         
+        from ..analytics.benchmarks import BenchmarkAnalyzer
+        
         benchmark_analyzer = BenchmarkAnalyzer()
         
         with Progress(
@@ -315,6 +335,14 @@ async def report(ctx, portfolio_file: Optional[str], output_file: Optional[str],
         if not portfolio_data:
             console.print("[red]No portfolio data provided.[/red]")
             return
+        holdings = portfolio_data['holdings']
+        cash = portfolio_data.get('cash_balance', 0)
+        
+        from ..analytics.allocation import AllocationAnalyzer
+        from ..analytics.benchmarks import BenchmarkAnalyzer
+        from ..analytics.models import PerformancePeriod
+        from ..analytics.portfolio import PortfolioAnalyzer
+        from ..analytics.risk import RiskAnalyzer
         
         with Progress(
             SpinnerColumn(),
@@ -330,7 +358,7 @@ async def report(ctx, portfolio_file: Optional[str], output_file: Optional[str],
             benchmark_analyzer = BenchmarkAnalyzer()
             
             # Create current snapshot
-            current_snapshot = await portfolio_analyzer.create_portfolio_snapshot(portfolio_data['holdings'])
+            current_snapshot = await portfolio_analyzer.create_portfolio_snapshot(holdings, cash)
             
             # Calculate all metrics (simplified for demo)
             historical_snapshots = []  # Load from database in real implementation
@@ -364,6 +392,7 @@ async def report(ctx, portfolio_file: Optional[str], output_file: Optional[str],
                 'total_cost': float(current_snapshot.total_cost),
                 'unrealized_pnl': float(current_snapshot.total_unrealized_pnl),
                 'unrealized_pnl_percentage': current_snapshot.total_unrealized_pnl_percentage,
+                'cash_balance': float(current_snapshot.cash_balance),
                 'holdings_count': len(current_snapshot.holdings)
             },
             'performance_metrics': {
@@ -393,7 +422,14 @@ async def report(ctx, portfolio_file: Optional[str], output_file: Optional[str],
                     json.dump(report_data, f, indent=2)
                 console.print(f"[green]Report saved to {output_file}[/green]")
             else:  # PDF
-                console.print("[yellow]PDF report generation not yet implemented[/yellow]")
+                from ..analytics.pdf import render_pdf
+                
+                # Render in a one-shot worker process so WeasyPrint never blocks
+                # the event loop and its memory is released once the PDF is written
+                loop = asyncio.get_running_loop()
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    await loop.run_in_executor(pool, render_pdf, report_data, output_file)
+                console.print(f"[green]PDF report saved to {output_file}[/green]")
         else:
             console.print(json.dumps(report_data, indent=2))
             
@@ -403,32 +439,23 @@ async def report(ctx, portfolio_file: Optional[str], output_file: Optional[str],
             console.print_exception()
 
 
-def _load_portfolio_data(portfolio_file: Optional[str]) -> Optional[Dict]:
+def _load_portfolio_data(portfolio_file: Optional[str]) -> Optional[Mapping]:
     """Load portfolio data from file or return sample data."""
     if portfolio_file:
         try:
-            with open(portfolio_file, 'r') as f:
-                return json.load(f)
+            return loads_json(Path(portfolio_file).read_bytes())
         except Exception as e:
             console.print(f"[red]Error loading portfolio file: {e}[/red]")
             return None
     else:
         # Return sample portfolio data for demo
-        return {
-            'holdings': [
-                {'symbol': 'BTC', 'quantity': 0.5, 'average_cost': 45000},
-                {'symbol': 'ETH', 'quantity': 2.0, 'average_cost': 3000},
-                {'symbol': 'ADA', 'quantity': 1000, 'average_cost': 1.2}
-            ],
-            'cash_balance': 5000
-        }
+        return SAMPLE_PORTFOLIO
 
 
 def _load_target_allocations(target_file: str) -> Optional[Dict[str, float]]:
     """Load target allocations from file."""
     try:
-        with open(target_file, 'r') as f:
-            return json.load(f)
+        return loads_json(Path(target_file).read_bytes())
     except Exception as e:
         console.print(f"[red]Error loading target allocations: {e}[/red]")
         return None
@@ -441,10 +468,10 @@ def _display_performance_table(snapshot, performance_metrics):
     summary_table.add_column("Metric", style="cyan")
     summary_table.add_column("Value", style="green")
     
-    summary_table.add_row("Total Value", f"${snapshot.total_value:,.2f}")
-    summary_table.add_row("Total Cost", f"${snapshot.total_cost:,.2f}")
-    summary_table.add_row("Unrealized P&L", f"${snapshot.total_unrealized_pnl:,.2f}")
-    summary_table.add_row("Unrealized P&L %", f"{snapshot.total_unrealized_pnl_percentage:.2f}%")
+    summary_table.add_row("Total Value", _USD(snapshot.total_value))
+    summary_table.add_row("Total Cost", _USD(snapshot.total_cost))
+    summary_table.add_row("Unrealized P&L", _USD(snapshot.total_unrealized_pnl))
+    summary_table.add_row("Unrealized P&L %", _PCT(snapshot.total_unrealized_pnl_percentage))
     summary_table.add_row("Holdings Count", str(len(snapshot.holdings)))
     
     console.print(summary_table)
@@ -460,9 +487,9 @@ def _display_performance_table(snapshot, performance_metrics):
     for period, metrics in performance_metrics.items():
         perf_table.add_row(
             period.value,
-            f"{metrics.total_return_percentage:.2f}%",
-            f"{metrics.annualized_return:.2f}%",
-            f"{metrics.volatility:.2f}%",
+            _PCT(metrics.total_return_percentage),
+            _PCT(metrics.annualized_return),
+            _PCT(metrics.volatility),
             f"{metrics.sharpe_ratio:.2f}" if metrics.sharpe_ratio else "N/A"
         )
     
@@ -497,12 +524,12 @@ def _display_risk_table(risk_metrics):
     table.add_column("Value", style="yellow")
     
     table.add_row("Daily Volatility", f"{risk_metrics.volatility_daily:.4f}")
-    table.add_row("Annualized Volatility", f"{risk_metrics.volatility_annualized:.2f}%")
+    table.add_row("Annualized Volatility", _PCT(risk_metrics.volatility_annualized))
     table.add_row("VaR 95% (Daily)", f"{risk_metrics.var_95_daily:.4f}")
     table.add_row("VaR 99% (Daily)", f"{risk_metrics.var_99_daily:.4f}")
     table.add_row("Sharpe Ratio", f"{risk_metrics.sharpe_ratio:.2f}")
     table.add_row("Sortino Ratio", f"{risk_metrics.sortino_ratio:.2f}")
-    table.add_row("Max Drawdown", f"{risk_metrics.max_drawdown:.2f}%")
+    table.add_row("Max Drawdown", _PCT(risk_metrics.max_drawdown))
     
     console.print(table)
 
@@ -519,8 +546,9 @@ def _display_allocation_table(allocation_metrics):
     alloc_table.add_column("Asset", style="cyan")
     alloc_table.add_column("Allocation %", style="green")
     
-    for symbol, allocation in allocation_metrics.allocations.items():
-        alloc_table.add_row(symbol, f"{allocation:.2f}%")
+    allocations = allocation_metrics.allocations
+    for symbol, formatted in zip(allocations, map(_PCT, allocations.values())):
+        alloc_table.add_row(symbol, formatted)
     
     console.print(alloc_table)
     
@@ -532,7 +560,7 @@ def _display_allocation_table(allocation_metrics):
     div_table.add_row("Concentration Risk", f"{allocation_metrics.concentration_risk:.2f}")
     div_table.add_row("Diversification Ratio", f"{allocation_metrics.diversification_ratio:.2f}")
     div_table.add_row("Effective Assets", f"{allocation_metrics.effective_assets:.2f}")
-    div_table.add_row("Largest Position", f"{allocation_metrics.largest_position:.2f}%")
+    div_table.add_row("Largest Position", _PCT(allocation_metrics.largest_position))
     
     console.print(div_table)
 
@@ -548,14 +576,14 @@ def _display_benchmark_table(comparison):
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green")
     
-    table.add_row("Portfolio Return", f"{comparison.portfolio_return:.2f}%")
-    table.add_row("Benchmark Return", f"{comparison.benchmark_return:.2f}%")
-    table.add_row("Outperformance", f"{comparison.outperformance:.2f}%")
-    table.add_row("Alpha", f"{comparison.alpha:.2f}%")
+    table.add_row("Portfolio Return", _PCT(comparison.portfolio_return))
+    table.add_row("Benchmark Return", _PCT(comparison.benchmark_return))
+    table.add_row("Outperformance", _PCT(comparison.outperformance))
+    table.add_row("Alpha", _PCT(comparison.alpha))
     table.add_row("Beta", f"{comparison.beta:.2f}")
     table.add_row("Correlation", f"{comparison.correlation:.2f}")
-    table.add_row("Up Capture", f"{comparison.up_capture:.2f}%")
-    table.add_row("Down Capture", f"{comparison.down_capture:.2f}%")
+    table.add_row("Up Capture", _PCT(comparison.up_capture))
+    table.add_row("Down Capture", _PCT(comparison.down_capture))
     
     console.print(table)
 
@@ -8,15 +8,27 @@ viewing current settings, updating configuration values, and managing secrets.
 import click
 from rich.console import Console
 from rich.table import Table
-from rich.syntax import Syntax
-import yaml
-import json
 
-from crypto_portfolio_analyzer.core.cli_base import ContextAwareGroup, ContextAwareCommand
+from crypto_portfolio_analyzer.core.cli_base import ContextAwareGroup, ContextAwareCommand, run_async
 from crypto_portfolio_analyzer.core.context import get_current_context
 
 console = Console()
 
+# Top-level sections every configuration must define
+_REQUIRED_SECTIONS = frozenset(('app', 'logging', 'plugins'))
+
+_LOG_LEVELS = frozenset(('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'))
+
+_TRUE_VALUES = frozenset(('true', '1', 'yes', 'on'))
+
+# Converters for the ``config set --type`` choices
+_CONVERTERS = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': lambda value: value.lower() in _TRUE_VALUES,
+}
+
 
 @click.group(cls=ContextAwareGroup, name='config')
 def config_group() -> None:
@@ -47,9 +59,14 @@ def show_config(key: str = None, output_format: str = 'yaml') -> None:
         console.print(f"[bold]{key}:[/bold]")
         
         if output_format == 'json':
-            console.print(json.dumps(value, indent=2))
+            console.print_json(data=value, default=str)
         elif output_format == 'yaml':
-            console.print(yaml.dump({key: value}, default_flow_style=False))
+            if isinstance(value, _YAML_SCALARS):
+                # Booleans, null and integers need no YAML emitter; strings
+                # and floats may need quoting, so they go through PyYAML
+                console.print(f"{key}: {_yaml_scalar(value)}")
+            else:
+                console.print(_dump_yaml({key: value}))
         else:
             console.print(str(value))
     
@@ -60,13 +77,39 @@ def show_config(key: str = None, output_format: str = 'yaml') -> None:
         if output_format == 'table':
             _show_config_table(config)
         elif output_format == 'json':
-            syntax = Syntax(json.dumps(config, indent=2), "json", theme="monokai", line_numbers=True)
-            console.print(syntax)
+            # Rich serializes and highlights in one pass, no Syntax lexer needed
+            console.print_json(data=config, default=str)
         else:  # yaml
-            syntax = Syntax(yaml.dump(config, default_flow_style=False), "yaml", theme="monokai", line_numbers=True)
+            from rich.syntax import Syntax
+            
+            syntax = Syntax(_dump_yaml(config), "yaml", theme="monokai", line_numbers=True)
             console.print(syntax)
 
 
+_YAML_SCALARS = (bool, int, type(None))
+
+
+def _yaml_scalar(value) -> str:
+    """Render a bool, None or int the way PyYAML writes it."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _dump_yaml(data) -> str:
+    """Dump data as block-style YAML, importing PyYAML only when needed."""
+    import yaml
+    
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+    
+    return yaml.dump(data, Dumper=Dumper, default_flow_style=False)
+
+
 def _show_config_table(config: dict, prefix: str = "") -> None:
     """Show configuration in table format."""
     table = Table(title="Configuration")
@@ -74,23 +117,32 @@ def _show_config_table(config: dict, prefix: str = "") -> None:
     table.add_column("Value", style="magenta")
     table.add_column("Type", style="yellow")
     
-    def add_config_rows(data: dict, current_prefix: str = ""):
-        for key, value in data.items():
-            full_key = f"{current_prefix}.{key}" if current_prefix else key
+    add_row = table.add_row
+    
+    # Walk the nested sections with an explicit stack of item iterators so
+    # rows come out in the same depth-first order without recursion. Key
+    # paths are kept as tuples and only joined when a row is emitted.
+    stack = [(tuple(prefix.split('.')) if prefix else (), iter(config.items()))]
+    while stack:
+        path, items = stack[-1]
+        for key, value in items:
+            key_path = path + (key,)
+            full_key = '.'.join(map(str, key_path))
             
             if isinstance(value, dict):
-                # Add section header
-                table.add_row(f"[bold]{full_key}[/bold]", "[dim]<section>[/dim]", "dict")
-                add_config_rows(value, full_key)
-            else:
-                # Add value row
-                value_str = str(value)
-                if len(value_str) > 50:
-                    value_str = value_str[:47] + "..."
-                
-                table.add_row(full_key, value_str, type(value).__name__)
-    
-    add_config_rows(config)
+                # Add section header, then descend into the section
+                add_row(f"[bold]{full_key}[/bold]", "[dim]<section>[/dim]", "dict")
+                stack.append((key_path, iter(value.items())))
+                break
+            
+            # Add value row
+            value_str = str(value)
+            if len(value_str) > 50:
+                value_str = value_str[:47] + "..."
+            
+            add_row(full_key, value_str, type(value).__name__)
+        else:
+            stack.pop()
     console.print(table)
 
 
@@ -110,14 +162,7 @@ def set_config(key: str, value: str, value_type: str) -> None:
     
     # Convert value to appropriate type
     try:
-        if value_type == 'int':
-            converted_value = int(value)
-        elif value_type == 'float':
-            converted_value = float(value)
-        elif value_type == 'bool':
-            converted_value = value.lower() in ('true', '1', 'yes', 'on')
-        else:
-            converted_value = value
+        converted_value = _CONVERTERS[value_type](value)
         
         if app_ctx.dry_run:
             console.print(f"[yellow]DRY RUN:[/yellow] Would set {key} = {converted_value} ({value_type})")
@@ -155,7 +200,11 @@ def get_config(key: str) -> None:
 @click.option('--get', 'get_secret', help='Get a secret value')
 @click.option('--delete', 'delete_secret', help='Delete a secret')
 def manage_secrets(list_secrets: bool, set_secret: tuple, get_secret: str, delete_secret: str) -> None:
-    """Manage encrypted secrets."""
+    """Manage encrypted secrets.
+    
+    Several actions can be combined in one invocation; they run in the
+    order list, set, get, delete on a single event loop.
+    """
     app_ctx = get_current_context()
     config_manager = app_ctx.plugins.get('config_manager')
     
@@ -163,52 +212,70 @@ def manage_secrets(list_secrets: bool, set_secret: tuple, get_secret: str, delet
         console.print("[red]Configuration manager not available[/red]")
         return
     
-    import asyncio
-    
-    async def _manage_secrets():
-        if list_secrets:
-            # List secrets (keys only, not values)
-            secrets = await config_manager._secret_manager.load_secrets()
-            if not secrets:
-                console.print("[yellow]No secrets configured[/yellow]")
-                return
-            
-            console.print("[bold]Available Secrets:[/bold]")
-            for key in secrets.keys():
-                console.print(f"  • {key}")
+    async def _do_list():
+        # Secret names only; values are never decrypted for a listing
+        keys = await config_manager.list_secret_keys()
+        if not keys:
+            console.print("[yellow]No secrets configured[/yellow]")
+            return
         
-        elif set_secret:
-            key, value = set_secret
-            if app_ctx.dry_run:
-                console.print(f"[yellow]DRY RUN:[/yellow] Would set secret '{key}'")
-                return
-            
-            await config_manager.set_secret(key, value)
-            console.print(f"[green]✓[/green] Secret '{key}' set successfully")
+        console.print("[bold]Available Secrets:[/bold]")
+        for key in keys:
+            console.print(f"  • {key}")
+    
+    async def _do_set():
+        key, value = set_secret
+        if app_ctx.dry_run:
+            console.print(f"[yellow]DRY RUN:[/yellow] Would set secret '{key}'")
+            return
         
-        elif get_secret:
-            value = await config_manager.get_secret(get_secret)
-            if value is None:
-                console.print(f"[red]Secret '{get_secret}' not found[/red]")
-                return
-            
-            console.print(f"[bold]{get_secret}:[/bold] {value}")
+        await config_manager.set_secret(key, value)
+        console.print(f"[green]✓[/green] Secret '{key}' set successfully")
+    
+    async def _do_get():
+        value = await config_manager.get_secret(get_secret)
+        if value is None:
+            console.print(f"[red]Secret '{get_secret}' not found[/red]")
+            return
         
-        elif delete_secret:
-            if app_ctx.dry_run:
-                console.print(f"[yellow]DRY RUN:[/yellow] Would delete secret '{delete_secret}'")
-                return
-            
-            success = await config_manager._secret_manager.delete_secret(delete_secret)
-            if success:
-                console.print(f"[green]✓[/green] Secret '{delete_secret}' deleted")
-            else:
-                console.print(f"[red]Secret '{delete_secret}' not found[/red]")
+        console.print(f"[bold]{get_secret}:[/bold] {value}")
+    
+    async def _do_delete():
+        if app_ctx.dry_run:
+            console.print(f"[yellow]DRY RUN:[/yellow] Would delete secret '{delete_secret}'")
+            return
         
+        success = await config_manager._secret_manager.delete_secret(delete_secret)
+        if success:
+            console.print(f"[green]✓[/green] Secret '{delete_secret}' deleted")
         else:
-            console.print("[yellow]Please specify an action: --list, --set, --get, or --delete[/yellow]")
+            console.print(f"[red]Secret '{delete_secret}' not found[/red]")
+    
+    handlers = {
+        'list': _do_list,
+        'set': _do_set,
+        'get': _do_get,
+        'delete': _do_delete,
+    }
+    selected = (
+        ('list', list_secrets),
+        ('set', set_secret),
+        ('get', get_secret),
+        ('delete', delete_secret),
+    )
+    pending = [handlers[name] for name, value in selected if value]
+    
+    if not pending:
+        console.print("[yellow]Please specify an action: --list, --set, --get, or --delete[/yellow]")
+        return
+    
+    async def _run_actions():
+        # Every action reads and rewrites the same encrypted file, so they run
+        # one after another rather than concurrently
+        for handler in pending:
+            await handler()
     
-    asyncio.run(_manage_secrets())
+    run_async(_run_actions())
 
 
 @config_group.command(cls=ContextAwareCommand, name='validate')
@@ -229,10 +296,8 @@ def validate_config() -> None:
     config = config_manager.get_all()
     
     # Check required sections
-    required_sections = ['app', 'logging', 'plugins']
-    for section in required_sections:
-        if section not in config:
-            issues.append(f"Missing required section: {section}")
+    missing_sections = _REQUIRED_SECTIONS - config.keys()
+    issues.extend(f"Missing required section: {section}" for section in sorted(missing_sections))
     
     # Check logging configuration
     if 'logging' in config:
@@ -240,8 +305,7 @@ def validate_config() -> None:
         if 'level' not in log_config:
             issues.append("Missing logging.level configuration")
         
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if log_config.get('level') not in valid_levels:
+        if log_config.get('level') not in _LOG_LEVELS:
             issues.append(f"Invalid logging level: {log_config.get('level')}")
     
     # Check plugin configuration
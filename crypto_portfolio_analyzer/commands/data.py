@@ -1,19 +1,70 @@
 """CLI commands for cryptocurrency data operations."""
 
-import asyncio
+import sys
+from contextlib import contextmanager
+from operator import attrgetter
 from datetime import datetime, timedelta
+from decimal import Decimal
 from typing import List, Optional
 import click
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.style import Style
+from rich.text import Text
 from rich import box
 
+from ..core.cli_base import run_async
 from ..core.context import get_current_context
-from ..data.service import get_data_service
+from ..core.serialization import dumps_json
 
 console = Console()
 
+# Number of rows shown by the historical table view
+_HISTORICAL_TABLE_ROWS = 20
+
+_PRICE_FORMAT = "${:,.8f}".format
+
+
+# Prebuilt styles for table cells; Text cells skip Rich's markup parser
+_GREEN = Style(color="green")
+_RED = Style(color="red")
+_HEALTHY = Text("✓ Healthy", style=_GREEN)
+_UNHEALTHY = Text("✗ Unhealthy", style=_RED)
+
+
+def _decimal_text(value) -> str:
+    """Write a Decimal for CSV output at full precision, never in exponent form."""
+    if isinstance(value, Decimal):
+        return format(value, 'f')
+    return str(value)
+
+
+def _format_price(value) -> str:
+    """Format a price with up to 8 decimals, dropping trailing zeros."""
+    return _PRICE_FORMAT(value).rstrip('0').rstrip('.')
+
+
+@contextmanager
+def _spinner(description: str):
+    """Show a progress spinner while the block runs.
+    
+    The live display (and its refresh thread) is skipped entirely when
+    output is not going to a terminal, e.g. when piped or redirected.
+    """
+    if not console.is_terminal:
+        yield
+        return
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        task = progress.add_task(description, total=None)
+        yield
+        progress.update(task, completed=True)
+
 
 def async_command(f):
     """Decorator to make Click commands async-compatible."""
@@ -21,7 +72,7 @@ def async_command(f):
 
     @functools.wraps(f)
     def wrapper(*args, **kwargs):
-        return asyncio.run(f(*args, **kwargs))
+        return run_async(f(*args, **kwargs))
     return wrapper
 
 
@@ -55,22 +106,18 @@ async def price(ctx, symbols: tuple, currency: str, no_cache: bool, output_forma
         return
     
     try:
+        # Imported here: the data layer pulls in aiohttp and pandas, which CLI
+        # startup and --help don't need
+        from ..data.service import get_data_service
+        
         data_service = await get_data_service()
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task(f"Fetching prices for {len(symbols)} symbols...", total=None)
-            
+        with _spinner(f"Fetching prices for {len(symbols)} symbols..."):
             prices = await data_service.get_multiple_prices(
                 list(symbols), 
                 currency=currency, 
                 use_cache=not no_cache
             )
-            
-            progress.update(task, completed=True)
         
         if not prices:
             console.print("[red]No price data found for the specified symbols[/red]")
@@ -130,15 +177,11 @@ async def historical(ctx, symbol: str, days: int, start_date: Optional[datetime]
         return
     
     try:
+        from ..data.service import get_data_service
+        
         data_service = await get_data_service()
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task(f"Fetching historical data for {symbol}...", total=None)
-            
+        with _spinner(f"Fetching historical data for {symbol}..."):
             historical_prices = await data_service.get_historical_prices(
                 symbol, 
                 start_date, 
@@ -146,8 +189,6 @@ async def historical(ctx, symbol: str, days: int, start_date: Optional[datetime]
                 currency=currency, 
                 use_cache=not no_cache
             )
-            
-            progress.update(task, completed=True)
         
         if not historical_prices:
             console.print(f"[red]No historical data found for {symbol}[/red]")
@@ -189,44 +230,30 @@ async def refresh(ctx, symbols: tuple, currency: str):
         return
     
     try:
+        from ..data.service import get_data_service
+        
         data_service = await get_data_service()
         
         if symbols:
             # Refresh specific symbols
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task(f"Refreshing data for {len(symbols)} symbols...", total=None)
-                
+            with _spinner(f"Refreshing data for {len(symbols)} symbols..."):
                 results = await data_service.refresh_price_data(list(symbols), currency)
-                
-                progress.update(task, completed=True)
             
             # Display results
             table = Table(title="Refresh Results", box=box.ROUNDED)
             table.add_column("Symbol", style="cyan")
             table.add_column("Status", style="green")
             
+            success_text = Text("✓ Success", style=_GREEN)
+            failed_text = Text("✗ Failed", style=_RED)
             for symbol, success in results.items():
-                status = "✓ Success" if success else "✗ Failed"
-                style = "green" if success else "red"
-                table.add_row(symbol, f"[{style}]{status}[/{style}]")
+                table.add_row(symbol, success_text if success else failed_text)
             
             console.print(table)
         else:
             # Clear all cache
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Clearing all cached data...", total=None)
-                
+            with _spinner("Clearing all cached data..."):
                 cleared_count = await data_service.clear_cache()
-                
-                progress.update(task, completed=True)
             
             console.print(f"[green]Cleared {cleared_count} cached entries[/green]")
             
@@ -244,20 +271,14 @@ async def status(ctx):
     app_ctx = get_current_context()
     
     try:
+        from ..data.service import get_data_service
+        
         data_service = await get_data_service()
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Checking service status...", total=None)
-            
+        with _spinner("Checking service status..."):
             # Get health check and cache stats
             health = await data_service.health_check()
             cache_stats = await data_service.get_cache_stats()
-            
-            progress.update(task, completed=True)
         
         # Display health status
         health_table = Table(title="Service Health", box=box.ROUNDED)
@@ -265,20 +286,14 @@ async def status(ctx):
         health_table.add_column("Status", style="green")
         
         # Database status
-        db_status = "✓ Healthy" if health.get('database') else "✗ Unhealthy"
-        db_style = "green" if health.get('database') else "red"
-        health_table.add_row("Database", f"[{db_style}]{db_status}[/{db_style}]")
+        health_table.add_row("Database", _HEALTHY if health.get('database') else _UNHEALTHY)
         
         # Cache status
-        cache_status = "✓ Healthy" if health.get('cache') else "✗ Unhealthy"
-        cache_style = "green" if health.get('cache') else "red"
-        health_table.add_row("Cache", f"[{cache_style}]{cache_status}[/{cache_style}]")
+        health_table.add_row("Cache", _HEALTHY if health.get('cache') else _UNHEALTHY)
         
         # API clients status
         for client_name, client_healthy in health.get('api_clients', {}).items():
-            client_status = "✓ Healthy" if client_healthy else "✗ Unhealthy"
-            client_style = "green" if client_healthy else "red"
-            health_table.add_row(f"API ({client_name})", f"[{client_style}]{client_status}[/{client_style}]")
+            health_table.add_row(f"API ({client_name})", _HEALTHY if client_healthy else _UNHEALTHY)
         
         console.print(health_table)
         
@@ -318,8 +333,7 @@ def _display_prices_table(prices, currency: str):
         # Format price change
         change_24h = price.price_change_percentage_24h
         if change_24h is not None:
-            change_color = "green" if change_24h >= 0 else "red"
-            change_text = f"[{change_color}]{change_24h:+.2f}%[/{change_color}]"
+            change_text = Text(f"{change_24h:+.2f}%", style=_GREEN if change_24h >= 0 else _RED)
         else:
             change_text = "N/A"
         
@@ -335,7 +349,7 @@ def _display_prices_table(prices, currency: str):
         table.add_row(
             price.symbol,
             price.name,
-            f"${price.current_price:,.8f}".rstrip('0').rstrip('.'),
+            _format_price(price.current_price),
             change_text,
             market_cap,
             volume,
@@ -347,37 +361,45 @@ def _display_prices_table(prices, currency: str):
 
 def _display_prices_json(prices):
     """Display prices in JSON format."""
-    import json
     price_data = [price.to_dict() for price in prices]
-    console.print(json.dumps(price_data, indent=2, default=str))
+    console.print(dumps_json(price_data))
 
 
 def _display_prices_csv(prices):
     """Display prices in CSV format."""
     import csv
-    import io
     
-    output = io.StringIO()
-    writer = csv.writer(output)
+    # Write straight to stdout; CSV needs no Rich markup processing
+    writer = csv.writer(sys.stdout)
     
     # Write header
     writer.writerow(['Symbol', 'Name', 'Price', 'Currency', 'Market Cap', 'Volume 24h', 
                      'Price Change 24h %', 'Last Updated'])
     
     # Write data
-    for price in prices:
-        writer.writerow([
-            price.symbol,
-            price.name,
-            float(price.current_price),
-            price.currency,
-            float(price.market_cap) if price.market_cap else '',
-            float(price.volume_24h) if price.volume_24h else '',
-            price.price_change_percentage_24h or '',
-            price.last_updated.isoformat()
-        ])
-    
-    console.print(output.getvalue())
+    writer.writerows(map(_price_csv_row, map(_PRICE_CSV_FIELDS, prices)))
+
+
+# Fetches every CSV column of a current price in one C-level call
+_PRICE_CSV_FIELDS = attrgetter(
+    'symbol', 'name', 'current_price', 'currency', 'market_cap',
+    'volume_24h', 'price_change_percentage_24h', 'last_updated'
+)
+
+
+def _price_csv_row(fields: tuple) -> tuple:
+    """Convert the fields fetched by ``_PRICE_CSV_FIELDS`` into a CSV row."""
+    symbol, name, current_price, currency, market_cap, volume_24h, change_24h, last_updated = fields
+    return (
+        symbol,
+        name,
+        _decimal_text(current_price),
+        currency,
+        _decimal_text(market_cap) if market_cap else '',
+        _decimal_text(volume_24h) if volume_24h else '',
+        change_24h or '',
+        last_updated.isoformat()
+    )
 
 
 def _display_historical_table(historical_prices, symbol: str, currency: str):
@@ -390,7 +412,7 @@ def _display_historical_table(historical_prices, symbol: str, currency: str):
     table.add_column("Market Cap", style="blue", justify="right")
     
     # Show last 20 entries for table display
-    display_prices = historical_prices[-20:] if len(historical_prices) > 20 else historical_prices
+    display_prices = historical_prices[-_HISTORICAL_TABLE_ROWS:]
     
     for price in display_prices:
         volume = f"${price.volume:,.0f}" if price.volume else "N/A"
@@ -399,44 +421,43 @@ def _display_historical_table(historical_prices, symbol: str, currency: str):
         table.add_row(
             price.timestamp.strftime("%Y-%m-%d"),
             price.timestamp.strftime("%H:%M:%S"),
-            f"${price.price:,.8f}".rstrip('0').rstrip('.'),
+            _format_price(price.price),
             volume,
             market_cap
         )
     
-    if len(historical_prices) > 20:
-        console.print(f"[dim]Showing last 20 of {len(historical_prices)} records[/dim]")
+    if len(historical_prices) > _HISTORICAL_TABLE_ROWS:
+        console.print(f"[dim]Showing last {_HISTORICAL_TABLE_ROWS} of {len(historical_prices)} records[/dim]")
     
     console.print(table)
 
 
 def _display_historical_json(historical_prices):
     """Display historical prices in JSON format."""
-    import json
-    price_data = [price.__dict__ for price in historical_prices]
-    console.print(json.dumps(price_data, indent=2, default=str))
+    # HistoricalPrice is a dataclass, which orjson encodes natively without
+    # building an intermediate dict per record
+    console.print(dumps_json(list(historical_prices)))
 
 
 def _display_historical_csv(historical_prices):
     """Display historical prices in CSV format."""
     import csv
-    import io
     
-    output = io.StringIO()
-    writer = csv.writer(output)
+    # Stream rows to stdout instead of buffering the whole export
+    writer = csv.writer(sys.stdout)
     
     # Write header
     writer.writerow(['Symbol', 'Timestamp', 'Price', 'Currency', 'Volume', 'Market Cap'])
     
     # Write data
-    for price in historical_prices:
-        writer.writerow([
+    writer.writerows(
+        (
             price.symbol,
             price.timestamp.isoformat(),
-            float(price.price),
+            _decimal_text(price.price),
             price.currency,
-            float(price.volume) if price.volume else '',
-            float(price.market_cap) if price.market_cap else ''
-        ])
-    
-    console.print(output.getvalue())
+            _decimal_text(price.volume) if price.volume else '',
+            _decimal_text(price.market_cap) if price.market_cap else ''
+        )
+        for price in historical_prices
+    )
@@ -5,15 +5,45 @@ This module provides commands for managing cryptocurrency portfolios including
 adding/removing holdings, viewing portfolio status, and basic analytics.
 """
 
+import sys
+
 import click
 from rich.console import Console
-from rich.table import Table
+from rich.table import Column, Table
 
 from crypto_portfolio_analyzer.core.cli_base import ContextAwareGroup, ContextAwareCommand
 from crypto_portfolio_analyzer.core.context import get_current_context
+from crypto_portfolio_analyzer.core.serialization import dumps_json
 
 console = Console()
 
+# Column prototypes for the holdings tables; each table gets fresh copies
+_STATUS_COLUMNS = (
+    Column("Symbol", style="cyan", no_wrap=True),
+    Column("Amount", style="magenta"),
+    Column("Value (USD)", style="green"),
+    Column("24h Change", style="yellow"),
+)
+_LIST_COLUMNS = (
+    Column("Symbol", style="cyan"),
+    Column("Amount", style="magenta"),
+    Column("Value (USD)", style="green"),
+    Column("24h Change (%)", style="yellow"),
+)
+
+# Sample holdings data, built once; in a real implementation this would come
+# from the portfolio manager
+_SAMPLE_HOLDINGS = (
+    {"symbol": "BTC", "amount": 0.5, "value": 15000, "change_24h": 2.5},
+    {"symbol": "ETH", "amount": 2.0, "value": 3200, "change_24h": -1.2},
+    {"symbol": "ADA", "amount": 1000, "value": 450, "change_24h": 5.8},
+)
+
+_HOLDINGS_CSV_HEADER = "symbol,amount,value,change_24h"
+
+# (color, sign) for a 24h change, indexed by ``change >= 0``
+_CHANGE_STYLE = (("red", ""), ("green", "+"))
+
 
 @click.group(cls=ContextAwareGroup, name='portfolio')
 def portfolio_group() -> None:
@@ -30,11 +60,7 @@ def portfolio_status() -> None:
     console.print()
     
     # Create a sample table for demonstration
-    table = Table(title="Current Holdings")
-    table.add_column("Symbol", style="cyan", no_wrap=True)
-    table.add_column("Amount", style="magenta")
-    table.add_column("Value (USD)", style="green")
-    table.add_column("24h Change", style="yellow")
+    table = Table(*(column.copy() for column in _STATUS_COLUMNS), title="Current Holdings")
     
     # Sample data - in real implementation this would come from the portfolio manager
     sample_holdings = [
@@ -100,41 +126,37 @@ def list_holdings(output_format: str) -> None:
     """List all holdings in the portfolio."""
     app_ctx = get_current_context()
     
-    # Sample holdings data
-    holdings = [
-        {"symbol": "BTC", "amount": 0.5, "value": 15000, "change_24h": 2.5},
-        {"symbol": "ETH", "amount": 2.0, "value": 3200, "change_24h": -1.2},
-        {"symbol": "ADA", "amount": 1000, "value": 450, "change_24h": 5.8},
-    ]
+    holdings = _SAMPLE_HOLDINGS
     
     if output_format == 'table':
-        table = Table(title="Portfolio Holdings")
-        table.add_column("Symbol", style="cyan")
-        table.add_column("Amount", style="magenta")
-        table.add_column("Value (USD)", style="green")
-        table.add_column("24h Change (%)", style="yellow")
+        table = Table(*(column.copy() for column in _LIST_COLUMNS), title="Portfolio Holdings")
         
         for holding in holdings:
-            change_color = "green" if holding["change_24h"] >= 0 else "red"
-            change_sign = "+" if holding["change_24h"] >= 0 else ""
+            change = holding["change_24h"]
+            change_color, change_sign = _CHANGE_STYLE[change >= 0]
             
             table.add_row(
                 holding["symbol"],
                 str(holding["amount"]),
                 f"${holding['value']:,}",
-                f"[{change_color}]{change_sign}{holding['change_24h']:.1f}%[/{change_color}]"
+                f"[{change_color}]{change_sign}{change:.1f}%[/{change_color}]"
             )
         
         console.print(table)
     
     elif output_format == 'json':
-        import json
-        console.print(json.dumps(holdings, indent=2))
+        console.print(dumps_json(holdings))
     
     elif output_format == 'csv':
-        console.print("symbol,amount,value,change_24h")
-        for holding in holdings:
-            console.print(f"{holding['symbol']},{holding['amount']},{holding['value']},{holding['change_24h']}")
+        # Ticker symbols and numbers never need CSV quoting, so the whole
+        # document is joined and written to stdout in one call, bypassing Rich
+        lines = [_HOLDINGS_CSV_HEADER]
+        lines.extend(
+            f"{holding['symbol']},{holding['amount']},{holding['value']},{holding['change_24h']}"
+            for holding in holdings
+        )
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 
 # Register the portfolio group with the main CLI
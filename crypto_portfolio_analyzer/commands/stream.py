@@ -1,29 +1,86 @@
 """CLI commands for real-time data streaming and monitoring."""
 
+import array
 import asyncio
+import functools
+import re
+import signal
+import sys
 import click
-import json
 import time
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 from datetime import datetime, timezone
 from rich.console import Console
 from rich.table import Table
-from rich.live import Live
-from rich.panel import Panel
+from rich.style import Style
 from rich.text import Text
-from rich.layout import Layout
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from ..streaming.manager import StreamManager, StreamConfig
-from ..streaming.websocket_server import WebSocketServer
-from ..streaming.price_feeds import PriceFeedManager, PriceFeedProvider, MockPriceFeed
-from ..streaming.portfolio_monitor import PortfolioMonitor, AlertRule, AlertType, AlertSeverity
-from ..streaming.events import StreamEventBus, EventFilter, EventType
-from ..analytics.portfolio import PortfolioAnalyzer
-from ..data.database import DatabaseManager
+# The streaming, database and analytics packages are imported inside the
+# commands that use them; importing them here would make every CLI
+# invocation pay for them when the stream group is registered.
+from ..core.cli_base import run_async
+from ..core.serialization import dumps_json, loads_json
+
+if TYPE_CHECKING:
+    from rich.live import Live
+    from ..streaming.price_feeds import PriceFeedProvider
 
 console = Console()
 
+_SYMBOL_SPLIT = re.compile(r'[,\s]+')
+
+
+def _parse_symbols(symbols: str) -> List[str]:
+    """Split a comma or whitespace separated --symbols value into upper-case symbols.
+    
+    The symbols are interned, as they are used as dict keys for every update.
+    """
+    return [sys.intern(symbol) for symbol in _SYMBOL_SPLIT.split(symbols.strip().upper()) if symbol]
+
+
+@functools.lru_cache(maxsize=None)
+def _provider(name: str) -> 'PriceFeedProvider':
+    """Resolve a --provider choice to its PriceFeedProvider member."""
+    from ..streaming.price_feeds import PriceFeedProvider
+    
+    return PriceFeedProvider(name)
+
+
+_MARKUP_TAG = re.compile(r'\[/?[a-z ]+\]')
+
+
+def _announce(markup: str) -> None:
+    """Print a server status line, bypassing Rich when output is not a terminal.
+    
+    Piped or logged output gets no styling from Rich anyway, so the markup
+    tags are simply stripped instead of going through Rich's render pipeline.
+    """
+    if console.is_terminal:
+        console.print(markup)
+    else:
+        print(_MARKUP_TAG.sub('', markup), flush=True)
+
+
+# Seconds between progress updates in ``stream test``
+_TEST_PROGRESS_STEP = 5
+
+@functools.lru_cache(maxsize=None)
+def _event_type_index() -> dict:
+    """Map each EventType to its slot in the ``stream test`` event tally."""
+    from ..streaming.events import EventType
+    
+    return {event_type: index for index, event_type in enumerate(EventType)}
+
+
+# Cell formatters and styles for the monitor table, built once at import
+_MONITOR_PRICE = "${:,.2f}".format
+_MONITOR_CHANGE = "{:+.2f}%".format
+_MONITOR_VOLUME = "${:,.0f}".format
+# HH:MM:SS from integer fields, skipping strftime's format parsing
+_MONITOR_TIME = "{0.hour:02d}:{0.minute:02d}:{0.second:02d}".format
+# Change cell style, indexed by ``change >= 0``
+_CHANGE_STYLES = (Style(color="red"), Style(color="green"))
+
 
 @click.group()
 def stream():
@@ -40,10 +97,17 @@ def stream():
 @click.option('--dashboard/--no-dashboard', default=True, help='Open dashboard in browser')
 async def start(host: str, port: int, symbols: str, provider: str, dashboard: bool):
     """Start real-time streaming server."""
-    console.print("[bold green]Starting real-time streaming server...[/bold green]")
+    from ..streaming.websocket_server import WebSocketServer
+    from ..streaming.price_feeds import PriceFeedManager
+    from ..streaming.portfolio_monitor import PortfolioMonitor, AlertRule, AlertType, AlertSeverity
+    from ..streaming.events import StreamEventBus, PriceUpdateBatcher, WebSocketEventHandler
+    from ..analytics.portfolio import PortfolioAnalyzer
+    from ..data.database import DatabaseManager
+    
+    _announce("[bold green]Starting real-time streaming server...[/bold green]")
     
     # Parse symbols
-    symbol_list = [s.strip().upper() for s in symbols.split(',')]
+    symbol_list = _parse_symbols(symbols)
     
     try:
         # Initialize components
@@ -52,7 +116,7 @@ async def start(host: str, port: int, symbols: str, provider: str, dashboard: bo
         price_feed_manager = PriceFeedManager()
         
         # Add price feed provider
-        provider_enum = PriceFeedProvider(provider)
+        provider_enum = _provider(provider)
         price_feed_manager.add_provider(provider_enum, symbol_list, is_primary=True)
         
         # Set up portfolio monitoring (if portfolio exists)
@@ -79,31 +143,22 @@ async def start(host: str, port: int, symbols: str, provider: str, dashboard: bo
             ))
             
         except Exception as e:
-            console.print(f"[yellow]Warning: Could not initialize portfolio monitoring: {e}[/yellow]")
+            _announce(f"[yellow]Warning: Could not initialize portfolio monitoring: {e}[/yellow]")
             portfolio_monitor = None
         
-        # Start all components
-        await event_bus.start()
-        await websocket_server.start()
-        await price_feed_manager.start()
-        
+        # Start all components; they are independent, so their I/O overlaps
+        components = [event_bus, websocket_server, price_feed_manager]
         if portfolio_monitor:
-            await portfolio_monitor.start()
+            components.append(portfolio_monitor)
+        
+        await asyncio.gather(*(component.start() for component in components))
         
         # Set up event handlers
-        from ..streaming.events import WebSocketEventHandler
         websocket_handler = WebSocketEventHandler(websocket_server)
         event_bus.subscribe("websocket_handler", websocket_handler)
         
-        # Connect price feed to event bus
-        def price_update_handler(price_update):
-            asyncio.create_task(event_bus.publish_price_update(
-                price_update.symbol, 
-                price_update.to_dict(),
-                source=f"{provider}_feed"
-            ))
-        
-        price_feed_manager.add_handler(price_update_handler)
+        # Connect price feed to event bus, publishing updates in batches
+        price_feed_manager.add_handler(PriceUpdateBatcher(event_bus, source=f"{provider}_feed"))
         
         # Connect portfolio monitor to event bus
         if portfolio_monitor:
@@ -122,34 +177,51 @@ async def start(host: str, port: int, symbols: str, provider: str, dashboard: bo
             portfolio_monitor.add_portfolio_handler(portfolio_update_handler)
             portfolio_monitor.add_alert_handler(alert_handler)
         
-        console.print(f"[bold green]✓[/bold green] Streaming server started on {host}:{port}")
-        console.print(f"[bold green]✓[/bold green] Price feed: {provider} ({', '.join(symbol_list)})")
-        console.print(f"[bold green]✓[/bold green] Dashboard: http://{host}:{port}")
+        _announce(f"[bold green]✓[/bold green] Streaming server started on {host}:{port}")
+        _announce(f"[bold green]✓[/bold green] Price feed: {provider} ({', '.join(symbol_list)})")
+        _announce(f"[bold green]✓[/bold green] Dashboard: http://{host}:{port}")
+        
+        loop = asyncio.get_running_loop()
         
         if dashboard:
             import webbrowser
-            webbrowser.open(f"http://{host}:{port}")
+            # Browser discovery can block for a while; let it run in the
+            # default executor without holding up the server
+            loop.run_in_executor(None, webbrowser.open, f"http://{host}:{port}")
+        
+        _announce("\n[bold yellow]Press Ctrl+C to stop the server[/bold yellow]")
         
-        console.print("\n[bold yellow]Press Ctrl+C to stop the server[/bold yellow]")
+        # Keep running until interrupted; the wait sleeps without periodic wakeups
+        stop_event = asyncio.Event()
+        shutdown_signals = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+                shutdown_signals.append(sig)
+            except (NotImplementedError, RuntimeError):
+                # Not supported on Windows; Ctrl+C raises KeyboardInterrupt there
+                pass
         
-        # Keep running until interrupted
         try:
-            while True:
-                await asyncio.sleep(1)
+            await stop_event.wait()
         except KeyboardInterrupt:
-            console.print("\n[bold red]Stopping streaming server...[/bold red]")
+            pass
+        finally:
+            for sig in shutdown_signals:
+                loop.remove_signal_handler(sig)
         
-        # Cleanup
-        if portfolio_monitor:
-            await portfolio_monitor.stop()
-        await price_feed_manager.stop()
-        await websocket_server.stop()
-        await event_bus.stop()
+        _announce("\n[bold red]Stopping streaming server...[/bold red]")
+        
+        # Cleanup; one component failing to stop must not keep the others running
+        await asyncio.gather(
+            *(component.stop() for component in reversed(components)),
+            return_exceptions=True
+        )
         
-        console.print("[bold green]✓[/bold green] Streaming server stopped")
+        _announce("[bold green]✓[/bold green] Streaming server stopped")
         
     except Exception as e:
-        console.print(f"[bold red]Error starting streaming server: {e}[/bold red]")
+        _announce(f"[bold red]Error starting streaming server: {e}[/bold red]")
         raise click.ClickException(str(e))
 
 
@@ -160,78 +232,118 @@ async def start(host: str, port: int, symbols: str, provider: str, dashboard: bo
 @click.option('--refresh', default=1.0, help='Refresh interval in seconds')
 async def monitor(symbols: str, provider: str, refresh: float):
     """Monitor real-time price feeds in terminal."""
-    symbol_list = [s.strip().upper() for s in symbols.split(',')]
+    from rich.live import Live
+    from ..streaming.price_feeds import PriceFeedManager
+    
+    symbol_list = _parse_symbols(symbols)
     
     console.print(f"[bold green]Starting price monitor for {', '.join(symbol_list)}...[/bold green]")
     
     # Initialize price feed
     price_feed_manager = PriceFeedManager()
-    provider_enum = PriceFeedProvider(provider)
+    provider_enum = _provider(provider)
     price_feed_manager.add_provider(provider_enum, symbol_list, is_primary=True)
     
     # Store latest prices
     latest_prices = {}
     
     def price_update_handler(price_update):
-        latest_prices[price_update.symbol] = price_update
+        # Feed symbols are fresh strings; interning them makes the table's
+        # lookups with the interned symbol_list entries identity hits
+        latest_prices[sys.intern(price_update.symbol)] = price_update
     
     price_feed_manager.add_handler(price_update_handler)
     
     try:
         await price_feed_manager.start()
         
-        def create_price_table():
-            """Create a table showing current prices."""
-            table = Table(title="Real-time Cryptocurrency Prices")
-            table.add_column("Symbol", style="cyan", no_wrap=True)
-            table.add_column("Price", style="green", justify="right")
-            table.add_column("24h Change", justify="right")
-            table.add_column("Volume", justify="right")
-            table.add_column("Last Update", style="dim")
-            
-            for symbol in symbol_list:
-                if symbol in latest_prices:
-                    price_update = latest_prices[symbol]
-                    
-                    # Format price
-                    price_str = f"${price_update.price:,.2f}"
-                    
-                    # Format 24h change
-                    if price_update.change_percent_24h is not None:
-                        change_color = "green" if price_update.change_percent_24h >= 0 else "red"
-                        change_str = f"[{change_color}]{price_update.change_percent_24h:+.2f}%[/{change_color}]"
-                    else:
-                        change_str = "N/A"
-                    
-                    # Format volume
-                    if price_update.volume_24h:
-                        volume_str = f"${price_update.volume_24h:,.0f}"
-                    else:
-                        volume_str = "N/A"
-                    
-                    # Format timestamp
-                    time_str = price_update.timestamp.strftime("%H:%M:%S")
-                    
-                    table.add_row(symbol, price_str, change_str, volume_str, time_str)
-                else:
-                    table.add_row(symbol, "Waiting...", "N/A", "N/A", "N/A")
-            
-            return table
+        # Build the table once; each tick only rewrites the dynamic cells
+        table = Table(title="Real-time Cryptocurrency Prices")
+        table.add_column("Symbol", style="cyan", no_wrap=True)
+        table.add_column("Price", style="green", justify="right")
+        table.add_column("24h Change", justify="right")
+        table.add_column("Volume", justify="right")
+        table.add_column("Last Update", style="dim")
         
-        # Live display
-        with Live(create_price_table(), refresh_per_second=1/refresh, console=console) as live:
+        # One Text per dynamic cell, indexed like symbol_list; ticks update
+        # these objects in place instead of rebuilding the rows
+        row_cells = []
+        for symbol in symbol_list:
+            cells = (Text("Waiting..."), Text("N/A"), Text("N/A"), Text("N/A"))
+            table.add_row(symbol, *cells)
+            row_cells.append(cells)
+        
+        # Last update written to each row, so unchanged rows are not reformatted
+        shown_updates = [None] * len(symbol_list)
+        
+        def update_price_table():
+            """Write the latest prices into the table's cells."""
+            for row, symbol in enumerate(symbol_list):
+                price_update = latest_prices.get(symbol)
+                if price_update is None or price_update is shown_updates[row]:
+                    continue
+                
+                shown_updates[row] = price_update
+                _update_monitor_cells(row_cells[row], price_update)
+        
+        # Live display; refreshed explicitly after each update so the cells
+        # are never rendered while being rewritten
+        update_price_table()
+        with Live(table, auto_refresh=False, console=console) as live:
+            # The refresh cadence runs in its own task. Ctrl+C reaches here
+            # as cancellation from run_async, which also stops the refresher
+            # before the display and the feed are shut down
+            refresher = asyncio.create_task(
+                _refresh_live(live, update_price_table, refresh)
+            )
             try:
-                while True:
-                    await asyncio.sleep(refresh)
-                    live.update(create_price_table())
-            except KeyboardInterrupt:
-                pass
+                await refresher
+            finally:
+                refresher.cancel()
         
     finally:
         await price_feed_manager.stop()
         console.print("\n[bold green]✓[/bold green] Price monitor stopped")
 
 
+async def _refresh_live(live: 'Live', update_table, interval: float) -> None:
+    """Update and repaint a Live display every ``interval`` seconds.
+    
+    Args:
+        live: Live display to repaint
+        update_table: Callable writing the latest data into the renderable
+        interval: Seconds between repaints
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            update_table()
+        except Exception as e:
+            # A malformed update must not stop the display; show the last good frame
+            console.log(f"[red]Error updating display:[/red] {e}")
+            continue
+        live.refresh()
+
+
+def _update_monitor_cells(cells: tuple, price_update) -> None:
+    """Write a price update into the price, 24h change, volume and time cells of a monitor row."""
+    price_cell, change_cell, volume_cell, time_cell = cells
+    
+    price_cell.plain = _MONITOR_PRICE(price_update.price)
+    
+    change = price_update.change_percent_24h
+    if change is not None:
+        change_cell.plain = _MONITOR_CHANGE(change)
+        change_cell.style = _CHANGE_STYLES[change >= 0]
+    else:
+        change_cell.plain = "N/A"
+        change_cell.style = ""
+    
+    volume = price_update.volume_24h
+    volume_cell.plain = _MONITOR_VOLUME(volume) if volume else "N/A"
+    time_cell.plain = _MONITOR_TIME(price_update.timestamp)
+
+
 @stream.command()
 @click.option('--host', default='localhost', help='WebSocket server host')
 @click.option('--port', default=8000, help='WebSocket server port')
@@ -240,10 +352,13 @@ async def status(host: str, port: int):
     import aiohttp
     
     try:
-        async with aiohttp.ClientSession() as session:
+        # A single status request needs only a small connection pool; the
+        # DNS cache covers any further requests made on this session
+        connector = aiohttp.TCPConnector(limit=4, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
             async with session.get(f"http://{host}:{port}/status") as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = loads_json(await response.read())
                     
                     # Create status table
                     table = Table(title="Streaming Server Status")
@@ -276,7 +391,11 @@ async def status(host: str, port: int):
 @click.option('--duration', default=60, help='Test duration in seconds')
 async def test(symbols: str, duration: int):
     """Test streaming components with mock data."""
-    symbol_list = [s.strip().upper() for s in symbols.split(',')]
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from ..streaming.price_feeds import PriceFeedManager, PriceFeedProvider
+    from ..streaming.events import StreamEventBus, PriceUpdateBatcher
+    
+    symbol_list = _parse_symbols(symbols)
     
     console.print(f"[bold green]Testing streaming components for {duration} seconds...[/bold green]")
     
@@ -287,24 +406,18 @@ async def test(symbols: str, duration: int):
     # Add mock price feed
     price_feed_manager.add_provider(PriceFeedProvider.MOCK, symbol_list, is_primary=True)
     
-    # Event counters
-    event_counts = {event_type: 0 for event_type in EventType}
+    # Event counters, one slot per EventType in _event_type_index() order
+    event_type_index = _event_type_index()
+    event_counts = array.array('L', [0]) * len(event_type_index)
     
     def event_handler(event):
-        event_counts[event.event_type] += 1
+        event_counts[event_type_index[event.event_type]] += 1
     
     # Subscribe to all events
     event_bus.subscribe("test_handler", event_handler)
     
-    # Connect price feed to event bus
-    def price_update_handler(price_update):
-        asyncio.create_task(event_bus.publish_price_update(
-            price_update.symbol, 
-            price_update.to_dict(),
-            source="mock_feed"
-        ))
-    
-    price_feed_manager.add_handler(price_update_handler)
+    # Connect price feed to event bus, publishing updates in batches
+    price_feed_manager.add_handler(PriceUpdateBatcher(event_bus, source="mock_feed"))
     
     try:
         # Start components
@@ -319,9 +432,12 @@ async def test(symbols: str, duration: int):
         ) as progress:
             task = progress.add_task("Running test...", total=duration)
             
-            for i in range(duration):
-                await asyncio.sleep(1)
-                progress.update(task, advance=1)
+            # The spinner animates on its own; the task only needs to move
+            # every few seconds rather than on every one
+            for elapsed in range(0, duration, _TEST_PROGRESS_STEP):
+                step = min(_TEST_PROGRESS_STEP, duration - elapsed)
+                await asyncio.sleep(step)
+                progress.update(task, advance=step)
         
         # Show results
         console.print("\n[bold green]Test Results:[/bold green]")
@@ -350,7 +466,7 @@ async def test(symbols: str, duration: int):
         
         # Event type breakdown
         results_table.add_row("", "", "")  # Separator
-        for event_type, count in event_counts.items():
+        for event_type, count in zip(event_type_index, event_counts):
             if count > 0:
                 results_table.add_row(
                     f"  {event_type.value}",
@@ -397,14 +513,15 @@ async def alert(symbol: str, price: Optional[float], change: Optional[float], se
     
     console.print(f"[green]✓[/green] Severity: {severity}")
     console.print("\n[yellow]Note: This would be sent to a running streaming server[/yellow]")
-    console.print(f"Alert configuration: {json.dumps(alert_config, indent=2)}")
+    console.print(f"Alert configuration: {dumps_json(alert_config)}")
 
 
 # Make commands async-compatible
 def make_async_command(func):
     """Decorator to make async commands work with Click."""
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        return asyncio.run(func(*args, **kwargs))
+        return run_async(func(*args, **kwargs))
     return wrapper
 
 # Apply async wrapper to commands
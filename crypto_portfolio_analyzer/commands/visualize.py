@@ -1,35 +1,80 @@
 """CLI commands for visualization and charting."""
 
 import asyncio
-import json
+import functools
+import time
 import webbrowser
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Mapping, Optional, Tuple
 import click
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich import box
+from rich.style import Style
+from rich.text import Text
 
+# The visualization, analytics and data packages pull in plotly, pandas and
+# scipy; they are imported by the commands and factories below that use them
+# so that --help and dry runs don't pay for them.
+from ..core.cli_base import run_async
 from ..core.context import get_current_context
-from ..visualization.charts import ChartGenerator
-from ..visualization.terminal_charts import TerminalCharts
-from ..visualization.indicators import TechnicalIndicators
-from ..visualization.exports import ChartExporter
-from ..analytics.portfolio import PortfolioAnalyzer
-from ..data.service import get_data_service
+from ..core.sample_portfolio import SAMPLE_PORTFOLIO
+from ..core.serialization import dumps_json, loads_json
+
+if TYPE_CHECKING:
+    from ..analytics.models import PortfolioSnapshot
+    from ..analytics.portfolio import PortfolioAnalyzer
+    from ..visualization.charts import ChartGenerator
+    from ..visualization.exports import ChartExporter
+    from ..visualization.terminal_charts import TerminalCharts
 
 console = Console()
 
+# Indicator keys charted for each --indicators choice of ``visualize price``
+_INDICATOR_KEYS = {
+    'sma': ('SMA_20',),
+    'ema': ('EMA_12',),
+    'rsi': ('RSI',),
+    'macd': ('MACD', 'MACD_Signal'),
+    'bollinger': ('BB_Upper', 'BB_Lower'),
+}
+
+# Extra indicator keys the terminal signals panel reads for an --indicators choice
+_SIGNAL_KEYS = {
+    'sma': ('SMA_50',),
+}
+
+# Signal cell styles, keyed by the signal's first word (BULLISH_CROSSOVER -> BULLISH)
+_NEUTRAL_SIGNAL_STYLE = Style(color="white")
+_SIGNAL_STYLES = {
+    'BULLISH': Style(color="green"),
+    'BEARISH': Style(color="red"),
+    'OVERBOUGHT': Style(color="yellow"),
+    'OVERSOLD': Style(color="blue"),
+    'NEUTRAL': _NEUTRAL_SIGNAL_STYLE,
+}
+
+# Seconds a portfolio snapshot is reused for identical holdings; current
+# prices behind it are cached by the data service for longer than this
+_SNAPSHOT_TTL = 60
+
+# Entries kept in each of the snapshot and figure caches
+_CACHE_SIZE = 32
+
+# Holdings key -> (creation time, snapshot)
+_snapshot_cache: Dict[str, Tuple[float, 'PortfolioSnapshot']] = {}
+
+# (holdings key, theme) -> (snapshot, allocation figure)
+_allocation_figures: Dict[Tuple[str, str], tuple] = {}
+
 
 def async_command(f):
     """Decorator to make Click commands async-compatible."""
-    import functools
-    
     @functools.wraps(f)
     def wrapper(*args, **kwargs):
-        return asyncio.run(f(*args, **kwargs))
+        return run_async(f(*args, **kwargs))
     return wrapper
 
 
@@ -49,15 +94,19 @@ def visualize(ctx):
               help='Output file for chart (not needed for terminal format)')
 @click.option('--theme', type=click.Choice(['light', 'dark']), default='light',
               help='Chart theme')
+@click.option('--offline-js', is_flag=True, default=False,
+              help='Embed plotly.js in HTML output instead of loading it from the CDN')
+@click.option('--open/--no-open', 'open_browser', default=False,
+              help='Open HTML output in a browser once it is written')
 @click.pass_context
 @async_command
 async def portfolio(ctx, portfolio_file: Optional[str], output_format: str, 
-                   output_file: Optional[str], theme: str):
+                   output_file: Optional[str], theme: str, offline_js: bool, open_browser: bool):
     """Generate portfolio performance chart.
     
     Examples:
         crypto-portfolio visualize portfolio --format terminal
-        crypto-portfolio visualize portfolio --format html --output-file portfolio.html
+        crypto-portfolio visualize portfolio --format html --output-file portfolio.html --open
         crypto-portfolio visualize portfolio --format png --output-file portfolio.png
     """
     app_ctx = get_current_context()
@@ -73,20 +122,16 @@ async def portfolio(ctx, portfolio_file: Optional[str], output_format: str,
             console.print("[red]No portfolio data provided.[/red]")
             return
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        html_path = None
+        with _chart_progress(output_format) as progress:
             task = progress.add_task("Generating portfolio chart...", total=None)
             
             # Create portfolio snapshot
-            analyzer = PortfolioAnalyzer()
-            current_snapshot = await analyzer.create_portfolio_snapshot(portfolio_data['holdings'])
+            current_snapshot = await _get_portfolio_snapshot(portfolio_data['holdings'])
             
             if output_format == 'terminal':
                 # Terminal ASCII chart
-                terminal_charts = TerminalCharts(console)
+                terminal_charts = _terminal_charts()
                 
                 # Create dashboard
                 terminal_charts.create_summary_dashboard(current_snapshot)
@@ -97,35 +142,35 @@ async def portfolio(ctx, portfolio_file: Optional[str], output_format: str,
                 
             else:
                 # Interactive chart
-                chart_generator = ChartGenerator()
-                if theme == 'dark':
-                    chart_generator.update_chart_theme('plotly_dark')
+                chart_generator = _chart_generator(theme)
                 
                 # Create allocation pie chart
-                fig = chart_generator.create_allocation_pie_chart(current_snapshot)
+                fig = _get_allocation_chart(chart_generator, current_snapshot,
+                                            portfolio_data['holdings'], theme)
                 
                 if output_format == 'html':
                     if not output_file:
                         output_file = 'portfolio_chart.html'
                     
-                    fig.write_html(output_file, include_plotlyjs=True)
+                    await _in_thread(_write_chart_html, fig, output_file, offline_js)
                     console.print(f"[green]Chart saved to {output_file}[/green]")
-                    
-                    # Open in browser
-                    if click.confirm("Open chart in browser?"):
-                        webbrowser.open(f"file://{Path(output_file).absolute()}")
+                    html_path = Path(output_file)
                 
                 else:  # png, svg
                     if not output_file:
                         output_file = f'portfolio_chart.{output_format}'
                     
-                    exporter = ChartExporter()
-                    if exporter.export_chart(fig, output_file, output_format):
+                    exporter = _exporter()
+                    if await _in_thread(exporter.export_chart, fig, output_file, output_format):
                         console.print(f"[green]Chart exported to {output_file}[/green]")
                     else:
                         console.print("[red]Failed to export chart[/red]")
             
             progress.update(task, completed=True)
+        
+        # Opened once the spinner has stopped so the output doesn't overlap
+        if open_browser and html_path:
+            webbrowser.open(f"file://{html_path.absolute()}")
             
     except Exception as e:
         console.print(f"[red]Error generating portfolio chart: {e}[/red]")
@@ -145,15 +190,22 @@ async def portfolio(ctx, portfolio_file: Optional[str], output_format: str,
               help='Output file for chart')
 @click.option('--theme', type=click.Choice(['light', 'dark']), default='light',
               help='Chart theme')
+@click.option('--offline-js', is_flag=True, default=False,
+              help='Embed plotly.js in HTML output instead of loading it from the CDN')
+@click.option('--open/--no-open', 'open_browser', default=False,
+              help='Open HTML output in a browser once it is written')
+@click.option('--no-cache', is_flag=True, default=False,
+              help='Fetch fresh price history instead of using cached data')
 @click.pass_context
 @async_command
 async def price(ctx, symbol: str, days: int, indicators: List[str], 
-               output_format: str, output_file: Optional[str], theme: str):
+               output_format: str, output_file: Optional[str], theme: str, offline_js: bool,
+               open_browser: bool, no_cache: bool):
     """Generate price chart with technical indicators.
     
     Examples:
         crypto-portfolio visualize price BTC --days 30 --format terminal
-        crypto-portfolio visualize price ETH --indicators sma ema rsi --format html
+        crypto-portfolio visualize price ETH --indicators sma ema rsi --format html --open
         crypto-portfolio visualize price ADA --days 90 --format png --output-file ada_chart.png
     """
     app_ctx = get_current_context()
@@ -163,24 +215,27 @@ async def price(ctx, symbol: str, days: int, indicators: List[str],
         return
     
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        html_path = None
+        with _chart_progress(output_format) as progress:
             task = progress.add_task(f"Fetching {symbol} price data...", total=None)
             
+            from ..data.service import get_data_service
+            from ..visualization.indicators import TechnicalIndicators
+            
             # Get data service
             data_service = await get_data_service()
             
             # Fetch historical data
-            from datetime import datetime, timezone, timedelta
             end_date = datetime.now(timezone.utc)
             start_date = end_date - timedelta(days=days)
             
-            historical_prices = await data_service.get_historical_prices(symbol, start_date, end_date)
+            # Prices arrive as float columns; the indicators and both chart
+            # kinds read from them
+            price_series = await data_service.get_price_series(
+                symbol, start_date, end_date, use_cache=not no_cache
+            )
             
-            if not historical_prices:
+            if not price_series:
                 console.print(f"[red]No price data available for {symbol}[/red]")
                 return
             
@@ -189,78 +244,75 @@ async def price(ctx, symbol: str, days: int, indicators: List[str],
             # Calculate technical indicators
             tech_indicators = TechnicalIndicators()
             calculated_indicators = {}
+            signals = {}
             
             if indicators:
-                all_indicators = tech_indicators.calculate_all_indicators(historical_prices)
+                # Only the requested indicators are calculated, plus the ones
+                # their terminal signals compare against
+                needed = set().union(*(_INDICATOR_KEYS[indicator] for indicator in indicators))
+                if output_format == 'terminal':
+                    needed.update(*(_SIGNAL_KEYS.get(indicator, ()) for indicator in indicators))
                 
-                for indicator in indicators:
-                    if indicator == 'sma':
-                        calculated_indicators['SMA_20'] = all_indicators.get('SMA_20', [])
-                    elif indicator == 'ema':
-                        calculated_indicators['EMA_12'] = all_indicators.get('EMA_12', [])
-                    elif indicator == 'rsi':
-                        calculated_indicators['RSI'] = all_indicators.get('RSI', [])
-                    elif indicator == 'macd':
-                        calculated_indicators['MACD'] = all_indicators.get('MACD', [])
-                        calculated_indicators['MACD_Signal'] = all_indicators.get('MACD_Signal', [])
-                    elif indicator == 'bollinger':
-                        calculated_indicators['BB_Upper'] = all_indicators.get('BB_Upper', [])
-                        calculated_indicators['BB_Lower'] = all_indicators.get('BB_Lower', [])
+                all_indicators = tech_indicators.calculate_series(
+                    price_series.closes, price_series.volumes, needed
+                )
+                calculated_indicators = {
+                    key: all_indicators.get(key, [])
+                    for indicator in indicators
+                    for key in _INDICATOR_KEYS[indicator]
+                }
+                
+                if output_format == 'terminal':
+                    signals = tech_indicators.get_indicator_signals_for(all_indicators)
             
             progress.update(task, description="Generating chart...")
             
             if output_format == 'terminal':
                 # Terminal ASCII chart
-                terminal_charts = TerminalCharts(console)
-                
-                # Extract price data
-                prices = [float(p.price) for p in historical_prices]
-                timestamps = [p.timestamp for p in historical_prices]
+                terminal_charts = _terminal_charts()
                 
                 # Create price chart
-                price_chart = terminal_charts.create_price_chart(prices, timestamps, symbol)
+                price_chart = terminal_charts.create_price_chart(
+                    price_series.closes.tolist(), price_series.timestamps, symbol
+                )
                 terminal_charts.print_chart(price_chart)
                 
-                # Show technical indicator signals if calculated
-                if calculated_indicators:
-                    signals = tech_indicators.get_indicator_signals(all_indicators)
-                    if signals:
-                        signals_panel = _create_signals_panel(signals)
-                        console.print(signals_panel)
+                # Show signals for the requested indicators
+                if signals:
+                    console.print(_create_signals_panel(signals))
                 
             else:
                 # Interactive chart
-                chart_generator = ChartGenerator()
-                if theme == 'dark':
-                    chart_generator.update_chart_theme('plotly_dark')
+                chart_generator = _chart_generator(theme)
                 
                 # Create candlestick chart
                 fig = chart_generator.create_candlestick_chart(
-                    historical_prices, symbol, calculated_indicators
+                    price_series, symbol, calculated_indicators
                 )
                 
                 if output_format == 'html':
                     if not output_file:
                         output_file = f'{symbol.lower()}_chart.html'
                     
-                    fig.write_html(output_file, include_plotlyjs=True)
+                    await _in_thread(_write_chart_html, fig, output_file, offline_js)
                     console.print(f"[green]Chart saved to {output_file}[/green]")
-                    
-                    # Open in browser
-                    if click.confirm("Open chart in browser?"):
-                        webbrowser.open(f"file://{Path(output_file).absolute()}")
+                    html_path = Path(output_file)
                 
                 else:  # png, svg
                     if not output_file:
                         output_file = f'{symbol.lower()}_chart.{output_format}'
                     
-                    exporter = ChartExporter()
-                    if exporter.export_chart(fig, output_file, output_format):
+                    exporter = _exporter()
+                    if await _in_thread(exporter.export_chart, fig, output_file, output_format):
                         console.print(f"[green]Chart exported to {output_file}[/green]")
                     else:
                         console.print("[red]Failed to export chart[/red]")
             
             progress.update(task, completed=True)
+        
+        # Opened once the spinner has stopped so the output doesn't overlap
+        if open_browser and html_path:
+            webbrowser.open(f"file://{html_path.absolute()}")
             
     except Exception as e:
         console.print(f"[red]Error generating price chart: {e}[/red]")
@@ -277,15 +329,23 @@ async def price(ctx, symbol: str, days: int, indicators: List[str],
               default='png', help='Chart format')
 @click.option('--theme', type=click.Choice(['light', 'dark']), default='light',
               help='Chart theme')
+@click.option('--include-performance/--no-performance', default=False,
+              help='Include the portfolio performance chart (a single point without history)')
+@click.option('--no-cache', is_flag=True, default=False,
+              help='Fetch fresh price history instead of using cached data')
+@click.option('--open/--no-open', 'open_browser', default=False,
+              help='Open the gallery index in a browser once it is written')
 @click.pass_context
 @async_command
 async def gallery(ctx, portfolio_file: Optional[str], output_dir: str, 
-                 output_format: str, theme: str):
+                 output_format: str, theme: str, include_performance: bool, no_cache: bool,
+                 open_browser: bool):
     """Generate comprehensive chart gallery.
     
     Examples:
-        crypto-portfolio visualize gallery --output-dir my_charts
+        crypto-portfolio visualize gallery --output-dir my_charts --open
         crypto-portfolio visualize gallery --format svg --theme dark
+        crypto-portfolio visualize gallery --include-performance
     """
     app_ctx = get_current_context()
     
@@ -307,52 +367,68 @@ async def gallery(ctx, portfolio_file: Optional[str], output_dir: str,
         ) as progress:
             task = progress.add_task("Generating chart gallery...", total=None)
             
+            from ..data.service import get_data_service
+            
             # Initialize components
-            chart_generator = ChartGenerator()
-            if theme == 'dark':
-                chart_generator.update_chart_theme('plotly_dark')
+            chart_generator = _chart_generator(theme)
+            exporter = _exporter()
             
-            analyzer = PortfolioAnalyzer()
-            exporter = ChartExporter()
+            # Create portfolio snapshot while the data service is set up
+            current_snapshot, data_service = await asyncio.gather(
+                _get_portfolio_snapshot(portfolio_data['holdings']),
+                get_data_service()
+            )
             
-            # Create portfolio snapshot
-            current_snapshot = await analyzer.create_portfolio_snapshot(portfolio_data['holdings'])
+            end_date = datetime.now(timezone.utc)
+            start_date = end_date - timedelta(days=30)
             
-            # Generate charts
-            charts = {}
+            # Plotly figures are built on worker threads, so the portfolio
+            # charts are created while the holding price histories download
+            progress.update(task, description="Creating portfolio charts...")
             
-            progress.update(task, description="Creating portfolio allocation chart...")
-            charts['Portfolio Allocation'] = chart_generator.create_allocation_pie_chart(current_snapshot)
+            portfolio_builds = [
+                _in_thread(_get_allocation_chart, chart_generator, current_snapshot,
+                           portfolio_data['holdings'], theme)
+            ]
+            if include_performance:
+                # Use current snapshot as single point for demo; no snapshot
+                # history is stored yet
+                portfolio_builds.append(
+                    _in_thread(chart_generator.create_portfolio_performance_chart, [current_snapshot])
+                )
+            
+            prices_map, *portfolio_charts = await asyncio.gather(
+                data_service.get_historical_prices_bulk(
+                    [holding.symbol for holding in current_snapshot.holdings], start_date, end_date,
+                    use_cache=not no_cache
+                ),
+                *portfolio_builds
+            )
             
-            progress.update(task, description="Creating performance chart...")
-            # Use current snapshot as single point for demo
-            charts['Portfolio Performance'] = chart_generator.create_portfolio_performance_chart([current_snapshot])
+            charts = dict(zip(('Portfolio Allocation', 'Portfolio Performance'), portfolio_charts))
             
             # Create price charts for each holding
-            data_service = await get_data_service()
-            for holding in current_snapshot.holdings:
-                progress.update(task, description=f"Creating {holding.symbol} price chart...")
-                
-                try:
-                    from datetime import datetime, timezone, timedelta
-                    end_date = datetime.now(timezone.utc)
-                    start_date = end_date - timedelta(days=30)
-                    
-                    historical_prices = await data_service.get_historical_prices(
-                        holding.symbol, start_date, end_date
-                    )
-                    
-                    if historical_prices:
-                        charts[f'{holding.symbol} Price Chart'] = chart_generator.create_candlestick_chart(
-                            historical_prices, holding.symbol
-                        )
-                except Exception as e:
-                    console.print(f"[yellow]Warning: Could not create chart for {holding.symbol}: {e}[/yellow]")
+            progress.update(task, description="Creating holding price charts...")
+            
+            symbols = [symbol for symbol, historical_prices in prices_map.items() if historical_prices]
+            price_charts = await asyncio.gather(
+                *(_in_thread(chart_generator.create_candlestick_chart, prices_map[symbol], symbol)
+                  for symbol in symbols),
+                return_exceptions=True
+            )
+            
+            for symbol, fig in zip(symbols, price_charts):
+                if isinstance(fig, Exception):
+                    console.print(f"[yellow]Warning: Could not create chart for {symbol}: {fig}[/yellow]")
+                else:
+                    charts[f'{symbol} Price Chart'] = fig
             
             progress.update(task, description="Exporting charts...")
             
             # Export gallery
-            gallery_paths = exporter.create_chart_gallery(charts, output_dir, output_format)
+            gallery_paths = await _in_thread(
+                exporter.create_chart_gallery, charts, output_dir, output_format
+            )
             
             progress.update(task, completed=True)
             
@@ -362,7 +438,7 @@ async def gallery(ctx, portfolio_file: Optional[str], output_dir: str,
             # Open gallery if HTML format
             if output_format == 'png':
                 index_path = Path(output_dir) / "index.html"
-                if index_path.exists() and click.confirm("Open gallery in browser?"):
+                if open_browser and index_path.exists():
                     webbrowser.open(f"file://{index_path.absolute()}")
             
     except Exception as e:
@@ -429,25 +505,176 @@ async def dashboard(ctx, host: str, port: int, theme: str, auto_refresh: bool, r
             console.print_exception()
 
 
-def _load_portfolio_data(portfolio_file: Optional[str]) -> Optional[Dict]:
+def _cache_put(cache: dict, key, value) -> None:
+    """Store a cache entry, evicting the oldest entry once the cache is full."""
+    cache.pop(key, None)
+    if len(cache) >= _CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+async def _in_thread(func, *args):
+    """Run a blocking render or file write on the default executor.
+    
+    Args:
+        func: Blocking callable
+        *args: Positional arguments for ``func``
+        
+    Returns:
+        The callable's return value
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+@functools.lru_cache(maxsize=None)
+def _chart_generator(theme: str) -> 'ChartGenerator':
+    """Get the process-wide chart generator for a theme.
+    
+    Args:
+        theme: Chart theme, 'light' or 'dark'
+        
+    Returns:
+        ChartGenerator with the theme applied
+    """
+    from ..visualization.charts import ChartGenerator
+    
+    chart_generator = ChartGenerator()
+    if theme == 'dark':
+        chart_generator.update_chart_theme('plotly_dark')
+    return chart_generator
+
+
+@functools.lru_cache(maxsize=None)
+def _exporter() -> 'ChartExporter':
+    """Get the process-wide chart exporter."""
+    from ..visualization.exports import ChartExporter
+    return ChartExporter()
+
+
+@functools.lru_cache(maxsize=None)
+def _analyzer() -> 'PortfolioAnalyzer':
+    """Get the process-wide portfolio analyzer."""
+    from ..analytics.portfolio import PortfolioAnalyzer
+    return PortfolioAnalyzer()
+
+
+@functools.lru_cache(maxsize=None)
+def _terminal_charts() -> 'TerminalCharts':
+    """Get the process-wide terminal chart renderer bound to this module's console."""
+    from ..visualization.terminal_charts import TerminalCharts
+    return TerminalCharts(console)
+
+
+def _chart_progress(output_format: str) -> Progress:
+    """Create the spinner shown while a single chart is generated.
+    
+    Terminal charts render quickly and print a lot of text themselves, so the
+    spinner is disabled for them rather than repainting over their output.
+    
+    Args:
+        output_format: The command's --format choice
+        
+    Returns:
+        Progress display, transient and refreshed at a low rate
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+        refresh_per_second=4,
+        disable=output_format == 'terminal'
+    )
+
+
+def _write_chart_html(fig, output_file: str, offline_js: bool) -> None:
+    """Write a chart as a standalone HTML page.
+    
+    Args:
+        fig: Plotly figure to write
+        output_file: Destination HTML file
+        offline_js: Embed the ~3MB plotly.js bundle instead of linking the CDN copy
+    """
+    fig.write_html(output_file, include_plotlyjs=True if offline_js else 'cdn',
+                   full_html=True, config={'responsive': True})
+
+
+def _holdings_key(holdings: List[Dict]) -> str:
+    """Build a cache key identifying a list of holdings by content."""
+    return dumps_json(holdings, indent=False)
+
+
+async def _get_portfolio_snapshot(holdings: List[Dict]) -> 'PortfolioSnapshot':
+    """Create a portfolio snapshot, reusing a recent one for identical holdings.
+    
+    Args:
+        holdings: List of holdings with symbol, quantity, average_cost
+        
+    Returns:
+        PortfolioSnapshot with current market values
+    """
+    key = _holdings_key(holdings)
+    now = time.monotonic()
+    
+    cached = _snapshot_cache.get(key)
+    if cached is not None and now - cached[0] < _SNAPSHOT_TTL:
+        return cached[1]
+    
+    snapshot = await _analyzer().create_portfolio_snapshot(holdings)
+    _cache_put(_snapshot_cache, key, (now, snapshot))
+    return snapshot
+
+
+def _get_allocation_chart(chart_generator: 'ChartGenerator', snapshot: 'PortfolioSnapshot',
+                          holdings: List[Dict], theme: str):
+    """Create the allocation pie chart, reusing the figure built for the same snapshot.
+    
+    Args:
+        chart_generator: Chart generator configured for ``theme``
+        snapshot: Portfolio snapshot to chart
+        holdings: Holdings the snapshot was created from
+        theme: Chart theme
+        
+    Returns:
+        Plotly figure object
+    """
+    key = (_holdings_key(holdings), theme)
+    
+    cached = _allocation_figures.get(key)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+    
+    fig = chart_generator.create_allocation_pie_chart(snapshot)
+    _cache_put(_allocation_figures, key, (snapshot, fig))
+    return fig
+
+
+@functools.lru_cache(maxsize=8)
+def _read_portfolio_file(path: str, mtime_ns: int) -> Dict:
+    """Parse a portfolio JSON file, memoized until the file is modified.
+    
+    Args:
+        path: Absolute path of the portfolio file
+        mtime_ns: File modification time; part of the cache key only
+        
+    Returns:
+        Parsed portfolio data
+    """
+    return loads_json(Path(path).read_bytes())
+
+
+def _load_portfolio_data(portfolio_file: Optional[str]) -> Optional[Mapping]:
     """Load portfolio data from file or return sample data."""
     if portfolio_file:
         try:
-            with open(portfolio_file, 'r') as f:
-                return json.load(f)
+            path = Path(portfolio_file)
+            return _read_portfolio_file(str(path.resolve()), path.stat().st_mtime_ns)
         except Exception as e:
             console.print(f"[red]Error loading portfolio file: {e}[/red]")
             return None
     else:
         # Return sample portfolio data for demo
-        return {
-            'holdings': [
-                {'symbol': 'BTC', 'quantity': 0.5, 'average_cost': 45000},
-                {'symbol': 'ETH', 'quantity': 2.0, 'average_cost': 3000},
-                {'symbol': 'ADA', 'quantity': 1000, 'average_cost': 1.2}
-            ],
-            'cash_balance': 5000
-        }
+        return SAMPLE_PORTFOLIO
 
 
 def _create_signals_panel(signals: Dict[str, str]) -> Panel:
@@ -458,18 +685,9 @@ def _create_signals_panel(signals: Dict[str, str]) -> Panel:
     table.add_column("Indicator", style="cyan")
     table.add_column("Signal", style="bold")
     
-    signal_colors = {
-        'BULLISH': 'green',
-        'BEARISH': 'red',
-        'OVERBOUGHT': 'yellow',
-        'OVERSOLD': 'blue',
-        'NEUTRAL': 'white'
-    }
-    
     for indicator, signal in signals.items():
-        color = signal_colors.get(signal.split('_')[0], 'white')
-        colored_signal = f"[{color}]{signal}[/{color}]"
-        table.add_row(indicator, colored_signal)
+        style = _SIGNAL_STYLES.get(signal.split('_', 1)[0], _NEUTRAL_SIGNAL_STYLE)
+        table.add_row(indicator, Text(signal, style=style))
     
     return Panel(table, title="Technical Signals", border_style="blue")
 
@@ -522,8 +740,7 @@ async def report(ctx, portfolio_file: Optional[str], report_type: str, output_fo
             task = progress.add_task("Generating report...", total=None)
 
             # Create portfolio snapshots
-            analyzer = PortfolioAnalyzer()
-            current_snapshot = await analyzer.create_portfolio_snapshot(portfolio_data['holdings'])
+            current_snapshot = await _get_portfolio_snapshot(portfolio_data['holdings'])
 
             # Create report configuration
             config = ReportConfig(
@@ -540,7 +757,7 @@ async def report(ctx, portfolio_file: Optional[str], report_type: str, output_fo
 
             # Generate report
             generator = ReportGenerator()
-            report_path = generator.generate_report(config, [current_snapshot])
+            report_path = await _in_thread(generator.generate_report, config, [current_snapshot])
 
             progress.update(task, completed=True)
 
@@ -599,8 +816,7 @@ async def export(ctx, portfolio_file: Optional[str], export_format: str, output_
             task = progress.add_task("Exporting data...", total=None)
 
             # Create portfolio snapshots
-            analyzer = PortfolioAnalyzer()
-            current_snapshot = await analyzer.create_portfolio_snapshot(portfolio_data['holdings'])
+            current_snapshot = await _get_portfolio_snapshot(portfolio_data['holdings'])
 
             # Create export configuration
             config = ExportConfig(
@@ -619,7 +835,7 @@ async def export(ctx, portfolio_file: Optional[str], export_format: str, output_
 
             # Export data
             exporter = DataExporter()
-            export_path = exporter.export_data([current_snapshot], config, output_file)
+            export_path = await _in_thread(exporter.export_data, [current_snapshot], config, output_file)
 
             progress.update(task, completed=True)
 
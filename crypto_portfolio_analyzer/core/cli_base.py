@@ -1,10 +1,84 @@
 """Base CLI classes to avoid circular imports."""
 
+import asyncio
+import atexit
+from typing import Any, Awaitable, Optional, TypeVar
+
 import click
-from typing import Any
 
 from .context import get_current_context, inherit_context, set_context, AppContext
 
+T = TypeVar('T')
+
+# Set once uvloop has been tried as the event loop policy
+_UVLOOP_CHECKED = False
+
+# Process-wide loop shared by every async command (see ``run_async``)
+_EVENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def install_uvloop() -> None:
+    """Use uvloop's event loop policy when it is installed (first call only)."""
+    global _UVLOOP_CHECKED
+    if _UVLOOP_CHECKED:
+        return
+    _UVLOOP_CHECKED = True
+
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine to completion on the process-wide CLI event loop.
+
+    Unlike ``asyncio.run``, the loop is created once and kept open for the
+    rest of the process, so application start-up and the command itself (or
+    several commands invoked in one process) share it. Objects bound to the
+    loop, such as the global data service's HTTP sessions, stay usable across
+    calls and the loop setup cost is paid only once.
+
+    On Ctrl+C the coroutine's task is cancelled and run until it finishes,
+    so its ``finally`` blocks and cleanup run, before KeyboardInterrupt is
+    re-raised.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    global _EVENT_LOOP
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        install_uvloop()
+        _EVENT_LOOP = asyncio.new_event_loop()
+        atexit.register(_close_event_loop, _EVENT_LOOP)
+    asyncio.set_event_loop(_EVENT_LOOP)
+    task = _EVENT_LOOP.create_task(coro)
+    try:
+        return _EVENT_LOOP.run_until_complete(task)
+    except KeyboardInterrupt:
+        task.cancel()
+        _EVENT_LOOP.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        raise
+
+
+def _close_event_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel leftover tasks and close the shared loop at interpreter exit."""
+    if loop.is_closed():
+        return
+    try:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
 
 class ContextAwareGroup(click.Group):
     """
@@ -6,19 +6,78 @@ from remote JSON schemas, cache them locally with ETag validation, and provide
 interactive autocompletion for shell environments.
 """
 
+import hashlib
 import json
 import logging
 import os
+import pickle
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import click
+import click.shell_completion
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so repeated schema and symbol fetches reuse pooled
+# connections (and their TLS handshakes); transient gateway errors are retried
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+# (parameter type, schema URL, schema path, cache dir, TTL) -> choices already
+# loaded in this process; constructing the same parameter again (repeated
+# commands in one process, tests, the REPL) skips the cache file entirely
+_loaded_choices: Dict[Tuple[type, str, str, str, int], Tuple[str, ...]] = {}
+
+
+def _read_cache(cache_file: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a choices cache file written by ``_write_cache``.
+    
+    Args:
+        cache_file: Path of the cache file
+        
+    Returns:
+        Cached metadata and choices, or None if the file is missing or unreadable
+    """
+    try:
+        with open(cache_file, 'rb') as f:
+            cache_data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError) as e:
+        logger.debug(f"Ignoring unreadable cache file {cache_file}: {e}")
+        return None
+    
+    return cache_data if isinstance(cache_data, dict) else None
+
+
+def _write_cache(cache_file: Path, cache_data: Dict[str, Any]) -> None:
+    """
+    Store extracted choices and their metadata in a binary cache file.
+    
+    Only the choices are kept, not the raw schema, so a cache hit loads a
+    short list instead of re-parsing a multi-megabyte JSON document.
+    
+    Args:
+        cache_file: Path of the cache file
+        cache_data: Metadata (timestamp, ETag, URL) and choices to store
+    """
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"Failed to write cache file {cache_file}: {e}")
+
 
 class SchemaValidatedChoice(click.Choice):
     """
@@ -29,6 +88,11 @@ class SchemaValidatedChoice(click.Choice):
     interactive autocompletion in supported shells.
     """
     
+    # Contents of the cache file, read at most once per instance and kept in
+    # step with what the instance writes
+    _cache_data: Optional[Dict[str, Any]] = None
+    _cache_loaded: bool = False
+    
     def __init__(
         self,
         schema_url: str,
@@ -62,79 +126,103 @@ class SchemaValidatedChoice(click.Choice):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize with cached or fetched choices
-        choices = self._get_choices()
+        choices = self._load_choices_once(self._get_choices)
         super().__init__(choices, case_sensitive=case_sensitive)
     
+    def _load_choices_once(self, load: Callable[[], List[str]]) -> List[str]:
+        """
+        Load the choices at most once per process for this parameter's configuration.
+        
+        Args:
+            load: Loader used on the first construction; fallback choices it
+                returns are not memoized so a later construction can retry
+            
+        Returns:
+            List of valid choices
+        """
+        key = (type(self), self.schema_url, self.schema_path, str(self.cache_dir), self.cache_ttl)
+        choices = _loaded_choices.get(key)
+        if choices is None:
+            loaded = load()
+            if loaded is self.fallback_choices:
+                return loaded
+            choices = _loaded_choices[key] = tuple(loaded)
+        return list(choices)
+    
     def _get_cache_file(self) -> Path:
-        """Get the cache file path for this schema."""
-        # Create a safe filename from the URL
-        url_hash = str(hash(self.schema_url))
-        return self.cache_dir / f"schema_{url_hash}.json"
+        """Get the cache file path for this schema and choices path."""
+        # Create a safe filename from the URL and schema path, as the file
+        # holds the choices extracted at that path; a digest rather than
+        # hash(), which is randomized per interpreter run
+        source = f"{self.schema_url}\0{self.schema_path}".encode('utf-8')
+        source_hash = hashlib.blake2b(source, digest_size=8).hexdigest()
+        return self.cache_dir / f"schema_{source_hash}.pickle"
+    
+    def _load_cache(self) -> Optional[Dict[str, Any]]:
+        """Get the cached choices and metadata, reading the cache file only once."""
+        if not self._cache_loaded:
+            self._cache_data = _read_cache(self._get_cache_file())
+            self._cache_loaded = True
+        return self._cache_data
     
-    def _is_cache_valid(self, cache_file: Path) -> bool:
-        """Check if the cache file is still valid."""
-        if not cache_file.exists():
+    def _store_cache(self, cache_data: Dict[str, Any]) -> None:
+        """Write the cache file and keep the in-memory copy in step."""
+        _write_cache(self._get_cache_file(), cache_data)
+        self._cache_data = cache_data
+        self._cache_loaded = True
+    
+    def _is_cache_valid(self) -> bool:
+        """Check if the cached choices are still valid."""
+        cache_data = self._load_cache()
+        if cache_data is None:
             return False
         
-        try:
-            with open(cache_file, 'r') as f:
-                cache_data = json.load(f)
-            
-            # Check TTL
-            cached_time = cache_data.get('timestamp', 0)
-            if time.time() - cached_time > self.cache_ttl:
-                return False
-            
-            return True
-            
-        except (json.JSONDecodeError, KeyError, OSError):
-            return False
+        # Check TTL
+        cached_time = cache_data.get('timestamp', 0)
+        return time.time() - cached_time <= self.cache_ttl
     
     def _fetch_schema(self) -> Optional[Dict[str, Any]]:
         """Fetch the schema from the remote URL."""
         try:
-            # Get cached ETag if available
-            cache_file = self._get_cache_file()
-            etag = None
-            
-            if cache_file.exists():
-                try:
-                    with open(cache_file, 'r') as f:
-                        cache_data = json.load(f)
-                        etag = cache_data.get('etag')
-                except (json.JSONDecodeError, OSError):
-                    pass
+            # Get cached validators if available
+            cache_data = self._load_cache() or {}
+            etag = cache_data.get('etag')
+            last_modified = cache_data.get('last_modified')
             
-            # Prepare headers
+            # Prepare headers; servers honour either validator, so both are
+            # sent to revalidate even when the ETag has been rotated
             headers = {'User-Agent': 'crypto-portfolio-analyzer/1.0'}
             if etag:
                 headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
             
             # Fetch schema
-            response = requests.get(
+            response = _SESSION.get(
                 self.schema_url,
                 headers=headers,
                 timeout=self.timeout
             )
             
-            # Handle 304 Not Modified
+            # Handle 304 Not Modified; the cached choices are current again,
+            # so their TTL restarts
             if response.status_code == 304:
                 logger.debug(f"Schema not modified: {self.schema_url}")
+                if cache_data:
+                    self._store_cache(dict(cache_data, timestamp=time.time()))
                 return None
             
             response.raise_for_status()
             schema = response.json()
             
-            # Cache the schema with metadata
-            cache_data = {
-                'schema': schema,
+            # Cache the extracted choices with metadata
+            self._store_cache({
+                'choices': self._extract_choices_from_schema(schema),
                 'timestamp': time.time(),
                 'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
                 'url': self.schema_url
-            }
-            
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            })
             
             logger.debug(f"Fetched and cached schema: {self.schema_url}")
             return schema
@@ -176,20 +264,12 @@ class SchemaValidatedChoice(click.Choice):
     
     def _get_choices(self) -> List[str]:
         """Get the list of valid choices."""
-        cache_file = self._get_cache_file()
-        
         # Try to use cached data if valid
-        if self._is_cache_valid(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                    schema = cache_data['schema']
-                    choices = self._extract_choices_from_schema(schema)
-                    if choices:
-                        logger.debug(f"Using cached choices: {len(choices)} items")
-                        return choices
-            except (json.JSONDecodeError, KeyError, OSError):
-                pass
+        if self._is_cache_valid():
+            choices = self._load_cache().get('choices')
+            if choices:
+                logger.debug(f"Using cached choices: {len(choices)} items")
+                return choices
         
         # Fetch fresh schema
         schema = self._fetch_schema()
@@ -199,17 +279,11 @@ class SchemaValidatedChoice(click.Choice):
                 return choices
         
         # Use cached data even if expired as fallback
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                    schema = cache_data['schema']
-                    choices = self._extract_choices_from_schema(schema)
-                    if choices:
-                        logger.info(f"Using expired cached choices: {len(choices)} items")
-                        return choices
-            except (json.JSONDecodeError, KeyError, OSError):
-                pass
+        cache_data = self._load_cache()
+        choices = cache_data.get('choices') if cache_data else None
+        if choices:
+            logger.info(f"Using expired cached choices: {len(choices)} items")
+            return choices
         
         # Final fallback
         logger.warning(f"Using fallback choices for {self.schema_url}")
@@ -218,7 +292,7 @@ class SchemaValidatedChoice(click.Choice):
     def shell_complete(self, ctx: click.Context, param: click.Parameter, incomplete: str) -> List[click.shell_completion.CompletionItem]:
         """Provide shell autocompletion."""
         # Refresh choices if needed
-        if not self._is_cache_valid(self._get_cache_file()):
+        if not self._is_cache_valid():
             try:
                 self.choices = self._get_choices()
             except Exception:
@@ -264,28 +338,21 @@ class CryptocurrencySymbol(SchemaValidatedChoice):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize with cached or fetched choices
-        choices = self._get_crypto_symbols()
+        choices = self._load_choices_once(self._get_crypto_symbols)
         click.Choice.__init__(self, choices, case_sensitive=defaults['case_sensitive'])
     
     def _get_crypto_symbols(self) -> List[str]:
         """Get cryptocurrency symbols from CoinGecko API."""
-        cache_file = self._get_cache_file()
-        
         # Try cached data first
-        if self._is_cache_valid(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                    symbols = cache_data.get('symbols', [])
-                    if symbols:
-                        logger.debug(f"Using cached crypto symbols: {len(symbols)} items")
-                        return symbols
-            except (json.JSONDecodeError, KeyError, OSError):
-                pass
+        if self._is_cache_valid():
+            symbols = self._load_cache().get('choices')
+            if symbols:
+                logger.debug(f"Using cached crypto symbols: {len(symbols)} items")
+                return symbols
         
         # Fetch from API
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 self.schema_url,
                 timeout=self.timeout,
                 headers={'User-Agent': 'crypto-portfolio-analyzer/1.0'}
@@ -299,14 +366,11 @@ class CryptocurrencySymbol(SchemaValidatedChoice):
             symbols = sorted(list(set(symbols)))
             
             # Cache the symbols
-            cache_data = {
-                'symbols': symbols,
+            self._store_cache({
+                'choices': symbols,
                 'timestamp': time.time(),
                 'url': self.schema_url
-            }
-            
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            })
             
             logger.debug(f"Fetched and cached {len(symbols)} crypto symbols")
             return symbols
@@ -315,16 +379,11 @@ class CryptocurrencySymbol(SchemaValidatedChoice):
             logger.warning(f"Failed to fetch crypto symbols: {e}")
             
             # Try expired cache as fallback
-            if cache_file.exists():
-                try:
-                    with open(cache_file, 'r') as f:
-                        cache_data = json.load(f)
-                        symbols = cache_data.get('symbols', [])
-                        if symbols:
-                            logger.info(f"Using expired cached symbols: {len(symbols)} items")
-                            return symbols
-                except (json.JSONDecodeError, KeyError, OSError):
-                    pass
+            cache_data = self._load_cache()
+            symbols = cache_data.get('choices') if cache_data else None
+            if symbols:
+                logger.info(f"Using expired cached symbols: {len(symbols)} items")
+                return symbols
             
             # Final fallback
             logger.warning("Using fallback crypto symbols")
@@ -11,13 +11,18 @@ import logging
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 import yaml
 from dotenv import load_dotenv
 from cryptography.fernet import Fernet
 import base64
 import json
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +41,8 @@ class SecretManager:
     
     def __init__(self, secrets_file: Path, kms_key_id: Optional[str] = None):
         self.secrets_file = secrets_file
+        # Plain-text list of secret names, so they can be listed without a decrypt
+        self.index_file = secrets_file.with_name(secrets_file.name + ".index")
         self.kms_key_id = kms_key_id
         self._fernet: Optional[Fernet] = None
         self._key_created_at: Optional[datetime] = None
@@ -179,12 +186,30 @@ class SecretManager:
             with open(self.secrets_file, 'wb') as f:
                 f.write(encrypted_data)
             
+            with open(self.index_file, 'w') as f:
+                json.dump(sorted(secrets), f)
+            
             logger.debug(f"Saved {len(secrets)} secrets")
             
         except Exception as e:
             logger.error(f"Failed to save secrets: {e}")
             raise ConfigError(f"Failed to save secrets: {e}")
     
+    async def list_keys(self) -> List[str]:
+        """List secret names without decrypting the secret values.
+        
+        Falls back to decrypting the secrets file when no index has been
+        written yet (for example, secrets saved by an older version).
+        """
+        if not self.secrets_file.exists():
+            return []
+        
+        try:
+            with open(self.index_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return sorted(await self.load_secrets())
+    
     async def get_secret(self, key: str) -> Optional[str]:
         """Get a specific secret."""
         secrets = await self.load_secrets()
@@ -275,7 +300,7 @@ class ConfigManager:
             if config_file.exists():
                 try:
                     with open(config_file, 'r') as f:
-                        file_config = yaml.safe_load(f) or {}
+                        file_config = yaml.load(f, Loader=_YamlLoader) or {}
                     
                     # Merge configuration
                     self._merge_config(self._config, file_config)
@@ -379,6 +404,10 @@ class ConfigManager:
         """Set a secret value."""
         await self._secret_manager.set_secret(key, value)
     
+    async def list_secret_keys(self) -> List[str]:
+        """List secret names without decrypting their values."""
+        return await self._secret_manager.list_keys()
+    
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration (excluding secrets)."""
         config = self._config.copy()
@@ -0,0 +1,18 @@
+"""Sample portfolio shared by the analytics and visualization commands.
+
+Kept out of the analytics package, whose ``__init__`` imports scipy, so the
+commands can use it without loading the analyzers.
+"""
+
+from types import MappingProxyType
+
+# Sample portfolio used when no --portfolio-file is given, built once and
+# read-only since every caller shares it
+SAMPLE_PORTFOLIO = MappingProxyType({
+    'holdings': (
+        {'symbol': 'BTC', 'quantity': 0.5, 'average_cost': 45000},
+        {'symbol': 'ETH', 'quantity': 2.0, 'average_cost': 3000},
+        {'symbol': 'ADA', 'quantity': 1000, 'average_cost': 1.2},
+    ),
+    'cash_balance': 5000,
+})
@@ -0,0 +1,101 @@
+"""
+JSON serialization helpers shared by the CLI commands.
+
+orjson is used when it is installed and the standard library ``json`` module
+is used otherwise, so callers get the same string output either way.
+Dataclass instances are serialized as objects, enums as their values and
+numpy scalars and arrays as plain numbers and lists by both backends.
+"""
+
+import dataclasses
+import json
+from enum import Enum
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(obj: Any, indent: bool = True,
+               default: Optional[Callable[[Any], Any]] = str) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a two space indent
+        default: Fallback for types the encoder does not support natively
+
+    Returns:
+        JSON document as a string
+    """
+    if ORJSON_AVAILABLE:
+        return _orjson_dumps(obj, indent, default).decode('utf-8')
+
+    return json.dumps(obj, indent=2 if indent else None, default=_shared_default(default))
+
+
+def dumps_json_bytes(obj: Any, indent: bool = True,
+                     default: Optional[Callable[[Any], Any]] = str) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON, ready to write to a file.
+
+    Non-ASCII characters are written as-is rather than escaped.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a two space indent
+        default: Fallback for types the encoder does not support natively
+
+    Returns:
+        JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        return _orjson_dumps(obj, indent, default)
+
+    return json.dumps(obj, indent=2 if indent else None, default=_shared_default(default),
+                      ensure_ascii=False).encode('utf-8')
+
+
+def _orjson_dumps(obj: Any, indent: bool, default: Optional[Callable[[Any], Any]]) -> bytes:
+    """Serialize with orjson using the options shared by the dump helpers."""
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=_shared_default(default), option=option)
+
+
+def _shared_default(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Wrap a caller's ``default`` so both backends encode the same types alike."""
+    def encode(obj: Any) -> Any:
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return obj.__dict__
+        if isinstance(obj, Enum):
+            return obj.value
+        if type(obj).__module__ == 'numpy':
+            # numpy scalars expose item() and arrays tolist(); checked by
+            # module so numpy is not imported just to serialize
+            return obj.tolist() if hasattr(obj, 'shape') and obj.shape else obj.item()
+        if default is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return default(obj)
+    return encode
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON document as text or bytes
+
+    Returns:
+        Parsed Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+
+    return json.loads(data)
@@ -307,11 +307,17 @@ class BaseAPIClient(ABC):
 class APIClientManager:
     """Manages multiple API clients with failover support."""
     
-    def __init__(self):
-        """Initialize API client manager."""
+    def __init__(self, max_concurrent_requests: int = 8):
+        """Initialize API client manager.
+        
+        Args:
+            max_concurrent_requests: Maximum per-symbol requests in flight when
+                falling back to individual price lookups
+        """
         self._clients: Dict[DataSource, BaseAPIClient] = {}
         self._primary_source: Optional[DataSource] = None
         self._fallback_sources: List[DataSource] = []
+        self.max_concurrent_requests = max_concurrent_requests
     
     def register_client(self, client: BaseAPIClient, is_primary: bool = False):
         """Register an API client.
@@ -397,9 +403,15 @@ class APIClientManager:
                 except Exception as e:
                     logger.warning(f"Fallback source {source.value} failed for multiple prices: {e}")
 
-        # If all sources fail, try individual requests as last resort
-        for symbol in symbols:
-            price = await self.get_current_price(symbol, currency)
+        # If all sources fail, try individual requests as last resort,
+        # running a bounded number of them at a time
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def fetch(symbol: str) -> Optional[CryptocurrencyPrice]:
+            async with semaphore:
+                return await self.get_current_price(symbol, currency)
+
+        for price in await asyncio.gather(*(fetch(symbol) for symbol in symbols)):
             if price:
                 prices.append(price)
 
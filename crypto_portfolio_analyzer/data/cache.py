@@ -4,12 +4,13 @@ import asyncio
 import json
 import hashlib
 from datetime import datetime, timezone, timedelta
-from typing import Any, Optional, Dict, List, Callable, Union
+from typing import Any, Optional, Dict, List, Callable, Tuple, Union
 from dataclasses import dataclass, field
 from collections import OrderedDict
 import logging
 
 from .models import CacheEntry
+from ..core.serialization import dumps_json, loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,7 @@ class CacheConfig:
     max_size: int = 1000    # Maximum number of cache entries
     cleanup_interval: int = 600  # Cleanup every 10 minutes
     enable_persistence: bool = True  # Save cache to database
+    persistent_prefixes: Tuple[str, ...] = ('historical:',)  # Keys read/written through to the database
     enable_compression: bool = False  # Compress large cache values
 
 
@@ -101,27 +103,42 @@ class CacheManager:
         Returns:
             Cached value or default
         """
+        cache_key = self._normalize_key(key)
+        
         async with self._cache_lock:
-            cache_key = self._normalize_key(key)
-            
             if cache_key in self._memory_cache:
                 entry = self._memory_cache[cache_key]
                 
                 # Check if entry has expired
                 if entry.is_expired:
                     del self._memory_cache[cache_key]
-                    self._stats['misses'] += 1
-                    return default
+                else:
+                    # Move to end (most recently used)
+                    self._memory_cache.move_to_end(cache_key)
+                    entry.access()
+                    self._stats['hits'] += 1
+                    
+                    return entry.value
+        
+        # Persistent keys survive across processes in the database
+        if self._is_persistent(cache_key):
+            stored = await self.db_manager.get_cache_entry(cache_key)
+            if stored is not None:
+                value, expires_at = stored
+                entry = CacheEntry(key=cache_key, value=loads_json(value), expires_at=expires_at)
                 
-                # Move to end (most recently used)
-                self._memory_cache.move_to_end(cache_key)
-                entry.access()
-                self._stats['hits'] += 1
+                async with self._cache_lock:
+                    self._memory_cache[cache_key] = entry
+                    self._memory_cache.move_to_end(cache_key)
+                    await self._evict_if_needed()
+                    self._stats['size'] = len(self._memory_cache)
+                    self._stats['hits'] += 1
                 
                 return entry.value
-            
+        
+        async with self._cache_lock:
             self._stats['misses'] += 1
-            return default
+        return default
     
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in cache.
@@ -158,8 +175,12 @@ class CacheManager:
             await self._evict_if_needed()
             
             self._stats['size'] = len(self._memory_cache)
-            
-            return True
+        
+        if self._is_persistent(cache_key):
+            return await self.db_manager.save_cache_entry(cache_key, dumps_json(value, indent=False),
+                                                          expires_at)
+        
+        return True
     
     async def delete(self, key: str) -> bool:
         """Delete value from cache.
@@ -173,12 +194,16 @@ class CacheManager:
         async with self._cache_lock:
             cache_key = self._normalize_key(key)
             
-            if cache_key in self._memory_cache:
+            deleted = cache_key in self._memory_cache
+            if deleted:
                 del self._memory_cache[cache_key]
                 self._stats['size'] = len(self._memory_cache)
-                return True
-            
-            return False
+        
+        # Otherwise the persisted copy would be read back on the next get
+        if self._is_persistent(cache_key):
+            deleted |= bool(await self.db_manager.delete_cache_entries(_glob_escape(cache_key)))
+        
+        return deleted
     
     async def clear(self) -> int:
         """Clear all cache entries.
@@ -187,10 +212,15 @@ class CacheManager:
             Number of entries cleared
         """
         async with self._cache_lock:
-            count = len(self._memory_cache)
+            cleared = set(self._memory_cache)
             self._memory_cache.clear()
             self._stats['size'] = 0
-            return count
+        
+        if self.config.enable_persistence and self.db_manager:
+            for prefix in self.config.persistent_prefixes:
+                cleared.update(await self.db_manager.delete_cache_entries(_glob_escape(prefix) + '*'))
+        
+        return len(cleared)
     
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache.
@@ -269,7 +299,12 @@ class CacheManager:
                 del self._memory_cache[key]
             
             self._stats['size'] = len(self._memory_cache)
-            return len(keys_to_delete)
+        
+        invalidated = set(keys_to_delete)
+        if self.config.enable_persistence and self.db_manager:
+            invalidated.update(await self.db_manager.delete_cache_entries(pattern))
+        
+        return len(invalidated)
     
     def _normalize_key(self, key: str) -> str:
         """Normalize cache key for consistency.
@@ -286,6 +321,11 @@ class CacheManager:
         
         return key.lower().strip()
     
+    def _is_persistent(self, cache_key: str) -> bool:
+        """Check whether a normalized key is stored in the database as well as memory."""
+        return (self.config.enable_persistence and self.db_manager is not None
+                and cache_key.startswith(self.config.persistent_prefixes))
+    
     async def _evict_if_needed(self):
         """Evict least recently used entries if cache is full."""
         while len(self._memory_cache) > self.config.max_size:
@@ -354,6 +394,11 @@ class CacheManager:
             logger.error(f"Failed to save cache to database: {e}")
 
 
+def _glob_escape(text: str) -> str:
+    """Escape SQLite GLOB wildcards so ``text`` matches only itself."""
+    return ''.join(f'[{char}]' if char in '*?[' else char for char in text)
+
+
 # Global cache instance
 _global_cache: Optional[CacheManager] = None
 
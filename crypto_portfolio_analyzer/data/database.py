@@ -4,7 +4,7 @@ import sqlite3
 import asyncio
 import aiosqlite
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Tuple, Union
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 import json
@@ -300,6 +300,44 @@ class DatabaseManager:
             logger.error(f"Failed to get historical prices for {symbol}: {e}")
             return []
     
+    async def get_historical_prices_batch(self, symbols: List[str], start_date: datetime,
+                                        end_date: datetime,
+                                        currency: str = "usd") -> Dict[str, List[HistoricalPrice]]:
+        """Get historical prices for several symbols with a single query.
+        
+        Args:
+            symbols: Cryptocurrency symbols
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            currency: Price currency
+            
+        Returns:
+            Dictionary mapping each upper-case symbol to its HistoricalPrice
+            instances in time order; symbols without data map to an empty list
+        """
+        prices_map = {symbol.upper(): [] for symbol in symbols}
+        if not prices_map:
+            return prices_map
+        
+        placeholders = ", ".join("?" * len(prices_map))
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                db.row_factory = aiosqlite.Row
+                
+                async with db.execute(f"""
+                    SELECT * FROM historical_prices 
+                    WHERE symbol IN ({placeholders}) AND currency = ? 
+                    AND timestamp BETWEEN ? AND ?
+                    ORDER BY timestamp ASC
+                """, (*prices_map, currency, start_date.isoformat(), end_date.isoformat())) as cursor:
+                    async for row in cursor:
+                        prices_map[row['symbol']].append(self._row_to_historical_price(row))
+        except Exception as e:
+            logger.error(f"Failed to get historical prices for {', '.join(prices_map)}: {e}")
+            return {symbol: [] for symbol in prices_map}
+        
+        return prices_map
+    
     def _row_to_historical_price(self, row: aiosqlite.Row) -> HistoricalPrice:
         """Convert database row to HistoricalPrice instance."""
         return HistoricalPrice(
@@ -312,6 +350,80 @@ class DatabaseManager:
             data_source=DataSource(row['data_source'])
         )
     
+    async def get_cache_entry(self, cache_key: str) -> Optional[Tuple[str, Optional[datetime]]]:
+        """Get an unexpired persisted cache entry.
+        
+        Args:
+            cache_key: Normalized cache key
+            
+        Returns:
+            Tuple of the serialized value and its expiry time, or None if not found
+        """
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                async with db.execute("""
+                    SELECT value, expires_at FROM cache_entries 
+                    WHERE cache_key = ? AND (expires_at IS NULL OR expires_at > ?)
+                """, (cache_key, datetime.now(timezone.utc).isoformat())) as cursor:
+                    row = await cursor.fetchone()
+        except Exception as e:
+            logger.error(f"Failed to get cache entry {cache_key}: {e}")
+            return None
+        
+        if row is None:
+            return None
+        
+        return row[0], datetime.fromisoformat(row[1]) if row[1] else None
+    
+    async def save_cache_entry(self, cache_key: str, value: str,
+                               expires_at: Optional[datetime] = None) -> bool:
+        """Save a cache entry, replacing any entry with the same key.
+        
+        Args:
+            cache_key: Normalized cache key
+            value: Serialized value
+            expires_at: Expiry time; never expires when None
+            
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute("""
+                    INSERT OR REPLACE INTO cache_entries (cache_key, value, expires_at)
+                    VALUES (?, ?, ?)
+                """, (cache_key, value, expires_at.isoformat() if expires_at else None))
+                await db.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Failed to save cache entry {cache_key}: {e}")
+            return False
+    
+    async def delete_cache_entries(self, pattern: str) -> List[str]:
+        """Delete persisted cache entries whose key matches a pattern.
+        
+        Args:
+            pattern: Key pattern using ``*`` and ``?`` wildcards; a key without
+                wildcards deletes just that entry
+        
+        Returns:
+            Keys of the deleted entries
+        """
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                async with db.execute("""
+                    SELECT cache_key FROM cache_entries WHERE cache_key GLOB ?
+                """, (pattern,)) as cursor:
+                    keys = [row[0] for row in await cursor.fetchall()]
+                
+                if keys:
+                    await db.execute("DELETE FROM cache_entries WHERE cache_key GLOB ?", (pattern,))
+                    await db.commit()
+                return keys
+        except Exception as e:
+            logger.error(f"Failed to delete cache entries {pattern}: {e}")
+            return []
+    
     async def cleanup_old_data(self, days_to_keep: int = 365) -> int:
         """Clean up old data beyond retention period.
         
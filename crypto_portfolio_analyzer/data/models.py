@@ -7,6 +7,8 @@ from typing import Optional, Dict, Any, List
 from enum import Enum
 import json
 
+import numpy as np
+
 
 class DataSource(Enum):
     """Supported data sources."""
@@ -133,6 +135,85 @@ class HistoricalPrice:
         
         if self.timestamp.tzinfo is None:
             self.timestamp = self.timestamp.replace(tzinfo=timezone.utc)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization.
+        
+        Decimals are written as strings so they round-trip exactly.
+        """
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.timestamp.isoformat(),
+            'price': str(self.price),
+            'currency': self.currency,
+            'volume': str(self.volume) if self.volume is not None else None,
+            'market_cap': str(self.market_cap) if self.market_cap is not None else None,
+            'data_source': self.data_source.value
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HistoricalPrice':
+        """Create instance from dictionary."""
+        return cls(
+            symbol=data['symbol'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            price=Decimal(str(data['price'])),
+            currency=data.get('currency', 'usd'),
+            volume=Decimal(str(data['volume'])) if data.get('volume') is not None else None,
+            market_cap=Decimal(str(data['market_cap'])) if data.get('market_cap') is not None else None,
+            data_source=DataSource(data.get('data_source', DataSource.COINGECKO.value))
+        )
+
+
+def price_array(historical_prices: List[HistoricalPrice]) -> np.ndarray:
+    """Convert the prices of historical data points to a float64 array.
+    
+    The array is filled in place from a generator, without an intermediate
+    list of floats.
+    
+    Args:
+        historical_prices: Historical price data points, in the order wanted
+        
+    Returns:
+        Array of prices
+    """
+    return np.fromiter((float(p.price) for p in historical_prices), dtype=np.float64,
+                       count=len(historical_prices))
+
+
+@dataclass
+class PriceSeries:
+    """Historical prices sorted by time, with numeric columns as float64 arrays."""
+    
+    timestamps: List[datetime]
+    closes: np.ndarray
+    volumes: np.ndarray
+    raw: List[HistoricalPrice] = field(default_factory=list)
+    
+    @classmethod
+    def from_prices(cls, historical_prices: List[HistoricalPrice]) -> 'PriceSeries':
+        """Sort price points by time and convert their Decimals to floats once.
+        
+        Args:
+            historical_prices: Historical price data points
+            
+        Returns:
+            PriceSeries with volumes of 0 where unknown
+        """
+        raw = sorted(historical_prices, key=lambda x: x.timestamp)
+        count = len(raw)
+        
+        return cls(
+            timestamps=[p.timestamp for p in raw],
+            closes=price_array(raw),
+            volumes=np.fromiter((float(p.volume) if p.volume else 0.0 for p in raw),
+                                dtype=np.float64, count=count),
+            raw=raw
+        )
+    
+    def __len__(self) -> int:
+        """Number of price points."""
+        return len(self.timestamps)
 
 
 @dataclass
@@ -6,7 +6,7 @@ from typing import List, Optional, Dict, Any
 from decimal import Decimal
 import logging
 
-from .models import CryptocurrencyPrice, HistoricalPrice, DataSource
+from .models import CryptocurrencyPrice, HistoricalPrice, PriceSeries, DataSource
 from .database import DatabaseManager
 from .cache import CacheManager, cache_key_for_price, cache_key_for_historical
 from .api_client import APIClientManager
@@ -14,6 +14,9 @@ from .clients.coingecko import CoinGeckoClient
 
 logger = logging.getLogger(__name__)
 
+# Cache lifetime for historical windows that ended before today (30 days)
+CLOSED_WINDOW_CACHE_TTL = 30 * 24 * 3600
+
 
 class DataService:
     """Service for aggregating cryptocurrency data from multiple sources."""
@@ -143,10 +146,14 @@ class DataService:
         
         # Check cache for each symbol
         if use_cache and self.cache_manager:
-            for symbol in symbols:
-                cache_key = await cache_key_for_price(symbol, currency)
-                cached_price = await self.cache_manager.get(cache_key)
-                
+            cache_keys = await asyncio.gather(
+                *(cache_key_for_price(symbol, currency) for symbol in symbols)
+            )
+            cached_prices = await asyncio.gather(
+                *(self.cache_manager.get(cache_key) for cache_key in cache_keys)
+            )
+            
+            for symbol, cached_price in zip(symbols, cached_prices):
                 if cached_price:
                     prices.append(CryptocurrencyPrice.from_dict(cached_price))
                     logger.debug(f"Cache hit for {symbol} price")
@@ -197,29 +204,64 @@ class DataService:
             cached_prices = await self.cache_manager.get(cache_key)
             if cached_prices:
                 logger.debug(f"Cache hit for {symbol} historical data")
-                return [HistoricalPrice(**price_data) for price_data in cached_prices]
+                return [HistoricalPrice.from_dict(price_data) for price_data in cached_prices]
         
         # Try database first for historical data
         if self.db_manager:
             db_prices = await self.db_manager.get_historical_prices(symbol, start_date, end_date, currency)
             
-            # Check if we have sufficient data coverage
-            if db_prices:
-                db_start = min(p.timestamp for p in db_prices)
-                db_end = max(p.timestamp for p in db_prices)
+            # If database covers the requested range, use it
+            if self._covers_range(db_prices, start_date, end_date):
+                logger.debug(f"Using database historical data for {symbol}")
                 
-                # If database covers the requested range, use it
-                if db_start <= start_date and db_end >= end_date:
-                    logger.debug(f"Using database historical data for {symbol}")
-                    
-                    # Cache the result
-                    if use_cache and self.cache_manager:
-                        price_dicts = [price.__dict__ for price in db_prices]
-                        await self.cache_manager.set(cache_key, price_dicts, cache_ttl)
-                    
-                    return db_prices
+                # Cache the result
+                if use_cache:
+                    await self._cache_historical(cache_key, db_prices, end_date, cache_ttl)
+                
+                return db_prices
         
         # Fetch from API if not in database or insufficient coverage
+        return await self._fetch_historical_prices(symbol, start_date, end_date, currency,
+                                                   cache_key if use_cache else None, cache_ttl)
+    
+    @staticmethod
+    def _covers_range(prices: List[HistoricalPrice], start_date: datetime, end_date: datetime) -> bool:
+        """Check whether stored prices span the whole requested date range."""
+        if not prices:
+            return False
+        return (min(p.timestamp for p in prices) <= start_date
+                and max(p.timestamp for p in prices) >= end_date)
+    
+    async def _cache_historical(self, cache_key: str, prices: List[HistoricalPrice],
+                                end_date: datetime, cache_ttl: int) -> None:
+        """Store historical prices in the cache, if there is one.
+        
+        A window that ended before today can no longer change, so it is kept
+        for ``CLOSED_WINDOW_CACHE_TTL`` instead of ``cache_ttl``.
+        """
+        if self.cache_manager:
+            if end_date.date() < datetime.now(timezone.utc).date():
+                cache_ttl = max(cache_ttl, CLOSED_WINDOW_CACHE_TTL)
+            price_dicts = [price.to_dict() for price in prices]
+            await self.cache_manager.set(cache_key, price_dicts, cache_ttl)
+    
+    async def _fetch_historical_prices(self, symbol: str, start_date: datetime,
+                                       end_date: datetime, currency: str,
+                                       cache_key: Optional[str],
+                                       cache_ttl: int) -> List[HistoricalPrice]:
+        """Fetch historical prices from the API, saving and caching them.
+        
+        Args:
+            symbol: Upper-case cryptocurrency symbol
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            currency: Target currency
+            cache_key: Cache key to store the result under; not cached when None
+            cache_ttl: Cache time-to-live in seconds
+            
+        Returns:
+            List of HistoricalPrice instances, empty when unavailable
+        """
         if self.client_manager:
             # Try to get a client (preferably CoinGecko)
             client = self.client_manager.get_client(DataSource.COINGECKO)
@@ -233,15 +275,112 @@ class DataService:
                         logger.info(f"Saved {saved_count} historical prices for {symbol}")
                     
                     # Cache the result
-                    if use_cache and self.cache_manager:
-                        price_dicts = [price.__dict__ for price in api_prices]
-                        await self.cache_manager.set(cache_key, price_dicts, cache_ttl)
+                    if cache_key is not None:
+                        await self._cache_historical(cache_key, api_prices, end_date, cache_ttl)
                     
                     return api_prices
         
         logger.warning(f"Could not get historical prices for {symbol}")
         return []
     
+    async def get_historical_prices_bulk(self, symbols: List[str], start_date: datetime,
+                                       end_date: datetime, currency: str = "usd",
+                                       use_cache: bool = True,
+                                       cache_ttl: int = 3600,
+                                       max_concurrency: int = 8) -> Dict[str, List[HistoricalPrice]]:
+        """Get historical prices for several cryptocurrencies at once.
+        
+        Cached histories are used first. The remaining symbols are looked up
+        in the database with one query, and only the symbols it does not
+        cover are fetched from the API, concurrently but at most
+        ``max_concurrency`` at a time to stay within provider rate limits.
+        A symbol whose fetch fails maps to an empty list.
+        
+        Args:
+            symbols: List of cryptocurrency symbols
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            currency: Target currency
+            use_cache: Whether to use cached data
+            cache_ttl: Cache time-to-live in seconds
+            max_concurrency: Maximum API fetches in flight
+            
+        Returns:
+            Dictionary mapping upper-case symbols to their HistoricalPrice lists,
+            in the order the symbols were given
+        """
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        cache_keys = {
+            symbol: await cache_key_for_historical(symbol, start_date, end_date, currency)
+            for symbol in symbols
+        }
+        prices_map = dict.fromkeys(symbols)
+        
+        # Try cache first if enabled
+        if use_cache and self.cache_manager:
+            for symbol in symbols:
+                cached_prices = await self.cache_manager.get(cache_keys[symbol])
+                if cached_prices:
+                    logger.debug(f"Cache hit for {symbol} historical data")
+                    prices_map[symbol] = [HistoricalPrice.from_dict(price_data) for price_data in cached_prices]
+        
+        # One database query for every symbol the cache missed
+        missing = [symbol for symbol in symbols if prices_map[symbol] is None]
+        if missing and self.db_manager:
+            db_map = await self.db_manager.get_historical_prices_batch(
+                missing, start_date, end_date, currency
+            )
+            for symbol in missing:
+                db_prices = db_map.get(symbol, [])
+                if self._covers_range(db_prices, start_date, end_date):
+                    logger.debug(f"Using database historical data for {symbol}")
+                    if use_cache:
+                        await self._cache_historical(cache_keys[symbol], db_prices, end_date, cache_ttl)
+                    prices_map[symbol] = db_prices
+        
+        # API fetches for whatever is left
+        missing = [symbol for symbol in symbols if prices_map[symbol] is None]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(symbol: str) -> List[HistoricalPrice]:
+            async with semaphore:
+                return await self._fetch_historical_prices(
+                    symbol, start_date, end_date, currency,
+                    cache_keys[symbol] if use_cache else None, cache_ttl
+                )
+        
+        results = await asyncio.gather(*(fetch(symbol) for symbol in missing),
+                                       return_exceptions=True)
+        
+        for symbol, result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error getting historical prices for {symbol}: {result}")
+                result = []
+            prices_map[symbol] = result
+        
+        return prices_map
+    
+    async def get_price_series(self, symbol: str, start_date: datetime,
+                               end_date: datetime, currency: str = "usd",
+                               use_cache: bool = True, cache_ttl: int = 3600) -> PriceSeries:
+        """Get historical prices for a cryptocurrency as numeric columns.
+        
+        Args:
+            symbol: Cryptocurrency symbol
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            currency: Target currency
+            use_cache: Whether to use cached data
+            cache_ttl: Cache time-to-live in seconds
+            
+        Returns:
+            PriceSeries sorted by time, keeping the HistoricalPrice objects in ``raw``
+        """
+        historical_prices = await self.get_historical_prices(
+            symbol, start_date, end_date, currency, use_cache, cache_ttl
+        )
+        return PriceSeries.from_prices(historical_prices)
+    
     async def refresh_price_data(self, symbols: List[str], currency: str = "usd") -> Dict[str, bool]:
         """Refresh price data for multiple symbols.
         
@@ -357,27 +496,49 @@ class DataService:
 # Global data service instance
 _global_data_service: Optional[DataService] = None
 
+# In-flight initialization shared by concurrent first callers
+_data_service_init: Optional["asyncio.Future[DataService]"] = None
 
-async def get_data_service() -> DataService:
-    """Get global data service instance."""
-    global _global_data_service
+
+async def _create_data_service() -> DataService:
+    """Create and initialize a data service with the default components."""
+    from .database import DatabaseManager
+    from .cache import CacheManager
+    from .api_client import APIClientManager
+    from .clients.coingecko import CoinGeckoClient
+
+    db_manager = DatabaseManager()
+    cache_manager = CacheManager(db_manager=db_manager)
+    client_manager = APIClientManager()
+
+    # Register CoinGecko client as primary
+    coingecko_client = CoinGeckoClient()
+    client_manager.register_client(coingecko_client, is_primary=True)
     
-    if _global_data_service is None:
-        # Initialize with default components
-        from .database import DatabaseManager
-        from .cache import CacheManager
-        from .api_client import APIClientManager
-        from .clients.coingecko import CoinGeckoClient
+    data_service = DataService(db_manager, cache_manager, client_manager)
+    await data_service.initialize()
+    return data_service
 
-        db_manager = DatabaseManager()
-        cache_manager = CacheManager()
-        client_manager = APIClientManager()
 
-        # Register CoinGecko client as primary
-        coingecko_client = CoinGeckoClient()
-        client_manager.register_client(coingecko_client, is_primary=True)
+async def get_data_service() -> DataService:
+    """Get global data service instance.
+    
+    Concurrent callers that arrive before the service is ready await the
+    same initialization instead of each building their own service.
+    """
+    global _global_data_service, _data_service_init
+    
+    if _global_data_service is None:
+        init = _data_service_init
+        if init is None:
+            init = _data_service_init = asyncio.ensure_future(_create_data_service())
+        
+        try:
+            data_service = await init
+        finally:
+            if _data_service_init is init:
+                _data_service_init = None
         
-        _global_data_service = DataService(db_manager, cache_manager, client_manager)
-        await _global_data_service.initialize()
+        _global_data_service = data_service
     
     return _global_data_service
@@ -2,7 +2,8 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Set, Callable, Any, Union
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Callable, Any, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timezone
@@ -265,6 +266,28 @@ class StreamEventBus:
         )
         await self.publish(event)
     
+    async def publish_price_updates(self, updates: Iterable[Tuple[str, Dict[str, Any]]],
+                                    source: str = "price_feed") -> int:
+        """Publish a batch of price update events.
+        
+        Args:
+            updates: (symbol, price_data) pairs
+            source: Event source name
+            
+        Returns:
+            Number of events accepted by the bus
+        """
+        published = 0
+        for symbol, price_data in updates:
+            event = StreamEvent(
+                event_type=EventType.PRICE_UPDATE,
+                data={"symbol": symbol, **price_data},
+                source=source
+            )
+            if await self.publish(event):
+                published += 1
+        return published
+    
     async def publish_portfolio_update(self, portfolio_data: Dict[str, Any], source: str = "portfolio_monitor"):
         """Convenience method to publish portfolio update event."""
         event = StreamEvent(
@@ -360,6 +383,51 @@ class StreamEventBus:
         return [event.to_dict() for event in events]
 
 
+class PriceUpdateBatcher:
+    """Buffers price feed updates and publishes them to an event bus in batches.
+    
+    Price feed handlers are plain callbacks. Instead of scheduling a task per
+    update, updates are queued and a single drain task publishes everything
+    that arrived within ``interval`` seconds.
+    """
+    
+    def __init__(self, event_bus: StreamEventBus, source: str, interval: float = 0.05):
+        self.event_bus = event_bus
+        self.source = source
+        self.interval = interval
+        self._buffer: Deque[Any] = deque()
+        self._drain_task: Optional[asyncio.Task] = None
+    
+    def __call__(self, price_update) -> None:
+        """Queue a price update; usable directly as a price feed handler."""
+        self._buffer.append(price_update)
+        if self._drain_task is None:
+            self._drain_task = asyncio.create_task(self._drain())
+    
+    async def _drain(self):
+        """Wait for the batch window to close, then publish the batch."""
+        await asyncio.sleep(self.interval)
+        # Updates arriving while this batch publishes start a new drain task
+        self._drain_task = None
+        await self.flush()
+    
+    async def flush(self) -> int:
+        """Publish all buffered updates now.
+        
+        Returns:
+            Number of events accepted by the bus
+        """
+        buffer = self._buffer
+        batch = [buffer.popleft() for _ in range(len(buffer))]
+        if not batch:
+            return 0
+        
+        return await self.event_bus.publish_price_updates(
+            ((update.symbol, update.to_dict()) for update in batch),
+            source=self.source
+        )
+
+
 class WebSocketEventHandler(EventHandler):
     """Event handler that broadcasts events to WebSocket clients."""
     
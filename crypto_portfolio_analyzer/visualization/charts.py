@@ -15,7 +15,7 @@ import base64
 from io import BytesIO
 
 from ..analytics.models import PortfolioSnapshot, PortfolioHolding, PerformanceMetrics
-from ..data.models import HistoricalPrice
+from ..data.models import HistoricalPrice, PriceSeries
 
 logger = logging.getLogger(__name__)
 
@@ -432,7 +432,7 @@ class PriceChart(BaseChart):
 
         Args:
             data: Dictionary containing:
-                - historical_prices: List of HistoricalPrice objects
+                - historical_prices: List of HistoricalPrice objects or a PriceSeries
                 - symbol: Symbol name
                 - indicators: Optional technical indicators
 
@@ -447,21 +447,20 @@ class PriceChart(BaseChart):
             self.figure = self._create_empty_chart(f"No price data available for {symbol}")
             return self.figure
 
-        # Sort prices by timestamp
-        sorted_prices = sorted(historical_prices, key=lambda x: x.timestamp)
-
-        # Extract price and volume data
-        timestamps = [p.timestamp for p in sorted_prices]
-        prices = [float(p.price) for p in sorted_prices]
+        # Sorted price and volume columns
+        if not isinstance(historical_prices, PriceSeries):
+            historical_prices = PriceSeries.from_prices(historical_prices)
+        timestamps = historical_prices.timestamps
+        prices = historical_prices.closes
         # Since HistoricalPrice doesn't have OHLC, simulate them from price
         opens = prices  # Use same price for open
-        highs = [price * 1.01 for price in prices]  # Simulate 1% high
-        lows = [price * 0.99 for price in prices]   # Simulate 1% low
+        highs = prices * 1.01  # Simulate 1% high
+        lows = prices * 0.99   # Simulate 1% low
         closes = prices  # Use same price for close
-        volumes = [float(p.volume) if p.volume else 0 for p in sorted_prices]
+        volumes = historical_prices.volumes
 
         # Create subplots
-        rows = 2 if volumes and any(v > 0 for v in volumes) else 1
+        rows = 2 if volumes.any() else 1
         fig = make_subplots(
             rows=rows, cols=1,
             shared_xaxes=True,
@@ -500,9 +499,8 @@ class PriceChart(BaseChart):
                 )
 
         # Add volume bars if available
-        if rows == 2 and volumes:
-            colors = ['#2ca02c' if closes[i] >= opens[i] else '#d62728'
-                     for i in range(len(closes))]
+        if rows == 2:
+            colors = np.where(closes >= opens, '#2ca02c', '#d62728')
 
             fig.add_trace(
                 go.Bar(
@@ -714,13 +712,13 @@ class TechnicalChart(BaseChart):
         return chart.create(portfolio_snapshot)
     
     def create_candlestick_chart(self,
-                                historical_prices: List[HistoricalPrice],
+                                historical_prices: Union[List[HistoricalPrice], PriceSeries],
                                 symbol: str,
                                 indicators: Optional[Dict[str, List[float]]] = None) -> go.Figure:
         """Create candlestick chart using new chart system.
 
         Args:
-            historical_prices: Historical price data
+            historical_prices: Historical price data, as points or a PriceSeries
             symbol: Cryptocurrency symbol
             indicators: Optional technical indicators to overlay
 
@@ -1,6 +1,7 @@
 """Web dashboard server for real-time portfolio monitoring."""
 
 import asyncio
+import hashlib
 import logging
 import json
 from datetime import datetime, timezone
@@ -9,7 +10,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 import plotly
@@ -18,6 +20,7 @@ import plotly.graph_objects as go
 from .charts import ChartGenerator, ChartConfig, ChartType
 from ..streaming.events import StreamEventBus, EventType
 from ..analytics.models import PortfolioSnapshot
+from ..core.serialization import dumps_json
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +37,9 @@ class DashboardConfig:
     enable_websocket: bool = True
     static_files_path: Optional[str] = None
     templates_path: Optional[str] = None
+    cache_max_age: int = 5  # seconds clients may reuse chart data
+    stale_while_revalidate: int = 30  # seconds stale chart data may be served
+    compression_minimum_size: int = 1024  # bytes; smaller responses are sent uncompressed
 
 
 class ConnectionManager:
@@ -119,6 +125,9 @@ class WebDashboard:
         """
         self.config = config
         self.app = FastAPI(title=config.title)
+        # Gzip chart JSON and pages for clients that accept it; the
+        # middleware also sets Vary: Accept-Encoding
+        self.app.add_middleware(GZipMiddleware, minimum_size=config.compression_minimum_size)
         self.chart_generator = ChartGenerator()
         self.connection_manager = ConnectionManager()
         self.event_bus = None
@@ -153,17 +162,17 @@ class WebDashboard:
             }
 
         @self.app.get("/api/charts/portfolio")
-        async def get_portfolio_chart():
+        async def get_portfolio_chart(request: Request):
             """Get portfolio performance chart."""
             # This would integrate with actual portfolio data
             # For now, return a placeholder
-            return {"chart": "portfolio_chart_placeholder"}
+            return self._chart_response(request, {"chart": "portfolio_chart_placeholder"})
 
         @self.app.get("/api/charts/allocation")
-        async def get_allocation_chart():
+        async def get_allocation_chart(request: Request):
             """Get portfolio allocation chart."""
             # This would integrate with actual portfolio data
-            return {"chart": "allocation_chart_placeholder"}
+            return self._chart_response(request, {"chart": "allocation_chart_placeholder"})
 
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
@@ -184,6 +193,34 @@ class WebDashboard:
             except WebSocketDisconnect:
                 self.connection_manager.disconnect(websocket)
 
+    def _chart_response(self, request: Request, payload: Dict[str, Any]) -> Response:
+        """Build a cacheable chart response.
+
+        The ETag is a digest of the serialized payload, so a polling client
+        that already holds the current chart gets an empty 304 response.
+
+        Args:
+            request: Incoming request
+            payload: Chart data to return
+
+        Returns:
+            304 response when the client's ETag matches, JSON response otherwise
+        """
+        body = dumps_json(payload, indent=False).encode('utf-8')
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        headers = {
+            'ETag': etag,
+            'Cache-Control': (
+                f"max-age={self.config.cache_max_age}, "
+                f"stale-while-revalidate={self.config.stale_while_revalidate}"
+            )
+        }
+
+        if request.headers.get('if-none-match') == etag:
+            return Response(status_code=304, headers=headers)
+
+        return Response(content=body, media_type='application/json', headers=headers)
+
     def _setup_static_files(self):
         """Setup static files and templates."""
         # In a full implementation, this would setup actual static files
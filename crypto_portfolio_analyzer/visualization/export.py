@@ -1,7 +1,6 @@
 """Data export and import system for portfolio data."""
 
 import csv
-import json
 import logging
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Union
@@ -15,6 +14,7 @@ from openpyxl.utils.dataframe import dataframe_to_rows
 
 from ..analytics.models import PortfolioSnapshot, PortfolioHolding, PerformanceMetrics
 from ..data.models import HistoricalPrice
+from ..core.serialization import dumps_json_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -183,8 +183,7 @@ class JSONExporter(BaseExporter):
         # Convert data to JSON-serializable format
         json_data = self._prepare_json_data(data)
         
-        with open(output_path, 'w', encoding='utf-8') as jsonfile:
-            json.dump(json_data, jsonfile, indent=2, default=str, ensure_ascii=False)
+        output_path.write_bytes(dumps_json_bytes(json_data))
         
         logger.info(f"Data exported to JSON: {output_path}")
         return str(output_path)
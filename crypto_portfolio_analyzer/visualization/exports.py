@@ -3,12 +3,14 @@
 import os
 import io
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any, Union
 import logging
 
 import plotly.graph_objects as go
 import plotly.io as pio
+from plotly.offline import get_plotlyjs
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +34,8 @@ class ChartExporter:
                     format: str = 'png',
                     width: Optional[int] = None,
                     height: Optional[int] = None,
-                    scale: Optional[int] = None) -> bool:
+                    scale: Optional[int] = None,
+                    include_plotlyjs: Union[bool, str] = True) -> bool:
         """Export chart to file.
         
         Args:
@@ -42,6 +45,8 @@ class ChartExporter:
             width: Image width in pixels
             height: Image height in pixels
             scale: Scale factor for image quality
+            include_plotlyjs: How HTML exports load plotly.js (True embeds it,
+                'cdn' links it, 'directory' references a shared plotly.min.js)
             
         Returns:
             True if export successful, False otherwise
@@ -69,7 +74,7 @@ class ChartExporter:
             
             # Export based on format
             if format == 'html':
-                self._export_html(fig, filename)
+                self._export_html(fig, filename, include_plotlyjs)
             elif format == 'svg':
                 self._export_svg(fig, filename, export_width, export_height)
             elif format == 'pdf':
@@ -162,16 +167,18 @@ class ChartExporter:
             logger.error(f"Failed to export chart to base64: {e}")
             return None
     
-    def _export_html(self, fig: go.Figure, filename: str) -> None:
+    def _export_html(self, fig: go.Figure, filename: str,
+                     include_plotlyjs: Union[bool, str] = True) -> None:
         """Export chart as HTML file.
         
         Args:
             fig: Plotly figure
             filename: Output filename
+            include_plotlyjs: How the page loads plotly.js
         """
         fig.write_html(
             filename,
-            include_plotlyjs=True,
+            include_plotlyjs=include_plotlyjs,
             config={
                 'displayModeBar': True,
                 'displaylogo': False,
@@ -224,13 +231,20 @@ class ChartExporter:
     def create_chart_gallery(self, 
                            charts: Dict[str, go.Figure],
                            output_dir: str = "chart_gallery",
-                           format: str = 'png') -> Dict[str, str]:
+                           format: str = 'png',
+                           max_workers: Optional[int] = None) -> Dict[str, str]:
         """Export multiple charts to a gallery.
         
+        Charts are exported concurrently on a thread pool; image rendering
+        happens in the kaleido renderer process, outside the GIL. HTML charts
+        share a single plotly.min.js written next to them rather than each
+        embedding the ~3MB bundle.
+        
         Args:
             charts: Dictionary mapping chart names to figures
             output_dir: Output directory for gallery
             format: Export format
+            max_workers: Maximum concurrent exports; defaults to the CPU count
             
         Returns:
             Dictionary mapping chart names to file paths
@@ -242,18 +256,38 @@ class ChartExporter:
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
             
-            # Export each chart
-            for chart_name, fig in charts.items():
+            filenames = {}
+            for chart_name in charts:
                 # Sanitize filename
                 safe_name = "".join(c for c in chart_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
                 safe_name = safe_name.replace(' ', '_')
                 
-                filename = output_path / f"{safe_name}.{format}"
+                filenames[chart_name] = str(output_path / f"{safe_name}.{format}")
+            
+            include_plotlyjs: Union[bool, str] = True
+            if format == 'html' and charts:
+                # Written once up front; plotly skips an existing bundle, so the
+                # concurrent exports below never race to write it
+                bundle_path = output_path / "plotly.min.js"
+                if not bundle_path.exists():
+                    bundle_path.write_text(get_plotlyjs(), encoding="utf-8")
+                include_plotlyjs = 'directory'
+            
+            # Export each chart
+            if charts:
+                workers = min(len(charts), max_workers or os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(
+                        lambda item: self.export_chart(item[1], filenames[item[0]], format,
+                                                       include_plotlyjs=include_plotlyjs),
+                        charts.items()
+                    ))
                 
-                if self.export_chart(fig, str(filename), format):
-                    gallery_paths[chart_name] = str(filename)
-                else:
-                    logger.warning(f"Failed to export chart: {chart_name}")
+                for chart_name, exported in zip(charts, results):
+                    if exported:
+                        gallery_paths[chart_name] = filenames[chart_name]
+                    else:
+                        logger.warning(f"Failed to export chart: {chart_name}")
             
             # Create index HTML file
             if format == 'png' or format == 'jpg':
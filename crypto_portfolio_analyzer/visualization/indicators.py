@@ -2,15 +2,122 @@
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple, Optional
-from datetime import datetime
+from typing import Callable, List, Dict, Iterable, Sequence, Tuple, Optional
 import logging
 
-from ..data.models import HistoricalPrice
+from ..data.models import HistoricalPrice, PriceSeries
+
+try:
+    from scipy.signal import lfilter
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+def _as_array(values) -> np.ndarray:
+    """Convert a sequence of numbers to a float64 array."""
+    return np.asarray(values, dtype=np.float64)
+
+
+def _padded(values: np.ndarray, pad: int) -> List[float]:
+    """Convert an indicator array to a list with its first ``pad`` values NaN."""
+    return [np.nan] * pad + values[pad:].tolist()
+
+
+def _smooth(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponentially smooth values, seeded with the first one.
+    
+    Computes ``y[i] = alpha * x[i] + (1 - alpha) * y[i - 1]`` as a single IIR
+    filter pass with scipy, or with pandas ``ewm`` when scipy is missing.
+    
+    Args:
+        values: Values to smooth
+        alpha: Smoothing factor
+        
+    Returns:
+        Array of smoothed values
+    """
+    if not SCIPY_AVAILABLE or len(values) == 0:
+        return pd.Series(values, dtype=np.float64).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    
+    smoothed, _ = lfilter([alpha], [1.0, alpha - 1.0], values[1:], zi=[(1.0 - alpha) * values[0]])
+    return np.concatenate((values[:1], smoothed))
+
+
+def _window_sums(values: np.ndarray, period: int) -> np.ndarray:
+    """Sum every full window of ``period`` values from one prefix sum.
+    
+    Args:
+        values: Values to sum
+        period: Window length
+        
+    Returns:
+        Array of ``len(values) - period + 1`` window sums
+    """
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    return csum[period:] - csum[:-period]
+
+
+def _rsi_signal(rsi: Sequence[float]) -> Optional[str]:
+    """Classify the latest RSI value."""
+    if len(rsi) < 1 or np.isnan(rsi[-1]):
+        return None
+    if rsi[-1] > 70:
+        return 'OVERBOUGHT'
+    if rsi[-1] < 30:
+        return 'OVERSOLD'
+    return 'NEUTRAL'
+
+
+def _macd_signal(macd: Sequence[float], signal: Sequence[float]) -> Optional[str]:
+    """Detect a MACD/signal line crossover on the latest value."""
+    if len(macd) < 2 or len(signal) < 2 or np.isnan(macd[-1]) or np.isnan(signal[-1]):
+        return None
+    if macd[-1] > signal[-1] and macd[-2] <= signal[-2]:
+        return 'BULLISH_CROSSOVER'
+    if macd[-1] < signal[-1] and macd[-2] >= signal[-2]:
+        return 'BEARISH_CROSSOVER'
+    return 'NEUTRAL'
+
+
+def _sma_cross_signal(sma20: Sequence[float], sma50: Sequence[float]) -> Optional[str]:
+    """Compare the short and long simple moving averages."""
+    if len(sma20) < 2 or len(sma50) < 2 or np.isnan(sma20[-1]) or np.isnan(sma50[-1]):
+        return None
+    return 'BULLISH' if sma20[-1] > sma50[-1] else 'BEARISH'
+
+
+def _stochastic_signal(k: Sequence[float], d: Sequence[float]) -> Optional[str]:
+    """Classify the latest stochastic %K/%D values."""
+    if len(k) < 1 or len(d) < 1 or np.isnan(k[-1]) or np.isnan(d[-1]):
+        return None
+    if k[-1] > 80 and d[-1] > 80:
+        return 'OVERBOUGHT'
+    if k[-1] < 20 and d[-1] < 20:
+        return 'OVERSOLD'
+    return 'NEUTRAL'
+
+
+# Indicator keys filled from TechnicalIndicators._compute_macd, by component
+_MACD_KEYS = {
+    'EMA_12': 'ema_fast',
+    'EMA_26': 'ema_slow',
+    'MACD': 'macd',
+    'MACD_Signal': 'signal',
+    'MACD_Histogram': 'histogram',
+}
+
+# (signal name, indicator keys it reads, rule) for get_indicator_signals_for
+_SIGNAL_RULES: Tuple[Tuple[str, Tuple[str, ...], Callable[..., Optional[str]]], ...] = (
+    ('RSI', ('RSI',), _rsi_signal),
+    ('MACD', ('MACD', 'MACD_Signal'), _macd_signal),
+    ('SMA_Cross', ('SMA_20', 'SMA_50'), _sma_cross_signal),
+    ('Stochastic', ('Stoch_K', 'Stoch_D'), _stochastic_signal),
+)
+
+
 class TechnicalIndicators:
     """Technical analysis indicators calculator."""
     
@@ -28,18 +135,15 @@ class TechnicalIndicators:
         Returns:
             List of SMA values
         """
-        if len(prices) < period:
+        if period < 1 or len(prices) < period:
             return [np.nan] * len(prices)
         
-        sma_values = []
-        for i in range(len(prices)):
-            if i < period - 1:
-                sma_values.append(np.nan)
-            else:
-                sma = np.mean(prices[i - period + 1:i + 1])
-                sma_values.append(sma)
-        
-        return sma_values
+        # Prices are taken relative to the first one so the prefix sums stay
+        # small and the window differences do not lose precision
+        values = _as_array(prices)
+        origin = values[0]
+        sma = _window_sums(values - origin, period) / period + origin
+        return [np.nan] * (period - 1) + sma.tolist()
     
     def calculate_ema(self, prices: List[float], period: int = 20) -> List[float]:
         """Calculate Exponential Moving Average.
@@ -51,20 +155,15 @@ class TechnicalIndicators:
         Returns:
             List of EMA values
         """
-        if not prices:
+        if len(prices) == 0:
             return []
         
-        ema_values = []
-        multiplier = 2 / (period + 1)
-        
-        # First EMA value is the first price
-        ema_values.append(prices[0])
-        
-        for i in range(1, len(prices)):
-            ema = (prices[i] * multiplier) + (ema_values[-1] * (1 - multiplier))
-            ema_values.append(ema)
-        
-        return ema_values
+        return self._ema(_as_array(prices), period).tolist()
+    
+    @staticmethod
+    def _ema(values: np.ndarray, period: int) -> np.ndarray:
+        """EMA seeded with the first value, smoothing factor ``2 / (period + 1)``."""
+        return _smooth(values, 2 / (period + 1))
     
     def calculate_rsi(self, prices: List[float], period: int = 14) -> List[float]:
         """Calculate Relative Strength Index.
@@ -79,37 +178,36 @@ class TechnicalIndicators:
         if len(prices) < period + 1:
             return [np.nan] * len(prices)
         
-        # Calculate price changes
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
+        # Calculate price changes, separated into gains and losses
+        deltas = np.diff(_as_array(prices))
+        gains = np.clip(deltas, 0, None)
+        losses = np.clip(-deltas, 0, None)
         
-        # Separate gains and losses
-        gains = [delta if delta > 0 else 0 for delta in deltas]
-        losses = [-delta if delta < 0 else 0 for delta in deltas]
+        # Wilder smoothing is an EMA with factor 1/period, seeded with the
+        # mean of the first period changes
+        avg_gain = self._wilder_average(gains, period)
+        avg_loss = self._wilder_average(losses, period)
         
-        rsi_values = [np.nan]  # First value is NaN
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        rsi[avg_loss == 0] = 100
         
-        # Calculate initial average gain and loss
-        avg_gain = np.mean(gains[:period])
-        avg_loss = np.mean(losses[:period])
+        # First value is NaN; the trailing values have no smoothed average
+        return [np.nan] + rsi.tolist() + [np.nan] * period
+    
+    @staticmethod
+    def _wilder_average(values: np.ndarray, period: int) -> np.ndarray:
+        """Wilder-smoothed averages of ``values[period:]``.
         
-        for i in range(period, len(deltas)):
-            # Smoothed averages
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-            
-            if avg_loss == 0:
-                rsi = 100
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
+        Args:
+            values: Gains or losses
+            period: Smoothing period
             
-            rsi_values.append(rsi)
-        
-        # Fill remaining values
-        while len(rsi_values) < len(prices):
-            rsi_values.append(np.nan)
-        
-        return rsi_values
+        Returns:
+            Array of the smoothed average after each of ``values[period:]``
+        """
+        seeded = np.concatenate(([values[:period].mean()], values[period:]))
+        return _smooth(seeded, 1 / period)[1:]
     
     def calculate_macd(self, prices: List[float], 
                       fast_period: int = 12, 
@@ -134,39 +232,51 @@ class TechnicalIndicators:
                 'histogram': nan_list
             }
         
-        # Calculate EMAs
-        fast_ema = self.calculate_ema(prices, fast_period)
-        slow_ema = self.calculate_ema(prices, slow_period)
-        
-        # Calculate MACD line
-        macd_line = []
-        for i in range(len(prices)):
-            if i < slow_period - 1:
-                macd_line.append(np.nan)
-            else:
-                macd_line.append(fast_ema[i] - slow_ema[i])
-        
-        # Calculate signal line (EMA of MACD)
-        macd_values = [x for x in macd_line if not np.isnan(x)]
-        if len(macd_values) >= signal_period:
-            signal_ema = self.calculate_ema(macd_values, signal_period)
+        macd_data = self._compute_macd(_as_array(prices), fast_period, slow_period, signal_period)
+        
+        return {
+            'macd': macd_data['macd'].tolist(),
+            'signal': macd_data['signal'].tolist(),
+            'histogram': macd_data['histogram'].tolist()
+        }
+    
+    def _compute_macd(self, values: np.ndarray,
+                      fast_period: int = 12,
+                      slow_period: int = 26,
+                      signal_period: int = 9) -> Dict[str, np.ndarray]:
+        """Calculate the MACD lines along with the EMAs they are built from.
+        
+        Args:
+            values: Price values
+            fast_period: Fast EMA period
+            slow_period: Slow EMA period
+            signal_period: Signal line EMA period
             
-            # Pad signal line with NaNs
-            signal_line = [np.nan] * (len(macd_line) - len(signal_ema)) + signal_ema
-        else:
-            signal_line = [np.nan] * len(macd_line)
+        Returns:
+            Dictionary of arrays: fast and slow EMA, MACD line, signal line
+            and histogram; the MACD lines are NaN until the slow EMA is defined
+        """
+        pad = slow_period - 1
+        ema_fast = self._ema(values, fast_period)
+        ema_slow = self._ema(values, slow_period)
         
-        # Calculate histogram
-        histogram = []
-        for i in range(len(macd_line)):
-            if np.isnan(macd_line[i]) or np.isnan(signal_line[i]):
-                histogram.append(np.nan)
-            else:
-                histogram.append(macd_line[i] - signal_line[i])
+        # Calculate MACD line from the fast and slow EMAs
+        macd = ema_fast - ema_slow
+        macd[:pad] = np.nan
+        
+        # Calculate signal line (EMA of the defined MACD values)
+        signal = np.full(len(values), np.nan)
+        if len(values) - pad >= signal_period:
+            signal[pad:] = self._ema(macd[pad:], signal_period)
+        
+        # Histogram is NaN wherever either line is
+        histogram = macd - signal
         
         return {
-            'macd': macd_line,
-            'signal': signal_line,
+            'ema_fast': ema_fast,
+            'ema_slow': ema_slow,
+            'macd': macd,
+            'signal': signal,
             'histogram': histogram
         }
     
@@ -191,28 +301,23 @@ class TechnicalIndicators:
                 'lower': nan_list
             }
         
-        # Calculate SMA (middle band)
-        sma = self.calculate_sma(prices, period)
-        
-        # Calculate standard deviation
-        upper_band = []
-        lower_band = []
+        # Calculate SMA (middle band) from prefix sums, relative to the first
+        # price as in calculate_sma
+        values = _as_array(prices)
+        origin = values[0]
+        sma = _window_sums(values - origin, period) / period + origin
         
-        for i in range(len(prices)):
-            if i < period - 1:
-                upper_band.append(np.nan)
-                lower_band.append(np.nan)
-            else:
-                price_slice = prices[i - period + 1:i + 1]
-                std = np.std(price_slice)
-                
-                upper_band.append(sma[i] + (std_dev * std))
-                lower_band.append(sma[i] - (std_dev * std))
+        # The population standard deviation is reduced over a strided view of
+        # every window; the prefix-sum form E[X^2] - E[X]^2 cancels badly for
+        # flat windows, and the square root magnifies the error
+        windows = np.lib.stride_tricks.sliding_window_view(values, period)
+        width = std_dev * windows.std(axis=1)
         
+        pad = [np.nan] * (period - 1)
         return {
-            'upper': upper_band,
-            'middle': sma,
-            'lower': lower_band
+            'upper': pad + (sma + width).tolist(),
+            'middle': pad + sma.tolist(),
+            'lower': pad + (sma - width).tolist()
         }
     
     def calculate_volume_sma(self, volumes: List[float], period: int = 20) -> List[float]:
@@ -241,17 +346,16 @@ class TechnicalIndicators:
         if len(prices) != len(volumes) or len(prices) < 2:
             return [np.nan] * len(prices)
         
-        pvt_values = [0]  # Start with 0
+        values = _as_array(prices)
+        previous = values[:-1]
         
-        for i in range(1, len(prices)):
-            if prices[i-1] != 0:
-                price_change_pct = (prices[i] - prices[i-1]) / prices[i-1]
-                pvt = pvt_values[-1] + (volumes[i] * price_change_pct)
-                pvt_values.append(pvt)
-            else:
-                pvt_values.append(pvt_values[-1])
+        # Changes from a zero price contribute nothing
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_change_pct = np.where(previous != 0, np.diff(values) / previous, 0.0)
         
-        return pvt_values
+        # Start with 0
+        pvt = np.cumsum(_as_array(volumes)[1:] * price_change_pct)
+        return [0] + pvt.tolist()
     
     def calculate_stochastic_oscillator(self, highs: List[float], 
                                       lows: List[float], 
@@ -274,24 +378,18 @@ class TechnicalIndicators:
             nan_list = [np.nan] * len(closes)
             return {'k': nan_list, 'd': nan_list}
         
-        k_values = []
-        
-        for i in range(len(closes)):
-            if i < k_period - 1:
-                k_values.append(np.nan)
-            else:
-                period_high = max(highs[i - k_period + 1:i + 1])
-                period_low = min(lows[i - k_period + 1:i + 1])
-                
-                if period_high == period_low:
-                    k = 50  # Avoid division by zero
-                else:
-                    k = ((closes[i] - period_low) / (period_high - period_low)) * 100
-                
-                k_values.append(k)
+        period_high = pd.Series(_as_array(highs)).rolling(k_period).max().to_numpy()
+        period_low = pd.Series(_as_array(lows)).rolling(k_period).min().to_numpy()
+        price_range = period_high - period_low
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k = (_as_array(closes) - period_low) / price_range * 100
+        k[price_range == 0] = 50  # Avoid division by zero
+        
+        k_values = _padded(k, k_period - 1)
         
         # Calculate %D (SMA of %K)
-        k_valid = [x for x in k_values if not np.isnan(x)]
+        k_valid = k_values[k_period - 1:]
         if len(k_valid) >= d_period:
             d_values = self.calculate_sma(k_valid, d_period)
             # Pad with NaNs
@@ -310,62 +408,109 @@ class TechnicalIndicators:
         Returns:
             Dictionary with all calculated indicators
         """
+        return self.calculate_subset(historical_prices)
+    
+    def calculate_subset(self, historical_prices: List[HistoricalPrice],
+                         keys: Optional[Iterable[str]] = None) -> Dict[str, List[float]]:
+        """Calculate only the technical indicators with the given keys.
+        
+        Indicators computed together, such as the MACD line and its signal,
+        are calculated once if any of their keys is requested.
+        
+        Args:
+            historical_prices: List of historical price data
+            keys: Indicator keys as returned by calculate_all_indicators;
+                all indicators when omitted
+            
+        Returns:
+            Dictionary with the requested indicators that could be calculated
+        """
         if not historical_prices:
             return {}
         
-        # Sort by timestamp
-        sorted_prices = sorted(historical_prices, key=lambda x: x.timestamp)
+        series = PriceSeries.from_prices(historical_prices)
+        return self.calculate_series(series.closes, series.volumes, keys)
+    
+    def calculate_series(self, closes: np.ndarray, volumes: Optional[np.ndarray] = None,
+                         keys: Optional[Iterable[str]] = None) -> Dict[str, List[float]]:
+        """Calculate technical indicators from pre-extracted price columns.
         
-        # Extract price data (HistoricalPrice doesn't have OHLC, so simulate)
-        closes = [float(p.price) for p in sorted_prices]
-        # Simulate high/low as price +/- 1% for technical indicators
-        highs = [price * 1.01 for price in closes]
-        lows = [price * 0.99 for price in closes]
-        volumes = [float(p.volume) if p.volume else 0 for p in sorted_prices]
+        Args:
+            closes: Close prices in time order
+            volumes: Volumes aligned with ``closes``; volume indicators are
+                skipped when omitted or all zero
+            keys: Indicator keys as returned by calculate_all_indicators;
+                all indicators when omitted
+            
+        Returns:
+            Dictionary with the requested indicators that could be calculated
+        """
+        if len(closes) == 0:
+            return {}
+        
+        wanted = None if keys is None else frozenset(keys)
+        
+        def needs(*names: str) -> bool:
+            return wanted is None or not wanted.isdisjoint(names)
         
         indicators = {}
         
         try:
+            # The Bollinger middle band is the 20 period SMA, so when both are
+            # wanted SMA_20 is taken from the bands instead of a second pass
+            bb_data = None
+            if needs('BB_Upper', 'BB_Middle', 'BB_Lower'):
+                bb_data = self.calculate_bollinger_bands(closes)
+            
             # Moving averages
-            indicators['SMA_20'] = self.calculate_sma(closes, 20)
-            indicators['SMA_50'] = self.calculate_sma(closes, 50)
-            indicators['EMA_12'] = self.calculate_ema(closes, 12)
-            indicators['EMA_26'] = self.calculate_ema(closes, 26)
+            if needs('SMA_20'):
+                indicators['SMA_20'] = bb_data['middle'] if bb_data else self.calculate_sma(closes, 20)
+            if needs('SMA_50'):
+                indicators['SMA_50'] = self.calculate_sma(closes, 50)
             
-            # Momentum indicators
-            indicators['RSI'] = self.calculate_rsi(closes, 14)
+            # EMAs and MACD; the 12 and 26 period EMAs are calculated once
+            # and shared
+            if needs(*_MACD_KEYS):
+                macd_data = self._compute_macd(closes)
+                indicators.update({
+                    key: macd_data[component].tolist()
+                    for key, component in _MACD_KEYS.items()
+                    if needs(key)
+                })
             
-            # MACD
-            macd_data = self.calculate_macd(closes)
-            indicators.update({
-                'MACD': macd_data['macd'],
-                'MACD_Signal': macd_data['signal'],
-                'MACD_Histogram': macd_data['histogram']
-            })
+            # Momentum indicators
+            if needs('RSI'):
+                indicators['RSI'] = self.calculate_rsi(closes, 14)
             
             # Bollinger Bands
-            bb_data = self.calculate_bollinger_bands(closes)
-            indicators.update({
-                'BB_Upper': bb_data['upper'],
-                'BB_Middle': bb_data['middle'],
-                'BB_Lower': bb_data['lower']
-            })
+            if bb_data:
+                indicators.update({
+                    'BB_Upper': bb_data['upper'],
+                    'BB_Middle': bb_data['middle'],
+                    'BB_Lower': bb_data['lower']
+                })
             
             # Volume indicators
-            if any(v > 0 for v in volumes):
-                indicators['Volume_SMA'] = self.calculate_volume_sma(volumes, 20)
-                indicators['PVT'] = self.calculate_price_volume_trend(closes, volumes)
+            if needs('Volume_SMA', 'PVT') and volumes is not None:
+                if (volumes > 0).any():
+                    indicators['Volume_SMA'] = self.calculate_volume_sma(volumes, 20)
+                    indicators['PVT'] = self.calculate_price_volume_trend(closes, volumes)
             
             # Stochastic Oscillator
-            stoch_data = self.calculate_stochastic_oscillator(highs, lows, closes)
-            indicators.update({
-                'Stoch_K': stoch_data['k'],
-                'Stoch_D': stoch_data['d']
-            })
+            if needs('Stoch_K', 'Stoch_D'):
+                # HistoricalPrice doesn't have OHLC, so simulate high/low as price +/- 1% for technical indicators
+                stoch_data = self.calculate_stochastic_oscillator(closes * 1.01, closes * 0.99, closes)
+                indicators.update({
+                    'Stoch_K': stoch_data['k'],
+                    'Stoch_D': stoch_data['d']
+                })
             
         except Exception as e:
             logger.error(f"Error calculating indicators: {e}")
         
+        if wanted is not None:
+            indicators = {key: value for key, value in indicators.items() if key in wanted}
+        
         return indicators
     
     def get_indicator_signals(self, indicators: Dict[str, List[float]]) -> Dict[str, str]:
@@ -377,61 +522,33 @@ class TechnicalIndicators:
         Returns:
             Dictionary of signals for each indicator
         """
-        signals = {}
+        return self.get_indicator_signals_for(indicators)
+    
+    def get_indicator_signals_for(self, subset: Dict[str, Sequence[float]]) -> Dict[str, str]:
+        """Generate trading signals from only the indicators present in ``subset``.
         
-        try:
-            # RSI signals
-            if 'RSI' in indicators and indicators['RSI']:
-                latest_rsi = indicators['RSI'][-1]
-                if not np.isnan(latest_rsi):
-                    if latest_rsi > 70:
-                        signals['RSI'] = 'OVERBOUGHT'
-                    elif latest_rsi < 30:
-                        signals['RSI'] = 'OVERSOLD'
-                    else:
-                        signals['RSI'] = 'NEUTRAL'
-            
-            # MACD signals
-            if 'MACD' in indicators and 'MACD_Signal' in indicators:
-                macd = indicators['MACD']
-                signal = indicators['MACD_Signal']
-                
-                if len(macd) >= 2 and len(signal) >= 2:
-                    if not np.isnan(macd[-1]) and not np.isnan(signal[-1]):
-                        if macd[-1] > signal[-1] and macd[-2] <= signal[-2]:
-                            signals['MACD'] = 'BULLISH_CROSSOVER'
-                        elif macd[-1] < signal[-1] and macd[-2] >= signal[-2]:
-                            signals['MACD'] = 'BEARISH_CROSSOVER'
-                        else:
-                            signals['MACD'] = 'NEUTRAL'
+        Signal rules whose input series are missing are skipped, so a partial
+        calculation yields just the signals it can support.
+        
+        Args:
+            subset: Calculated indicator series, as lists or arrays
             
-            # Moving Average signals
-            if 'SMA_20' in indicators and 'SMA_50' in indicators:
-                sma20 = indicators['SMA_20']
-                sma50 = indicators['SMA_50']
-                
-                if len(sma20) >= 2 and len(sma50) >= 2:
-                    if not np.isnan(sma20[-1]) and not np.isnan(sma50[-1]):
-                        if sma20[-1] > sma50[-1]:
-                            signals['SMA_Cross'] = 'BULLISH'
-                        else:
-                            signals['SMA_Cross'] = 'BEARISH'
+        Returns:
+            Dictionary of signals for each indicator
+        """
+        signals = {}
+        
+        for name, keys, rule in _SIGNAL_RULES:
+            if not all(key in subset for key in keys):
+                continue
             
-            # Stochastic signals
-            if 'Stoch_K' in indicators and 'Stoch_D' in indicators:
-                k = indicators['Stoch_K']
-                d = indicators['Stoch_D']
-                
-                if len(k) >= 1 and len(d) >= 1:
-                    if not np.isnan(k[-1]) and not np.isnan(d[-1]):
-                        if k[-1] > 80 and d[-1] > 80:
-                            signals['Stochastic'] = 'OVERBOUGHT'
-                        elif k[-1] < 20 and d[-1] < 20:
-                            signals['Stochastic'] = 'OVERSOLD'
-                        else:
-                            signals['Stochastic'] = 'NEUTRAL'
+            try:
+                signal = rule(*(subset[key] for key in keys))
+            except Exception as e:
+                logger.error(f"Error generating {name} signal: {e}")
+                continue
             
-        except Exception as e:
-            logger.error(f"Error generating signals: {e}")
+            if signal:
+                signals[name] = signal
         
         return signals
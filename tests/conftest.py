@@ -231,6 +231,7 @@ def mock_requests(monkeypatch, crypto_symbols_response):
             return mock_http_response({"error": "Not found"}, 404)
     
     monkeypatch.setattr("requests.get", mock_get)
+    monkeypatch.setattr("crypto_portfolio_analyzer.core.click_types._SESSION.get", mock_get)
 
 
 @pytest.fixture
@@ -0,0 +1,89 @@
+"""Tests for analytics PDF report rendering."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crypto_portfolio_analyzer.analytics.pdf import render_pdf, render_report_html
+
+
+@pytest.fixture
+def report_data():
+    """Report dictionary shaped like the ``analytics report`` output."""
+    return {
+        'generated_at': '2024-01-01T00:00:00',
+        'portfolio_summary': {
+            'total_value': 125000.0,
+            'holdings_count': 3,
+        },
+        'performance_metrics': {
+            '30d': {'total_return_percentage': 12.5, 'sharpe_ratio': 1.2},
+        },
+        'risk_metrics': {
+            'volatility': 0.45,
+            'correlation_matrix': {'BTC': {'ETH': 0.8}},
+        },
+        'allocation_metrics': {
+            'concentration_risk': 0.3,
+            'top_holdings': [['BTC', 60.0]],
+        },
+        'benchmark_comparisons': [
+            {'benchmark_name': 'BTC <spot>', 'alpha': 0.02},
+        ],
+    }
+
+
+class TestRenderReportHtml:
+    """Test render_report_html."""
+    
+    def test_sections(self, report_data):
+        """Test that every report section is rendered as a table."""
+        document = render_report_html(report_data)
+        
+        assert document.startswith("<!DOCTYPE html>")
+        assert "<p>Generated at 2024-01-01T00:00:00</p>" in document
+        assert "<h2>Portfolio Summary</h2>" in document
+        assert "<tr><th>total_value</th><td>125000.0</td></tr>" in document
+        assert "<h2>Performance (30d)</h2>" in document
+        assert "<tr><th>sharpe_ratio</th><td>1.2</td></tr>" in document
+        assert "<h2>Risk Metrics</h2>" in document
+        assert "<h2>Allocation Metrics</h2>" in document
+    
+    def test_nested_values_skipped(self, report_data):
+        """Test that nested risk and allocation values are left out."""
+        document = render_report_html(report_data)
+        
+        assert "<th>volatility</th>" in document
+        assert "correlation_matrix" not in document
+        assert "top_holdings" not in document
+    
+    def test_values_escaped(self, report_data):
+        """Test that report values are HTML escaped."""
+        document = render_report_html(report_data)
+        
+        assert "<h2>Benchmark: BTC &lt;spot&gt;</h2>" in document
+        assert "<spot>" not in document
+    
+    def test_empty_report(self):
+        """Test rendering a report with no sections."""
+        document = render_report_html({})
+        
+        assert "<h2>Portfolio Summary</h2><table></table>" in document
+        assert document.endswith("</body></html>")
+
+
+class TestRenderPdf:
+    """Test render_pdf."""
+    
+    def test_render_pdf(self, report_data, tmp_path):
+        """Test that the rendered HTML is written to the output file."""
+        weasyprint = MagicMock()
+        output_file = str(tmp_path / "report.pdf")
+        
+        with patch.dict(sys.modules, {'weasyprint': weasyprint}):
+            result = render_pdf(report_data, output_file)
+        
+        assert result == output_file
+        weasyprint.HTML.assert_called_once_with(string=render_report_html(report_data))
+        weasyprint.HTML.return_value.write_pdf.assert_called_once_with(output_file)
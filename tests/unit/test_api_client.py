@@ -393,6 +393,33 @@ class TestAPIClientManager:
                 
                 assert price is None
     
+    @pytest.mark.asyncio
+    async def test_api_client_manager_get_multiple_prices_individual_fallback(self):
+        """Test per-symbol fallback runs concurrently up to the configured limit."""
+        manager = APIClientManager(max_concurrent_requests=2)
+        
+        config = APIClientConfig(base_url="https://api.test.com")
+        client = MockAPIClient(config, DataSource.COINGECKO)
+        manager.register_client(client, is_primary=True)
+        
+        in_flight = 0
+        peak = 0
+        
+        async def fake_price(symbol, currency):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return None if symbol == "BAD" else f"{symbol}_price"
+        
+        with patch.object(client, 'get_multiple_prices', AsyncMock(return_value=[])):
+            with patch.object(manager, 'get_current_price', side_effect=fake_price):
+                prices = await manager.get_multiple_prices(["BTC", "ETH", "BAD", "ADA", "SOL"])
+        
+        assert prices == ["BTC_price", "ETH_price", "ADA_price", "SOL_price"]
+        assert peak == 2
+    
     @pytest.mark.asyncio
     async def test_api_client_manager_start_stop_all(self):
         """Test starting and stopping all clients."""
@@ -10,6 +10,7 @@ from crypto_portfolio_analyzer.data.cache import (
     cache_key_for_price,
     cache_key_for_historical
 )
+from crypto_portfolio_analyzer.data.database import DatabaseManager
 
 
 @pytest.fixture
@@ -333,6 +334,43 @@ class TestCacheManager:
             
         finally:
             await manager.stop()
+    
+    @pytest.mark.asyncio
+    async def test_cache_persistent_keys(self, tmp_path):
+        """Test that persistent keys are shared through the database."""
+        db_manager = DatabaseManager(tmp_path / "cache.db")
+        await db_manager.initialize()
+        
+        writer = CacheManager(db_manager=db_manager)
+        await writer.set("historical:BTC:20240101:20240131:usd", [{"price": "1.5"}], ttl=60)
+        await writer.set("price:BTC:usd", {"price": 1.5}, ttl=60)
+        
+        # A fresh manager, as in a new process, only sees the persistent key
+        reader = CacheManager(db_manager=db_manager)
+        assert await reader.get("historical:BTC:20240101:20240131:usd") == [{"price": "1.5"}]
+        assert await reader.get("price:BTC:usd") is None
+    
+    @pytest.mark.asyncio
+    async def test_cache_persistent_keys_removed(self, tmp_path):
+        """Test that delete, invalidate_pattern and clear remove persisted entries."""
+        db_manager = DatabaseManager(tmp_path / "cache.db")
+        await db_manager.initialize()
+        
+        manager = CacheManager(db_manager=db_manager)
+        for symbol in ("BTC", "ETH", "ADA"):
+            await manager.set(f"historical:{symbol}:20240101:20240131:usd", [{"price": "1.5"}], ttl=60)
+        
+        assert await manager.delete("historical:BTC:20240101:20240131:usd") is True
+        assert await manager.get("historical:BTC:20240101:20240131:usd") is None
+        
+        assert await manager.invalidate_pattern("historical:eth:*") == 1
+        assert await manager.get("historical:ETH:20240101:20240131:usd") is None
+        
+        # Entries only in the database are cleared too
+        reader = CacheManager(db_manager=db_manager)
+        assert await reader.clear() == 1
+        assert await reader.get("historical:ADA:20240101:20240131:usd") is None
+        assert await db_manager.get_cache_entry("historical:ada:20240101:20240131:usd") is None
 
 
 class TestCacheHelpers:
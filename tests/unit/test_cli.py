@@ -297,6 +297,48 @@ class TestErrorHandling:
             assert result.exit_code == 1
 
 
+class TestRunAsync:
+    """Test the shared event loop used by async commands."""
+    
+    def test_run_async_reuses_loop(self):
+        """Consecutive commands run on the same event loop."""
+        import asyncio
+        from crypto_portfolio_analyzer.core.cli_base import run_async
+        
+        async def current_loop():
+            return asyncio.get_running_loop()
+        
+        first = run_async(current_loop())
+        second = run_async(current_loop())
+        
+        assert first is second
+        assert not first.is_closed()
+    
+    def test_run_async_cancels_on_keyboard_interrupt(self):
+        """Ctrl+C cancels the running command and lets its cleanup finish."""
+        import asyncio
+        from crypto_portfolio_analyzer.core.cli_base import run_async
+        
+        cleaned_up = []
+        
+        def interrupt():
+            raise KeyboardInterrupt
+        
+        async def command():
+            asyncio.get_running_loop().call_soon(interrupt)
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                await asyncio.sleep(0)
+                cleaned_up.append(True)
+                raise
+        
+        with pytest.raises(KeyboardInterrupt):
+            run_async(command())
+        
+        assert cleaned_up == [True]
+
+
 @pytest.mark.asyncio
 class TestAsyncCLIComponents:
     """Test async components of the CLI."""
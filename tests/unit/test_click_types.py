@@ -0,0 +1,172 @@
+"""Tests for the schema-validated Click parameter types."""
+
+import hashlib
+import pickle
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from crypto_portfolio_analyzer.core import click_types
+from crypto_portfolio_analyzer.core.click_types import (
+    CryptocurrencySymbol,
+    SchemaValidatedChoice,
+    _read_cache,
+    _write_cache,
+)
+
+SCHEMA_URL = "https://example.com/schema.json"
+
+SCHEMA = {
+    "enum": ["usd", "eur"],
+    "properties": {"symbol": {"enum": ["BTC", "ETH"]}},
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_loaded_choices():
+    """Start every test with an empty in-process choices memo."""
+    with patch.dict(click_types._loaded_choices, clear=True):
+        yield
+
+
+@pytest.fixture
+def schema_get(mock_http_response):
+    """Patch the shared session to serve SCHEMA with HTTP validators."""
+    response = mock_http_response(SCHEMA, headers={
+        "ETag": '"v1"',
+        "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+    })
+    with patch.object(click_types._SESSION, "get", return_value=response) as mock_get:
+        yield mock_get
+
+
+class TestCacheFile:
+    """Test the binary choices cache file."""
+    
+    def test_round_trip(self, temp_dir):
+        """Test that cached choices and metadata survive a write and read."""
+        cache_file = temp_dir / "schema.pickle"
+        cache_data = {"choices": ["BTC", "ETH"], "timestamp": 1.5, "etag": '"v1"'}
+        
+        _write_cache(cache_file, cache_data)
+        
+        assert _read_cache(cache_file) == cache_data
+    
+    def test_missing_or_unreadable(self, temp_dir):
+        """Test that missing, corrupt and non-dict cache files read as None."""
+        cache_file = temp_dir / "schema.pickle"
+        assert _read_cache(cache_file) is None
+        
+        cache_file.write_bytes(b"not a pickle")
+        assert _read_cache(cache_file) is None
+        
+        cache_file.write_bytes(pickle.dumps(["BTC"]))
+        assert _read_cache(cache_file) is None
+    
+    def test_file_name_is_stable_digest(self, temp_dir, schema_get):
+        """Test that the cache file is named by a digest of URL and schema path."""
+        choice = SchemaValidatedChoice(SCHEMA_URL, cache_dir=temp_dir)
+        
+        digest = hashlib.blake2b(f"{SCHEMA_URL}\0enum".encode("utf-8"), digest_size=8).hexdigest()
+        assert choice._get_cache_file() == temp_dir / f"schema_{digest}.pickle"
+        assert choice._get_cache_file().exists()
+
+
+class TestSchemaValidatedChoice:
+    """Test SchemaValidatedChoice loading and caching."""
+    
+    def test_fetch_and_cache(self, temp_dir, schema_get):
+        """Test that fetched choices and validators are written to the cache."""
+        choice = SchemaValidatedChoice(SCHEMA_URL, cache_dir=temp_dir)
+        
+        assert list(choice.choices) == ["usd", "eur"]
+        cache_data = _read_cache(choice._get_cache_file())
+        assert cache_data["choices"] == ["usd", "eur"]
+        assert cache_data["etag"] == '"v1"'
+        assert cache_data["last_modified"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+    
+    def test_schema_paths_cached_separately(self, temp_dir, schema_get):
+        """Test that one URL read at two schema paths keeps separate choices."""
+        currencies = SchemaValidatedChoice(SCHEMA_URL, cache_dir=temp_dir)
+        symbols = SchemaValidatedChoice(SCHEMA_URL, "properties.symbol.enum", cache_dir=temp_dir)
+        
+        assert list(currencies.choices) == ["usd", "eur"]
+        assert list(symbols.choices) == ["BTC", "ETH"]
+        assert currencies._get_cache_file() != symbols._get_cache_file()
+        
+        # Also when the second one is served from its cache file
+        click_types._loaded_choices.clear()
+        cached = SchemaValidatedChoice(SCHEMA_URL, "properties.symbol.enum", cache_dir=temp_dir)
+        assert list(cached.choices) == ["BTC", "ETH"]
+    
+    def test_cache_file_read_once_per_instance(self, temp_dir, schema_get):
+        """Test that validating and reading the cache share one file read."""
+        SchemaValidatedChoice(SCHEMA_URL, cache_dir=temp_dir)
+        click_types._loaded_choices.clear()
+        
+        with patch.object(click_types, "_read_cache", wraps=_read_cache) as mock_read:
+            choice = SchemaValidatedChoice(SCHEMA_URL, cache_dir=temp_dir)
+            choice.shell_complete(None, None, "u")
+        
+        assert list(choice.choices) == ["usd", "eur"]
+        mock_read.assert_called_once()
+        assert schema_get.call_count == 1
+    
+    def test_choices_memoized_in_process(self, temp_dir, schema_get):
+        """Test that constructing the same parameter again skips cache and network."""
+        first = SchemaValidatedChoice(SCHEMA_URL, cache_dir=temp_dir)
+        
+        with patch.object(click_types, "_read_cache") as mock_read:
+            second = SchemaValidatedChoice(SCHEMA_URL, cache_dir=temp_dir)
+        
+        assert second.choices == first.choices
+        assert schema_get.call_count == 1
+        mock_read.assert_not_called()
+    
+    def test_fallback_not_memoized(self, temp_dir):
+        """Test that fallback choices are retried on the next construction."""
+        with patch.object(click_types._SESSION, "get",
+                          side_effect=requests.ConnectionError("unreachable")):
+            choice = SchemaValidatedChoice(SCHEMA_URL, cache_dir=temp_dir, fallback_choices=["usd"])
+        
+        assert list(choice.choices) == ["usd"]
+        assert click_types._loaded_choices == {}
+    
+    def test_revalidation_not_modified(self, temp_dir, schema_get, mock_http_response):
+        """Test that an expired cache is revalidated with both validators."""
+        choice = SchemaValidatedChoice(SCHEMA_URL, cache_dir=temp_dir)
+        cache_file = choice._get_cache_file()
+        _write_cache(cache_file, dict(_read_cache(cache_file), timestamp=time.time() - 7200))
+        click_types._loaded_choices.clear()
+        
+        schema_get.return_value = mock_http_response(None, 304)
+        revalidated = SchemaValidatedChoice(SCHEMA_URL, cache_dir=temp_dir)
+        
+        assert list(revalidated.choices) == ["usd", "eur"]
+        headers = schema_get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+        
+        # The 304 restarts the TTL of the cached choices
+        cache_data = _read_cache(cache_file)
+        assert time.time() - cache_data["timestamp"] < 60
+        assert cache_data["etag"] == '"v1"'
+
+
+class TestCryptocurrencySymbol:
+    """Test CryptocurrencySymbol."""
+    
+    def test_symbols_fetched_and_cached(self, temp_dir, mock_requests):
+        """Test that symbols are fetched, sorted and served from cache afterwards."""
+        symbols = CryptocurrencySymbol(cache_dir=temp_dir)
+        
+        assert list(symbols.choices) == ["ada", "btc", "dot", "eth", "link"]
+        
+        click_types._loaded_choices.clear()
+        with patch.object(click_types._SESSION, "get") as mock_get:
+            cached = CryptocurrencySymbol(cache_dir=temp_dir)
+        
+        assert cached.choices == symbols.choices
+        mock_get.assert_not_called()
@@ -99,6 +99,28 @@ class TestSecretManager:
         deleted = await manager.delete_secret("non_existent")
         assert deleted is False
     
+    @pytest.mark.asyncio
+    async def test_list_keys(self, temp_dir, sample_secrets):
+        """Test listing secret names from the index and without one."""
+        secrets_file = temp_dir / "secrets.enc"
+        manager = SecretManager(secrets_file)
+        await manager.initialize()
+        
+        assert await manager.list_keys() == []
+        
+        await manager.save_secrets(sample_secrets)
+        assert manager.index_file.exists()
+        
+        with patch.object(manager, 'load_secrets') as mock_load:
+            keys = await manager.list_keys()
+        
+        assert keys == sorted(sample_secrets)
+        mock_load.assert_not_called()
+        
+        # Secrets written without an index are listed by decrypting the file
+        manager.index_file.unlink()
+        assert await manager.list_keys() == sorted(sample_secrets)
+    
     @pytest.mark.asyncio
     async def test_key_rotation_needed(self, temp_dir):
         """Test key rotation detection."""
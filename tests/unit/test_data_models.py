@@ -7,6 +7,8 @@ from decimal import Decimal
 from crypto_portfolio_analyzer.data.models import (
     CryptocurrencyPrice,
     HistoricalPrice,
+    PriceSeries,
+    price_array,
     MarketData,
     CacheEntry,
     APIResponse,
@@ -153,6 +155,56 @@ class TestHistoricalPrice:
         
         # Timezone should be set
         assert price.timestamp.tzinfo is not None
+    
+    def test_historical_price_dict_round_trip(self):
+        """Test that to_dict/from_dict preserve every field exactly."""
+        price = HistoricalPrice(
+            symbol="BTC",
+            timestamp=datetime.now(timezone.utc),
+            price=Decimal("45000.123456789"),
+            volume=Decimal("1000000000"),
+            data_source=DataSource.COINGECKO
+        )
+        
+        data = price.to_dict()
+        
+        assert data["price"] == "45000.123456789"
+        assert data["market_cap"] is None
+        assert HistoricalPrice.from_dict(data) == price
+
+
+class TestPriceSeries:
+    """Test PriceSeries model."""
+    
+    def test_price_series_from_prices(self):
+        """Test building sorted float columns from price points."""
+        base_time = datetime.now(timezone.utc)
+        prices = [
+            HistoricalPrice(symbol="BTC", timestamp=base_time + timedelta(hours=1),
+                            price=Decimal("45100.50")),
+            HistoricalPrice(symbol="BTC", timestamp=base_time,
+                            price=Decimal("45000.00"), volume=Decimal("1000"))
+        ]
+        
+        series = PriceSeries.from_prices(prices)
+        
+        assert len(series) == 2
+        assert series.timestamps == [base_time, base_time + timedelta(hours=1)]
+        assert series.closes.tolist() == [45000.0, 45100.5]
+        assert series.volumes.tolist() == [1000.0, 0.0]
+        assert series.raw == [prices[1], prices[0]]
+    
+    def test_price_array_keeps_order(self):
+        """Test converting prices to an array without sorting them."""
+        base_time = datetime.now(timezone.utc)
+        prices = [
+            HistoricalPrice(symbol="BTC", timestamp=base_time + timedelta(hours=1),
+                            price=Decimal("45100.50")),
+            HistoricalPrice(symbol="BTC", timestamp=base_time, price=Decimal("45000.00"))
+        ]
+        
+        assert price_array(prices).tolist() == [45100.5, 45000.0]
+        assert len(price_array([])) == 0
 
 
 class TestMarketData:
@@ -232,6 +232,24 @@ class TestDatabaseManager:
         )
         assert prices == []
     
+    @pytest.mark.asyncio
+    async def test_get_historical_prices_batch(self, temp_db, sample_historical_prices):
+        """Test retrieving historical prices for several symbols in one query."""
+        db_manager = temp_db
+        
+        await db_manager.save_historical_prices(sample_historical_prices)
+        
+        start_date = sample_historical_prices[0].timestamp
+        end_date = sample_historical_prices[-1].timestamp
+        
+        prices_map = await db_manager.get_historical_prices_batch(
+            ["eth", "NONEXISTENT"], start_date, end_date, "usd"
+        )
+        
+        assert list(prices_map) == ["ETH", "NONEXISTENT"]
+        assert prices_map["NONEXISTENT"] == []
+        assert [p.price for p in prices_map["ETH"]] == [p.price for p in sample_historical_prices]
+    
     @pytest.mark.asyncio
     async def test_cleanup_old_data(self, temp_db, sample_current_price, sample_historical_prices):
         """Test cleaning up old data."""
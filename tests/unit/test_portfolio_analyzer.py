@@ -133,6 +133,22 @@ class TestPortfolioAnalyzer:
                                   Decimal("1000") * Decimal("1.2"))
             assert snapshot.total_cost == expected_total_cost
     
+    @pytest.mark.asyncio
+    async def test_create_portfolio_snapshot_cash_balance(self, sample_holdings_data, mock_price_data):
+        """Test that an explicit cash balance takes precedence over holding data."""
+        mock_data_service = AsyncMock()
+        mock_data_service.get_multiple_prices.return_value = mock_price_data
+
+        with patch('crypto_portfolio_analyzer.data.service.get_data_service') as mock_get_service:
+            mock_get_service.return_value = mock_data_service
+
+            analyzer = PortfolioAnalyzer(mock_data_service)
+
+            snapshot = await analyzer.create_portfolio_snapshot(sample_holdings_data, 2500)
+
+            assert snapshot.cash_balance == Decimal("2500")
+            assert snapshot.portfolio_value == snapshot.total_value + Decimal("2500")
+    
     @pytest.mark.asyncio
     async def test_create_portfolio_snapshot_empty_holdings(self):
         """Test creating portfolio snapshot with empty holdings."""
@@ -0,0 +1,99 @@
+"""
+Unit tests for the JSON serialization helpers.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from crypto_portfolio_analyzer.core import serialization
+from crypto_portfolio_analyzer.core.serialization import dumps_json, dumps_json_bytes, loads_json
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request):
+    """Run each test against both the orjson and stdlib code paths."""
+    if request.param and not serialization.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    with patch.object(serialization, "ORJSON_AVAILABLE", request.param):
+        yield request.param
+
+
+class TestSerialization:
+    """Test dumps_json/loads_json."""
+
+    def test_round_trip(self, backend):
+        """Test that plain data survives a round trip."""
+        data = {"symbol": "BTC", "amount": 0.5, "tags": ["a", "b"], "meta": None}
+
+        assert loads_json(dumps_json(data)) == data
+
+    def test_indent(self, backend):
+        """Test pretty-printed and compact output."""
+        data = {"a": 1}
+
+        assert dumps_json(data) == '{\n  "a": 1\n}'
+        assert json.loads(dumps_json(data, indent=False)) == data
+        assert "\n" not in dumps_json(data, indent=False)
+
+    def test_default_fallback(self, backend):
+        """Test that unsupported types go through the default callable."""
+        result = loads_json(dumps_json({"price": Decimal("1.50")}))
+
+        assert result == {"price": "1.50"}
+
+    def test_datetime(self, backend):
+        """Test that datetimes serialize to a string."""
+        ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        result = loads_json(dumps_json({"ts": ts}))
+
+        assert result["ts"].startswith("2024-01-01")
+
+    def test_dataclass(self, backend):
+        """Test that dataclass instances serialize as objects."""
+        @dataclass
+        class Point:
+            symbol: str
+            price: Decimal
+
+        result = loads_json(dumps_json([Point("BTC", Decimal("2.5"))]))
+
+        assert result == [{"symbol": "BTC", "price": "2.5"}]
+
+    def test_enum_and_numpy(self, backend):
+        """Test that enums and numpy values serialize the same on both backends."""
+        class Side(Enum):
+            BUY = "buy"
+
+        data = {
+            "side": Side.BUY,
+            "price": np.float64(1.5),
+            "count": np.int64(3),
+            "flag": np.bool_(True),
+            "closes": np.array([1.0, 2.5]),
+        }
+
+        assert loads_json(dumps_json(data)) == {
+            "side": "buy", "price": 1.5, "count": 3, "flag": True, "closes": [1.0, 2.5],
+        }
+
+    def test_dumps_bytes(self, backend):
+        """Test UTF-8 encoded output with non-ASCII text left unescaped."""
+        data = {"name": "Ethereum Ξ", "price": Decimal("2.5")}
+
+        result = dumps_json_bytes(data)
+
+        assert isinstance(result, bytes)
+        assert "Ξ".encode("utf-8") in result
+        assert loads_json(result) == {"name": "Ethereum Ξ", "price": "2.5"}
+
+    def test_loads_bytes(self, backend):
+        """Test parsing from bytes."""
+        assert loads_json(b'{"a": [1, 2]}') == {"a": [1, 2]}
@@ -8,7 +8,7 @@ from datetime import datetime, timezone
 
 from crypto_portfolio_analyzer.streaming.events import (
     StreamEvent, EventType, EventHandler, EventFilter, EventSubscription,
-    StreamEventBus, WebSocketEventHandler, DatabaseEventHandler
+    StreamEventBus, WebSocketEventHandler, DatabaseEventHandler, PriceUpdateBatcher
 )
 
 
@@ -503,6 +503,63 @@ class TestStreamEventBus:
         assert recent[0]["event_type"] == "price_update"
 
 
+@pytest.mark.asyncio
+class TestPriceUpdateBatcher:
+    """Test PriceUpdateBatcher class."""
+    
+    @staticmethod
+    def make_update(symbol, price):
+        update = Mock()
+        update.symbol = symbol
+        update.to_dict.return_value = {"price": price}
+        return update
+    
+    async def test_publish_price_updates(self):
+        """Test publishing a batch of price updates."""
+        event_bus = StreamEventBus(max_queue_size=100)
+        await event_bus.start()
+        
+        published = await event_bus.publish_price_updates(
+            [("BTC", {"price": 50000}), ("ETH", {"price": 3000})], source="test_feed"
+        )
+        
+        assert published == 2
+        assert event_bus._stats["events_published"] == 2
+        
+        await event_bus.stop()
+    
+    async def test_updates_published_in_one_batch(self):
+        """Test that updates within the batch window share one drain task."""
+        event_bus = Mock()
+        event_bus.publish_price_updates = AsyncMock(return_value=3)
+        batcher = PriceUpdateBatcher(event_bus, source="test_feed", interval=0.01)
+        
+        for symbol, price in (("BTC", 1), ("ETH", 2), ("BTC", 3)):
+            batcher(self.make_update(symbol, price))
+        
+        await asyncio.sleep(0.05)
+        
+        event_bus.publish_price_updates.assert_awaited_once()
+        updates = list(event_bus.publish_price_updates.call_args.args[0])
+        assert updates == [("BTC", {"price": 1}), ("ETH", {"price": 2}), ("BTC", {"price": 3})]
+        assert event_bus.publish_price_updates.call_args.kwargs["source"] == "test_feed"
+        
+        # A later update starts a new batch
+        batcher(self.make_update("ADA", 4))
+        await asyncio.sleep(0.05)
+        
+        assert event_bus.publish_price_updates.await_count == 2
+    
+    async def test_flush_empty(self):
+        """Test flushing with nothing buffered."""
+        event_bus = Mock()
+        event_bus.publish_price_updates = AsyncMock()
+        batcher = PriceUpdateBatcher(event_bus, source="test_feed")
+        
+        assert await batcher.flush() == 0
+        event_bus.publish_price_updates.assert_not_called()
+
+
 @pytest.mark.asyncio
 class TestWebSocketEventHandler:
     """Test WebSocketEventHandler class."""
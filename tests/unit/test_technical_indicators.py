@@ -276,7 +276,18 @@ class TestTechnicalIndicators:
         all_indicators = indicators.calculate_all_indicators([])
         
         assert all_indicators == {}
-    
+
+    def test_calculate_subset(self, sample_historical_prices):
+        """Test calculating only selected indicators."""
+        indicators = TechnicalIndicators()
+
+        subset = indicators.calculate_subset(sample_historical_prices, ['SMA_20', 'MACD_Signal'])
+        all_indicators = indicators.calculate_all_indicators(sample_historical_prices)
+
+        assert set(subset) == {'SMA_20', 'MACD_Signal'}
+        for key, values in subset.items():
+            np.testing.assert_array_equal(values, all_indicators[key])
+
     def test_get_indicator_signals(self, sample_historical_prices):
         """Test generating trading signals from indicators."""
         indicators = TechnicalIndicators()
@@ -323,6 +334,19 @@ class TestTechnicalIndicators:
         
         # Should handle NaN values gracefully
         assert isinstance(signals, dict)
+    
+    def test_get_indicator_signals_for_subset(self):
+        """Test that only signals backed by the given indicators are generated."""
+        indicators = TechnicalIndicators()
+        
+        subset = {
+            'RSI': np.array([50.0, 25.0]),
+            'SMA_20': [10.0, 12.0],
+        }
+        
+        signals = indicators.get_indicator_signals_for(subset)
+        
+        assert signals == {'RSI': 'OVERSOLD'}
 
 
 class TestTechnicalIndicatorsEdgeCases:
@@ -5,6 +5,7 @@ import asyncio
 import json
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timezone
+from fastapi.middleware.gzip import GZipMiddleware
 
 from crypto_portfolio_analyzer.visualization.dashboard import (
     DashboardConfig, ConnectionManager, WebDashboard, DashboardManager
@@ -229,6 +230,32 @@ class TestWebDashboard:
         assert "connections" in data
         assert "config" in data
     
+    def test_chart_response_etag(self, web_dashboard):
+        """Test chart responses carry cache headers and honour If-None-Match."""
+        payload = {"chart": "allocation"}
+
+        response = web_dashboard._chart_response(Mock(headers={}), payload)
+
+        assert response.status_code == 200
+        assert json.loads(response.body) == payload
+        assert response.headers["cache-control"] == "max-age=5, stale-while-revalidate=30"
+        etag = response.headers["etag"]
+
+        cached = web_dashboard._chart_response(Mock(headers={"if-none-match": etag}), payload)
+        assert cached.status_code == 304
+        assert cached.body == b""
+
+        changed = web_dashboard._chart_response(Mock(headers={"if-none-match": etag}), {"chart": "other"})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    def test_gzip_middleware(self, web_dashboard):
+        """Test responses are compressed above the configured size."""
+        middleware = [m for m in web_dashboard.app.user_middleware if m.cls is GZipMiddleware]
+
+        assert len(middleware) == 1
+        assert middleware[0].kwargs["minimum_size"] == web_dashboard.config.compression_minimum_size
+
     def test_is_running(self, web_dashboard):
         """Test is_running method."""
         assert web_dashboard.is_running() is False